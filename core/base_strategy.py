@@ -9,8 +9,12 @@ import numpy as np
 import pandas as pd
 from pandas.errors import IndexingError
 
+from exceptions import InvalidConfigParamException
 from utils.logging import Logger
 
+# Storage for string outputs, selected by the ``string_storage`` param
+STRING_STORAGES = ("python", "pyarrow")
+
 
 class BaseStrategy(ABC):
     """
@@ -18,6 +22,10 @@ class BaseStrategy(ABC):
     All strategies must implement the stateful generation pattern.
     """
 
+    # Rows are drawn independently of each other, so one chunk of values can
+    # be split into several columns (see `generate_batch`)
+    _independent_rows = False
+
     def __init__(self, mode: str, logger=None, **kwargs):
         """Initialize the strategy with configuration parameters"""
         self.df = kwargs.get("df")
@@ -89,6 +97,72 @@ class BaseStrategy(ABC):
         result = self.generate_chunk(count)
         return result
 
+    def generate_batch(self, counts: list[int]) -> list[pd.Series]:
+        """
+        Generate several series in one call.
+
+        State is reset once in non-streaming mode, as in generate_data(), and
+        the series continue one random sequence. Strategies with
+        ``_independent_rows`` draw a single chunk of ``sum(counts)`` values and
+        split it; the others generate one chunk per count.
+
+        Args:
+            counts: Number of values for each series
+
+        Returns:
+            list[pd.Series]: One series per entry in ``counts``
+        """
+        self.logger.debug(f"Generating batch of {len(counts)} series")
+
+        if not counts:
+            return []
+
+        if not self.is_streaming_and_batch():
+            self.reset_state()
+
+        if not self._independent_rows:
+            return [self.generate_chunk(count) for count in counts]
+
+        # Slice the Series rather than its values so extension dtypes such as
+        # Arrow-backed strings carry over to every part
+        chunk = self.generate_chunk(sum(counts))
+        bounds = np.cumsum([0, *counts])
+        return [
+            chunk.iloc[start:stop].reset_index(drop=True)
+            for start, stop in zip(bounds[:-1], bounds[1:], strict=True)
+        ]
+
+    def _string_series(self, values: Any, index: pd.Index | None = None) -> pd.Series:
+        """
+        Wrap generated strings in a Series using the configured storage.
+
+        With ``string_storage: pyarrow`` the strings are packed into an Arrow
+        buffer (``string[pyarrow]``); otherwise, or if pyarrow is missing,
+        they stay Python objects.
+
+        Args:
+            values: Object array of strings, or one string to repeat over ``index``
+            index: Index for the Series
+
+        Returns:
+            pd.Series: String series
+
+        Raises:
+            InvalidConfigParamException: If ``string_storage`` is not supported
+        """
+        storage = self.params.get("string_storage") or "python"
+        if storage not in STRING_STORAGES:
+            raise InvalidConfigParamException(
+                f"string_storage must be one of {', '.join(STRING_STORAGES)}, "
+                f"got {storage!r}"
+            )
+        if storage == "pyarrow":
+            try:
+                return pd.Series(values, index=index, dtype="string[pyarrow]")
+            except ImportError:
+                self.logger.warning("pyarrow is not installed; using object strings")
+        return pd.Series(values, index=index, dtype=object, copy=False)
+
     @abstractmethod
     def generate_chunk(self, count: int) -> pd.Series:
         """
@@ -238,9 +312,9 @@ class BaseStrategy(ABC):
                     self.sync_state(values)
 
                     # Ensure column has compatible dtype before assignment
-                    if (
-                        df_copy[column_name].dtype == "float64"
-                        and values.dtype == "object"
+                    if df_copy[column_name].dtype == "float64" and values.dtype in (
+                        "object",
+                        "string",
                     ):
                         df_copy[column_name] = df_copy[column_name].astype("object")
 
@@ -264,7 +338,10 @@ class BaseStrategy(ABC):
                 self.sync_state(values)
 
                 # Ensure column has compatible dtype before assignment
-                if df_copy[column_name].dtype == "float64" and values.dtype == "object":
+                if df_copy[column_name].dtype == "float64" and values.dtype in (
+                    "object",
+                    "string",
+                ):
                     df_copy[column_name] = df_copy[column_name].astype("object")
 
                 df_copy[column_name] = values.values
@@ -282,7 +359,10 @@ class BaseStrategy(ABC):
             self.sync_state(values)
 
             # Ensure column has compatible dtype before assignment
-            if df_copy[column_name].dtype == "float64" and values.dtype == "object":
+            if df_copy[column_name].dtype == "float64" and values.dtype in (
+                "object",
+                "string",
+            ):
                 df_copy[column_name] = df_copy[column_name].astype("object")
 
             df_copy[column_name] = values.values
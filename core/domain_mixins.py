@@ -9,7 +9,7 @@ import re
 from datetime import datetime
 from typing import Any
 
-from exceptions.param_exceptions import InvalidConfigParamException
+from exceptions import InvalidConfigParamException
 
 
 class NumericMixin:
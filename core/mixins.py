@@ -47,7 +47,10 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
-from exceptions.param_exceptions import InvalidConfigParamException
+from exceptions import InvalidConfigParamException
+
+# Bit generators selectable through a strategy's ``bit_generator`` param
+BIT_GENERATORS = ("PCG64", "Philox")
 
 
 class SeedMixin:
@@ -100,6 +103,44 @@ class SeedMixin:
             random.seed(self._seed)
             np.random.seed(self._seed)
 
+    def _create_rng(self) -> np.random.Generator:
+        """
+        Create a random generator owned by this strategy.
+
+        Strategies drawing from their own generator do not need
+        `_initialize_random_seed`, which reseeds the process-wide ``random``
+        and ``np.random`` state.
+
+        Called again on every state reset, so the generator is built once and
+        then reused: a seeded one is rewound to its initial state, an unseeded
+        one simply continues. Only a changed seed or bit generator builds a
+        new one.
+
+        Returns:
+            np.random.Generator: Generator seeded with the strategy seed, built on
+            the ``bit_generator`` param (one of `BIT_GENERATORS`, default PCG64)
+
+        Raises:
+            InvalidConfigParamException: If ``bit_generator`` is not supported
+        """
+        name = self.params.get("bit_generator") or "PCG64"
+        if name not in BIT_GENERATORS:
+            raise InvalidConfigParamException(
+                f"bit_generator must be one of {', '.join(BIT_GENERATORS)}, got {name!r}"
+            )
+
+        key = (name, self._seed)
+        cached = getattr(self, "_rng_cache", None)
+        if cached is not None and cached[0] == key:
+            _key, rng, initial_state = cached
+            if self._seed is not None:
+                rng.bit_generator.state = initial_state
+            return rng
+
+        rng = np.random.Generator(getattr(np.random, name)(self._seed))
+        self._rng_cache = (key, rng, rng.bit_generator.state)
+        return rng
+
     def _get_seed_for_state(self) -> int | None:
         """Get current seed value for state information."""
         return self._seed
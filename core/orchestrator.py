@@ -19,9 +19,9 @@ For streaming results, includes:
 
 import configs.GENERATOR_SETTINGS as SETTINGS
 from core.processors import NormalConfigProcessor, StreamingConfigProcessor
-from core.writers import BaseWriter, BatchWriter, StreamWriter
-from core.writers.file_writer_factory import FileWriterFactory
-from exceptions.invalid_running_mode_exception import InvalidRunningModeException
+from core.writers import BaseWriter, BatchWriter
+from core.writers.file_writer_factory import create_writer
+from exceptions import InvalidRunningModeException
 from utils.config_utils import load_config
 from utils.logging import Logger
 
@@ -77,14 +77,16 @@ class DataOrchestrator:
                 self.logger.debug("Creating BatchWriter for batch processing")
                 return BatchWriter(stream_config)
             else:
-                # Create stream writer for streaming scenarios
+                # Create stream writer for streaming scenarios; imported here so
+                # file-only runs never load the messaging code
+                from core.writers.stream_writer import StreamWriter
+
                 self.logger.debug("Creating StreamWriter for streaming processing")
                 return StreamWriter(stream_config)
 
         else:
             # Create specific file writer for normal processing using factory
             self.logger.debug("Creating specific file writer for normal processing")
-            factory = FileWriterFactory()
             file_writer_config = config.get("file_writer", {})
             if isinstance(file_writer_config, list) and file_writer_config:
                 # Warn and normalize (should already be handled by validation, but safe here too)
@@ -96,7 +98,7 @@ class DataOrchestrator:
             writer_type = file_writer_config.get("type", "csv")
             writer_params = file_writer_config.get("params", {})
 
-            return factory.create_writer(writer_type, writer_params)
+            return create_writer(writer_type, writer_params)
 
     def run(self):
         """
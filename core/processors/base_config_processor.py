@@ -19,7 +19,7 @@ import pandas as pd
 import configs.GENERATOR_SETTINGS as SETTINGS
 from core.strategy_factory import StrategyFactory
 from core.writers.base_writer import BaseWriter
-from exceptions.param_exceptions import InvalidConfigParamException
+from exceptions import InvalidConfigParamException
 from utils.generator_utils import validate_generator_config
 from utils.intermediate_column import filter_intermediate_columns
 from utils.logging import Logger
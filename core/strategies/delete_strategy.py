@@ -5,6 +5,7 @@ This strategy has been refactored to use the new mixin pattern, reducing
 boilerplate code by ~25 lines while maintaining the same functionality.
 """
 
+import numpy as np
 import pandas as pd
 
 from core.base_strategy import BaseStrategy
@@ -19,8 +20,15 @@ class DeleteStrategy(BaseStrategy, StatefulMixin, ValidationMixin):
     Uses mixins for:
     - StatefulMixin: Standardized state management and reporting
     - ValidationMixin: Common parameter validation patterns
+
+    Generated values are read-only views into a shared all-NaN buffer, so
+    deleting a column allocates nothing per call. Assigning the values into
+    a DataFrame copies them; writing to the returned Series in place raises.
     """
 
+    # Shared read-only NaN buffer, grown on demand (see `_nan_view`)
+    _NAN_POOL = np.full(0, np.nan)
+
     def __init__(self, mode: str, logger=None, **kwargs):
         """Initialize the strategy with configuration parameters"""
         super().__init__(mode=mode, logger=logger, **kwargs)
@@ -37,21 +45,40 @@ class DeleteStrategy(BaseStrategy, StatefulMixin, ValidationMixin):
 
         self.logger.debug(f"DeleteStrategy initialized with mask='{self._mask}'")
 
+    @classmethod
+    def _nan_view(cls, count: int) -> np.ndarray:
+        """
+        Return a read-only view of ``count`` NaNs from the shared buffer.
+
+        Args:
+            count: Number of values needed
+
+        Returns:
+            np.ndarray: float64 view of length ``count``
+        """
+        pool = cls._NAN_POOL
+        if len(pool) < count:
+            # Grow to the next power of two so repeated calls rarely reallocate
+            pool = np.full(1 << (count - 1).bit_length(), np.nan)
+            pool.setflags(write=False)
+            cls._NAN_POOL = pool
+        return pool[:count]
+
     def generate_chunk(self, count: int) -> pd.Series:
         """
-        Generate a chunk of None values maintaining internal state.
+        Generate a chunk of missing values maintaining internal state.
         For delete strategy, this is stateless but implements the interface.
 
         Args:
             count: Number of values to generate
 
         Returns:
-            pd.Series: Series of None values
+            pd.Series: Read-only series of NaN values
         """
-        self.logger.debug(f"Generating chunk of {count} None values for deletion")
+        self.logger.debug(f"Generating chunk of {count} missing values for deletion")
 
-        # Return None values for the masked rows
-        return pd.Series([None] * count, dtype=object)
+        # Return missing values for the masked rows
+        return pd.Series(self._nan_view(count), copy=False)
 
     def reset_state(self):
         """Reset the internal state to initial values"""
@@ -69,24 +96,39 @@ class DeleteStrategy(BaseStrategy, StatefulMixin, ValidationMixin):
 
     def generate_data(self, count: int) -> pd.Series:
         """
-        Generate None values by calling generate_chunk.
-        This ensures consistent behavior between batch and non-batch modes.
+        Generate missing values by calling generate_chunk.
+        Deletion keeps no state, so there is nothing to reset first.
 
         Args:
             count: Number of values to generate
 
         Returns:
-            pd.Series: Series of None values
+            pd.Series: Read-only series of NaN values
         """
-        self.logger.debug(
-            f"Generating {count} values using unified chunk-based approach"
-        )
+        return self.generate_chunk(count)
 
-        # For non-batch mode, reset state to ensure consistent behavior
-        self.reset_state()
-        # Generate the chunk
-        result = self.generate_chunk(count)
+    def apply_to_dataframe(
+        self, df: pd.DataFrame, column_name: str, mask: str | None = None
+    ) -> pd.DataFrame:
+        """
+        Null out the masked rows of ``column_name``.
 
-        self.logger.debug(f"Generated {len(result)} None values for deletion")
+        A column that does not exist yet ends up entirely missing whichever
+        rows the mask selects, so the mask is not evaluated in that case.
 
-        return result
+        Args:
+            df: Target dataframe
+            column_name: Column to clear
+            mask: Optional pandas query string for filtering rows
+
+        Returns:
+            Updated dataframe
+        """
+        if column_name not in df.columns:
+            self.logger.debug(
+                f"Column '{column_name}' not present; adding it as missing values"
+            )
+            df[column_name] = np.nan
+            return df
+
+        return super().apply_to_dataframe(df, column_name, mask)
@@ -38,7 +38,6 @@ class DistributedChoiceStrategy(
 
         # Use mixins for common functionality
         self._validate_seed()  # From SeedMixin
-        self._initialize_random_seed()  # From SeedMixin
         self._initialize_state()  # From StatefulMixin
         self._validate_params()  # From ValidationMixin
 
@@ -46,60 +45,59 @@ class DistributedChoiceStrategy(
         """Initialize internal state for stateful generation"""
         super()._initialize_state()  # Call StatefulMixin's _initialize_state first
 
-        # Seed initialization is handled by SeedMixin
+        # Strategy-owned generator (seed handled by SeedMixin)
+        self._rng = self._create_rng()
+        self._choices_source = None
+
         self.logger.debug(
             f"DistributedChoiceStrategy initialized with seed={self._seed}"
         )
 
+    def _choice_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return the choices, their probabilities and their cumulative weights.
+
+        Rebuilt only when ``params["choices"]`` is replaced (pooled strategies
+        get fresh params between chunks).
+        """
+        choices_dict = self.params["choices"]
+        if choices_dict is not self._choices_source:
+            weights = np.fromiter(choices_dict.values(), dtype=np.float64)
+            self._choices = np.array(list(choices_dict), dtype=object)
+            self._probabilities = weights / weights.sum()
+            self._cdf = np.cumsum(self._probabilities)
+            # Guard against rounding so every uniform draw lands on a choice
+            self._cdf[-1] = 1.0
+            self._choices_source = choices_dict
+        return self._choices, self._probabilities, self._cdf
+
     def generate_chunk(self, count: int) -> pd.Series:
         """
         Generate a chunk of data maintaining internal state.
         This method is stateful and maintains consistent random sequence.
+
+        Each choice gets ``floor(proportion * count)`` values, in choice
+        order; the few values left over by rounding are drawn at random
+        by inverse-CDF lookup on the cumulative weights.
+
         Args:
             count: Number of values to generate
         Returns:
             pd.Series: Generated values
         """
         self.logger.debug(f"Generating chunk of {count} values")
-        # Use the original generation logic
-        """
-        Generate random values based on weighted choices.
-
-        Args:
-            count: Number of values to generate
-
-        Returns:
-            Series of chosen values
-        """
-        choices_dict = self.params["choices"]
-
-        # Extract choices and weights
-        choices = list(choices_dict.keys())
-        weights = list(choices_dict.values())
-
-        # Generate random choices based on weights
-        values = []
-
-        # Calculate total weight
-        total_weight = sum(weights)
-
-        # Generate values proportionally based on weights
-        for choice, weight in choices_dict.items():
-            # Calculate how many values this choice should get
-            proportion = weight / total_weight
-            num_values = int(proportion * count)
 
-            # Add the values for this choice
-            for _ in range(num_values):
-                values.append(choice)
+        choices, probabilities, cdf = self._choice_arrays()
+        counts = (probabilities * count).astype(np.int64)
+        values = np.repeat(choices, counts)
 
         # Handle any remaining values due to rounding
-        while len(values) < count:
-            # Add random choice based on weights
-            choice = np.random.choice(choices, p=[w / total_weight for w in weights])
-            values.append(choice)
+        remaining = count - len(values)
+        if remaining > 0:
+            picks = np.searchsorted(cdf, self._rng.random(remaining), side="right")
+            values = np.concatenate([values, choices[picks]])
 
-        return pd.Series(values, dtype=object)
+        return pd.Series(values, dtype=object, copy=False)
 
     def reset_state(self):
         """Reset the internal state to initial values"""
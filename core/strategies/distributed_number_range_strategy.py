@@ -27,13 +27,14 @@ class DistributedNumberRangeStrategy(
     - NumericMixin: Specialized numeric validation and utilities
     """
 
+    _independent_rows = True
+
     def __init__(self, mode: str, logger=None, **kwargs):
         """Initialize the strategy with configuration parameters"""
         super().__init__(mode=mode, logger=logger, **kwargs)
 
         # Use mixins for common functionality
         self._validate_seed()  # From SeedMixin
-        self._initialize_random_seed()  # From SeedMixin
         self._initialize_state()  # From StatefulMixin
         # Validation is handled by config via factory
 
@@ -41,85 +42,59 @@ class DistributedNumberRangeStrategy(
         """Initialize internal state for stateful generation"""
         super()._initialize_state()  # Call StatefulMixin's _initialize_state first
 
-        # Seed initialization is handled by SeedMixin
+        # Strategy-owned generator (seed handled by SeedMixin)
+        self._rng = self._create_rng()
         self.logger.debug(
             f"DistributedNumberRangeStrategy initialized with seed={self._seed}"
         )
 
     def generate_chunk(self, count: int) -> pd.Series:
         """
-
-
         Generate a chunk of data maintaining internal state.
-
-
         This method is stateful and maintains consistent random sequence.
 
-
+        One multinomial draw splits ``count`` across the weighted ranges and
+        one uniform draw fills a preallocated buffer. Each range's slice is
+        scaled to its bounds in place, and an in-place shuffle mixes the
+        ranges together, so no per-range arrays are allocated or concatenated.
 
         Args:
-
-
             count: Number of values to generate
-
-
-
         Returns:
-
-
             pd.Series: Generated values
-
-
         """
-
         self.logger.debug(f"Generating chunk of {count} values")
 
-        # Use the original generation logic
-        """
-        Generate random numbers from multiple weighted ranges.
-
-        Args:
-            count: Number of values to generate
-
-        Returns:
-            Series of random numbers
-        """
         ranges = self.params["ranges"]
+        rng = self._rng
 
         # Calculate the number of values to generate from each range
-        distributions = [r.distribution for r in ranges]
-        total_dist = sum(distributions)
-
-        # Normalize distributions
-        normalized_dist = [d / total_dist for d in distributions]
+        distributions = np.array([r.distribution for r in ranges], dtype=np.float64)
+        range_counts = rng.multinomial(count, distributions / distributions.sum())
 
-        # Calculate counts for each range
-        range_counts = np.random.multinomial(count, normalized_dist)
-
-        # Generate values for each range
-        all_values = []
-        for i, range_item in enumerate(ranges):
-            range_count = range_counts[i]
+        # Uniform [0, 1) draws, rescaled range by range below
+        values = rng.random(count)
+        offset = 0
+        for range_item, range_count in zip(ranges, range_counts, strict=True):
             if range_count == 0:
                 continue
 
             lb = range_item.start
             ub = range_item.end
+            segment = values[offset : offset + range_count]
+            offset += range_count
 
             # Handle integer vs float generation
             if isinstance(lb, int) and isinstance(ub, int):
-                # Generate integers
-                values = np.random.randint(lb, ub + 1, size=range_count).tolist()
+                segment *= ub - lb + 1
+                np.floor(segment, out=segment)
             else:
-                # Generate floats
-                values = np.random.uniform(lb, ub, size=range_count).tolist()
-
-            all_values.extend(values)
+                segment *= ub - lb
+            segment += lb
 
         # Shuffle the values to mix ranges
-        np.random.shuffle(all_values)
-
-        return pd.Series(all_values, dtype=float)
+        rng.shuffle(values)
+        return pd.Series(values, copy=False)
 
     def reset_state(self):
         """Reset the internal state to initial values"""
@@ -7,7 +7,6 @@ boilerplate code by ~40 lines while maintaining the same functionality.
 
 from datetime import datetime, time
 
-import numpy as np
 import pandas as pd
 
 from core.base_strategy import BaseStrategy
@@ -49,16 +48,16 @@ class DistributedTimeRangeStrategy(
 
         # Handle overnight ranges (e.g., 22:00:00 to 06:00:00)
         if end_seconds <= start_seconds:
-            # This is an overnight range; randomly choose segment using numpy RNG
-            if np.random.rand() < 0.5:
+            # This is an overnight range; randomly choose segment using the strategy RNG
+            if self._rng.random() < 0.5:
                 # Before midnight: start_seconds to 24*3600 - 1
-                random_seconds = int(np.random.randint(start_seconds, 24 * 3600))
+                random_seconds = int(self._rng.integers(start_seconds, 24 * 3600))
             else:
                 # After midnight: 0 to end_seconds
-                random_seconds = int(np.random.randint(0, end_seconds + 1))
+                random_seconds = int(self._rng.integers(0, end_seconds + 1))
         else:
             # Normal range within the same day (inclusive of end)
-            random_seconds = int(np.random.randint(start_seconds, end_seconds + 1))
+            random_seconds = int(self._rng.integers(start_seconds, end_seconds + 1))
 
         return self._seconds_to_time_str(random_seconds, range_item.format)
 
@@ -68,7 +67,6 @@ class DistributedTimeRangeStrategy(
 
         # Use mixins for common functionality
         self._validate_seed()  # From SeedMixin
-        self._initialize_random_seed()  # From SeedMixin
         self._initialize_state()  # From StatefulMixin
         # Validation is handled by config via factory
 
@@ -76,7 +74,8 @@ class DistributedTimeRangeStrategy(
         """Initialize internal state for stateful generation"""
         super()._initialize_state()  # Call StatefulMixin's _initialize_state first
 
-        # Seed initialization is handled by SeedMixin
+        # Strategy-owned generator (seed handled by SeedMixin)
+        self._rng = self._create_rng()
         self.logger.debug(
             f"DistributedTimeRangeStrategy initialized with seed={self._seed}"
         )
@@ -116,7 +115,7 @@ class DistributedTimeRangeStrategy(
         normalized_dist = [d / total_dist for d in distributions]
 
         # Calculate counts for each range
-        range_counts = np.random.multinomial(count, normalized_dist)
+        range_counts = self._rng.multinomial(count, normalized_dist)
 
         # Generate values for each range
         all_values = []
@@ -131,7 +130,7 @@ class DistributedTimeRangeStrategy(
                 all_values.append(time_value)
 
         # Return as strings per tests expectations, preserving deterministic order
-        return pd.Series(all_values)
+        return pd.Series(all_values, dtype=object)
 
     def reset_state(self):
         """Reset the internal state to initial values"""
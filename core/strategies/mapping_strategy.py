@@ -105,7 +105,7 @@ class MappingStrategy(BaseStrategy, StatefulMixin, ValidationMixin):
             self.logger.warning(
                 "MappingStrategy: df or source column missing; returning NaNs"
             )
-            return pd.Series([None] * count, dtype=object)
+            return pd.Series(None, index=pd.RangeIndex(count), dtype=object)
 
         src = self.df[self._map_from].head(count).rename(None)
         mapped = src.map(self._mapping_dict, na_action="ignore")
@@ -94,7 +94,7 @@ class PatternStrategy(BaseStrategy, SeedMixin, StatefulMixin, ValidationMixin):
         else:
             result = [rstr.xeger(self._pattern) for _ in range(count)]
 
-        return pd.Series(result, dtype=str)
+        return pd.Series(result, dtype=object)
 
     def reset_state(self):
         """Reset the internal state to initial values"""
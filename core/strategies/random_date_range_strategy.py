@@ -10,7 +10,7 @@ import pandas as pd
 
 from core.base_strategy import BaseStrategy
 from core.mixins import SeedMixin, StatefulMixin, ValidationMixin
-from utils.date_generator import generate_random_date
+from utils.date_generator import format_day_offsets
 
 
 class RandomDateRangeStrategy(BaseStrategy, SeedMixin, StatefulMixin, ValidationMixin):
@@ -23,13 +23,14 @@ class RandomDateRangeStrategy(BaseStrategy, SeedMixin, StatefulMixin, Validation
     - ValidationMixin: Common parameter validation patterns
     """
 
+    _independent_rows = True
+
     def __init__(self, mode: str, logger=None, **kwargs):
         """Initialize the strategy with configuration parameters"""
         super().__init__(mode=mode, logger=logger, **kwargs)
 
         # Use mixins for common functionality
         self._validate_seed()  # From SeedMixin
-        self._initialize_random_seed()  # From SeedMixin
         self._initialize_state()  # From StatefulMixin
         # Validation is handled by config via factory
 
@@ -37,9 +38,23 @@ class RandomDateRangeStrategy(BaseStrategy, SeedMixin, StatefulMixin, Validation
         """Initialize internal state for stateful generation"""
         super()._initialize_state()  # Call StatefulMixin's _initialize_state first
 
-        # Seed initialization is handled by SeedMixin._initialize_random_seed()
+        # Strategy-owned generator (seed handled by SeedMixin)
+        self._rng = self._create_rng()
+
+        # Parse the range once rather than on every chunk
+        self._start_date = self._parse_date(self.params["start_date"])
+        self._end_date = self._parse_date(self.params["end_date"])
+        self._total_days = (self._end_date - self._start_date).days
+        self._output_format = self.params.get("output_format", "%Y-%m-%d")
+
         self.logger.debug(f"RandomDateRangeStrategy initialized with seed={self._seed}")
 
+    def _parse_date(self, value) -> datetime:
+        """Parse a configured date string with the input ``format``."""
+        if isinstance(value, str):
+            return datetime.strptime(value, self.params["format"])
+        return value
+
     def generate_chunk(self, count: int) -> pd.Series:
         """
         Generate a chunk of data maintaining internal state.
@@ -51,31 +66,12 @@ class RandomDateRangeStrategy(BaseStrategy, SeedMixin, StatefulMixin, Validation
         """
 
         self.logger.debug(f"Generating chunk of {count} values")
-        # Get date generation parameters
-        if isinstance(self.params["start_date"], str):
-            start_date = datetime.strptime(
-                self.params["start_date"], self.params["format"]
-            )
-        else:
-            start_date = self.params["start_date"]
-        if isinstance(self.params["end_date"], str):
-            end_date = datetime.strptime(self.params["end_date"], self.params["format"])
-        else:
-            end_date = self.params["end_date"]
-
-        params = {
-            "start_date": start_date,
-            "end_date": end_date,
-        }
-
-        if "output_format" in self.params:
-            params["output_format"] = self.params["output_format"]
-        else:
-            params["output_format"] = "%Y-%m-%d"
-
-        # Generate the dates
-        dates = [generate_random_date(**params) for _ in range(count)]
-        return pd.Series(dates)
+
+        # Draw every day offset at once, then format each distinct day only once
+        offsets = self._rng.integers(0, self._total_days + 1, size=count)
+        return self._string_series(
+            format_day_offsets(self._start_date, offsets, self._output_format)
+        )
 
     def reset_state(self):
         """Reset the internal state to initial values"""
@@ -78,7 +78,7 @@ class RandomNameStrategy(BaseStrategy, SeedMixin, StatefulMixin, ValidationMixin
 
             result.append(formatted_name)
 
-        return pd.Series(result, dtype=str)
+        return pd.Series(result, dtype=object)
 
     def reset_state(self):
         """Reset the internal random state to initial values"""
@@ -4,7 +4,6 @@ Random number range strategy for generating numbers within a range.
 This strategy uses the mixin pattern to reduce boilerplate while maintaining functionality.
 """
 
-import numpy as np
 import pandas as pd
 
 from core.base_strategy import BaseStrategy
@@ -24,13 +23,14 @@ class RandomNumberRangeStrategy(
     - ValidationMixin: Common parameter validation patterns
     """
 
+    _independent_rows = True
+
     def __init__(self, mode: str, logger=None, **kwargs):
         """Initialize the strategy with configuration parameters"""
         super().__init__(mode=mode, logger=logger, **kwargs)
 
         # Use mixins for common functionality
         self._validate_seed()  # From SeedMixin
-        self._initialize_random_seed()  # From SeedMixin
         self._initialize_state()  # From StatefulMixin
         # Validation is handled by config via factory
 
@@ -38,8 +38,8 @@ class RandomNumberRangeStrategy(
         """Initialize internal state for stateful generation"""
         super()._initialize_state()  # Call StatefulMixin's _initialize_state first
 
-        # Initialize random state (seed handled by SeedMixin)
-        self._random_state = np.random.RandomState(self._seed)
+        # Strategy-owned generator (seed handled by SeedMixin)
+        self._rng = self._create_rng()
 
         # Store bounds for efficient access
         self._lower = float(self.params["start"])
@@ -69,13 +69,13 @@ class RandomNumberRangeStrategy(
         )
 
         # Generate random numbers using internal state
-        values = self._random_state.uniform(self._lower, self._upper, count)
+        values = self._rng.uniform(self._lower, self._upper, count)
 
         # Convert to integers if both bounds are integers
         if self._is_integer:
             values = values.astype(int)
 
-        return pd.Series(values, dtype=int if self._is_integer else float)
+        return pd.Series(values, copy=False)
 
 
     def get_current_state(self) -> dict:
@@ -86,7 +86,7 @@ class RandomNumberRangeStrategy(
                 "lower_bound": self._lower,
                 "upper_bound": self._upper,
                 "is_integer": self._is_integer,
-                "random_state_type": type(self._random_state).__name__,
+                "random_state_type": type(self._rng).__name__,
             }
         )
         return state
@@ -6,7 +6,7 @@ import pandas as pd
 
 from core.base_strategy import BaseStrategy
 from core.strategy_config import ReplacementConfig
-from exceptions.param_exceptions import InvalidConfigParamException
+from exceptions import InvalidConfigParamException
 
 
 class ReplacementStrategy(BaseStrategy):
@@ -62,7 +62,7 @@ class ReplacementStrategy(BaseStrategy):
         else:
             # If no existing data, return the to_value repeated
             self.logger.warning("No existing data found, returning to_value repeated")
-            result = pd.Series([self._to_value] * count)
+            result = pd.Series(self._to_value, index=pd.RangeIndex(count))
 
         return result
 
@@ -5,6 +5,8 @@ This strategy has been refactored to use the new mixin pattern, reducing
 boilerplate code by ~30 lines while maintaining the same functionality.
 """
 
+from decimal import Decimal, getcontext
+
 import numpy as np
 import pandas as pd
 
@@ -12,6 +14,12 @@ from core.base_strategy import BaseStrategy
 from core.mixins import SeedMixin, StatefulMixin, ValidationMixin
 from core.strategy_config import SeriesConfig
 
+# Integers below this convert to float64 exactly
+_EXACT_INT_LIMIT = 2**53
+
+# Powers of ten up to 10**22 are exact in float64
+_EXACT_POW10_LIMIT = 22
+
 
 class SeriesStrategy(BaseStrategy, SeedMixin, StatefulMixin, ValidationMixin):
     """
@@ -45,8 +53,6 @@ class SeriesStrategy(BaseStrategy, SeedMixin, StatefulMixin, ValidationMixin):
 
         if isinstance(start_value, float) or isinstance(step_value, float):
             # Use Decimal for floating point precision
-            from decimal import Decimal, getcontext
-
             getcontext().prec = 10  # Increased precision
 
             self._current_value = Decimal(str(start_value))
@@ -63,8 +69,6 @@ class SeriesStrategy(BaseStrategy, SeedMixin, StatefulMixin, ValidationMixin):
             if prev_state and "last_value" in prev_state:
                 last_value = prev_state["last_value"]
                 if self._is_float:
-                    from decimal import Decimal
-
                     self._current_value = Decimal(str(last_value)) + self._step
                 else:
                     self._current_value = int(last_value) + int(self._step)
@@ -97,6 +101,10 @@ class SeriesStrategy(BaseStrategy, SeedMixin, StatefulMixin, ValidationMixin):
         )
 
         if self._is_float:
+            values = self._exact_float_values(count)
+            if values is not None:
+                return pd.Series(values, copy=False)
+
             # Generate float values using Decimal for precision
             values = []
             current = self._current_value
@@ -117,6 +125,44 @@ class SeriesStrategy(BaseStrategy, SeedMixin, StatefulMixin, ValidationMixin):
 
             return pd.Series(values, dtype=int)
 
+    def _exact_float_values(self, count: int) -> np.ndarray | None:
+        """
+        Compute the next ``count`` float values without a Python loop.
+
+        Start and step are decimals with at most ``-exponent`` places, so each
+        value is ``(first + i * stride) / 10**-exponent`` over integers. While
+        those integers stay within the Decimal precision the loop would be
+        exact, and while they and the scale are exact in float64 the division
+        rounds once, exactly like ``float(Decimal)``, so the result matches
+        the Decimal loop.
+
+        Returns:
+            np.ndarray | None: Values, or None when the loop's rounding (or
+            non-finite start/step) must be reproduced
+        """
+        current, step = self._current_value, self._step
+        if not (current.is_finite() and step.is_finite()):
+            return None
+
+        exponent = min(current.as_tuple().exponent, step.as_tuple().exponent, 0)
+        if -exponent > _EXACT_POW10_LIMIT:
+            return None
+        scale = 10**-exponent
+        start_num, start_den = current.as_integer_ratio()
+        step_num, step_den = step.as_integer_ratio()
+        first = start_num * scale // start_den
+        stride = step_num * scale // step_den
+        last = first + stride * count
+        limit = min(_EXACT_INT_LIMIT, 10 ** getcontext().prec)
+        if max(abs(first), abs(last)) >= limit:
+            return None
+
+        self._current_value = Decimal(last).scaleb(exponent)
+        values = np.arange(count, dtype=np.int64)
+        values *= stride
+        values += first
+        return values / scale
+
     def reset_state(self):
         """Reset the internal state to initial values"""
         self.logger.debug("Resetting SeriesStrategy state")
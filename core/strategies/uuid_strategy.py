@@ -15,13 +15,18 @@ Notes on uniqueness:
   any 'unique' flag and does not perform additional uniqueness enforcement.
 """
 
+import os
 import uuid
 
+import numpy as np
 import pandas as pd
 
 from core.base_strategy import BaseStrategy
 from core.mixins import StatefulMixin, ValidationMixin
 
+# Positions of the 32 hex digits within the canonical 8-4-4-4-12 layout
+_HYPHENATED_HEX_COLUMNS = np.r_[0:8, 9:13, 14:18, 19:23, 24:36]
+
 
 class UuidStrategy(BaseStrategy, StatefulMixin, ValidationMixin):
     """
@@ -93,8 +98,49 @@ class UuidStrategy(BaseStrategy, StatefulMixin, ValidationMixin):
             return pd.Series(values, dtype=object)
         else:
             # UUID4 (random)
-            values = [self._format_uuid(uuid.uuid4()) for _ in range(count)]
-            return pd.Series(values, dtype=object)
+            return pd.Series(self._random_uuid_strings(count), dtype=object)
+
+    def _random_uuid_strings(self, count: int) -> np.ndarray | list[str]:
+        """
+        Build ``count`` formatted version 4 UUIDs from one ``os.urandom`` call.
+
+        The version and variant bits are set on the whole byte matrix, and the
+        hex text is produced by a single ``bytes.hex()`` call, so only the
+        ``numbers_only`` format still builds a ``uuid.UUID`` per row.
+
+        Args:
+            count: Number of UUIDs to generate
+
+        Returns:
+            np.ndarray | list[str]: Formatted UUID strings
+        """
+        raw = np.frombuffer(os.urandom(16 * count), dtype=np.uint8).reshape(count, 16)
+        raw = raw.copy()
+        raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40  # version 4
+        raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+        data = raw.tobytes()
+
+        if self._numbers_only:
+            return [
+                self._format_uuid(uuid.UUID(bytes=data[i : i + 16]))
+                for i in range(0, len(data), 16)
+            ]
+
+        hex_text = data.hex()
+        if self._uppercase:
+            hex_text = hex_text.upper()
+        chars = np.frombuffer(hex_text.encode("ascii"), dtype=np.uint8)
+        chars = chars.reshape(count, 32)
+        if self._include_hyphens:
+            hyphenated = np.full((count, 36), ord("-"), dtype=np.uint8)
+            hyphenated[:, _HYPHENATED_HEX_COLUMNS] = chars
+            chars = hyphenated
+
+        width = chars.shape[1]
+        values = chars.view(f"S{width}").ravel().astype(f"U{width}")
+        if self._prefix:
+            values = np.strings.add(self._prefix, values)
+        return values
 
     def reset_state(self) -> None:
         self.logger.debug("Resetting UuidStrategy state")
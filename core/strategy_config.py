@@ -6,13 +6,45 @@ the parameters required for that strategy.
 """
 
 import os
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field, fields
+from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
-from exceptions.param_exceptions import InvalidConfigParamException
+from exceptions import InvalidConfigParamException
 from utils.logging import Logger
 
+# strptime directives accepted in date and time formats
+_STRPTIME_DIRECTIVES = frozenset("aAbBcdfGHIjmMpSuUVwWxXyYzZ")
+
+# Splits a format into "%x" directives (or a dangling "%") and literal runs
+_FORMAT_TOKEN_RE = re.compile(r"%.?|[^%]+", re.DOTALL)
+
+
+@lru_cache(maxsize=256)
+def _check_format_tokens(fmt: str) -> bool:
+    """Tokenize ``fmt`` once and check every directive against the known set."""
+    has_directive = False
+    for token in _FORMAT_TOKEN_RE.findall(fmt):
+        if token[0] != "%" or token == "%%":
+            continue
+        if token[1:] not in _STRPTIME_DIRECTIVES:
+            return False
+        has_directive = True
+    return has_directive
+
+
+def _is_valid_date_format(fmt: Any) -> bool:
+    """
+    Check that ``fmt`` only uses known strptime directives and has at least one.
+
+    Lets validation reject bad formats up front instead of waiting for
+    ``strptime`` to fail on them. Results are cached per format string.
+    """
+    return isinstance(fmt, str) and _check_format_tokens(fmt)
+
 
 @dataclass(kw_only=True)
 class BaseConfig(ABC):
@@ -91,7 +123,7 @@ class RandomNumberRangeConfig(BaseConfig):
             raise InvalidConfigParamException("Bounds must be numeric values")
 
 
-@dataclass
+@dataclass(slots=True)
 class RangeItem:
     """Single range definition with distribution weight"""
 
@@ -171,7 +203,10 @@ class DateRangeConfig(BaseConfig):
 
     def validate(self) -> None:
         """Validate date range parameters"""
-        from datetime import datetime
+        if not _is_valid_date_format(self.format):
+            raise InvalidConfigParamException(
+                f"Invalid date format. Expected {self.format}"
+            )
 
         try:
             start = datetime.strptime(self.start_date, self.format)
@@ -202,7 +237,8 @@ class DateSeriesConfig(BaseConfig):
     output_format: str = "%Y-%m-%d"
 
     def validate(self) -> None:
-        from datetime import datetime
+        if not _is_valid_date_format(self.format):
+            raise InvalidConfigParamException("Invalid date format for start_date")
 
         try:
             start = datetime.strptime(self.start_date, self.format)
@@ -286,7 +322,7 @@ class DistributedChoiceConfig(BaseConfig):
             raise InvalidConfigParamException("Total weight must be 100")
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeRangeItem:
     """Single time range definition with distribution weight"""
 
@@ -294,10 +330,21 @@ class TimeRangeItem:
     end: str = "23:59:59"
     format: str = "%H:%M:%S"
     distribution: int | None = None
+    # Field values that last passed validate(); lets reused items skip strptime
+    _validated: tuple | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def validate(self) -> None:
         """Validate time range item"""
-        from datetime import datetime
+        key = (self.start, self.end, self.format, self.distribution)
+        if key == self._validated:
+            return
+
+        if not _is_valid_date_format(self.format):
+            raise InvalidConfigParamException(
+                f"Invalid time format. Expected {self.format}"
+            )
 
         try:
             start_time = datetime.strptime(self.start, self.format)
@@ -334,8 +381,10 @@ class TimeRangeItem:
                 f"Distribution weight ({self.distribution}) must be between 1 and 100"
             )
 
+        self._validated = key
 
-@dataclass
+
+@dataclass(slots=True)
 class DateRangeItem:
     """Single date range definition with distribution weight"""
 
@@ -344,10 +393,27 @@ class DateRangeItem:
     format: str = "%Y-%m-%d"
     output_format: str | None = None
     distribution: int | None = None
+    # Field values that last passed validate(); lets reused items skip strptime
+    _validated: tuple | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def validate(self) -> None:
         """Validate date range item"""
-        from datetime import datetime
+        key = (
+            self.start_date,
+            self.end_date,
+            self.format,
+            self.output_format,
+            self.distribution,
+        )
+        if key == self._validated:
+            return
+
+        if not _is_valid_date_format(self.format):
+            raise InvalidConfigParamException(
+                f"Invalid date format. Expected {self.format}"
+            )
 
         try:
             start_date = datetime.strptime(self.start_date, self.format)
@@ -386,6 +452,8 @@ class DateRangeItem:
                 f"Distribution weight ({self.distribution}) must be between 1 and 100"
             )
 
+        self._validated = key
+
 
 @dataclass
 class DistributedTimeRangeConfig(BaseConfig):
@@ -504,7 +572,10 @@ class TimeRangeConfig(BaseConfig):
 
     def validate(self) -> None:
         """Validate time range parameters"""
-        from datetime import datetime
+        if not _is_valid_date_format(self.format):
+            raise InvalidConfigParamException(
+                f"Invalid time format. Expected {self.format}"
+            )
 
         try:
             start = datetime.strptime(self.start_time, self.format)
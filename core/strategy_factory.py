@@ -12,7 +12,7 @@ from typing import Any
 import pandas as pd
 
 from core.base_strategy import BaseStrategy
-from core.strategy_mapping import get_config_class, get_strategy_class
+from core.strategy_mapping import get_strategy_entry
 from utils.intermediate_column import mark_as_intermediate
 
 
@@ -46,11 +46,8 @@ class StrategyFactory:
         """
 
         try:
-            # Get the strategy class from our mapping
-            strategy_class = get_strategy_class(strategy_name)
-
-            # Get the config class and create a config instance
-            config_class = get_config_class(strategy_name)
+            # Get the strategy and config classes from our mapping
+            strategy_class, config_class = get_strategy_entry(strategy_name)
 
             # Extract and validate params
             params = kwargs.get("params", {}) or {}
@@ -88,8 +85,8 @@ class StrategyFactory:
         When reusing an instance, update mutable fields: df, rows, params,
         unique flag, and strategy_state reference.
         """
-        if pool_key in self._strategy_pool:
-            strategy = self._strategy_pool[pool_key]
+        strategy = self._strategy_pool.get(pool_key)
+        if strategy is not None:
             # Refresh per-chunk context
             strategy.df = kwargs.get("df", strategy.df)
             strategy.rows = kwargs.get("rows", strategy.rows)
@@ -46,7 +46,7 @@ from core.strategy_config import (
     TimeRangeConfig,
     UuidConfig,
 )
-from exceptions.strategy_exceptions import UnsupportedStrategyException
+from exceptions import UnsupportedStrategyException
 
 # Map strategy names to classes and their config classes
 STRATEGY_MAP: dict[str, tuple[type[BaseStrategy], type[BaseConfig]]] = {
@@ -97,6 +97,29 @@ def get_all_strategy_schemas() -> list[dict[str, Any]]:
     return schemas
 
 
+def get_strategy_entry(
+    strategy_name: str,
+) -> tuple[type[BaseStrategy], type[BaseConfig]]:
+    """
+    Get the strategy class and its config class in one lookup.
+
+    Args:
+        strategy_name: Name of the strategy
+
+    Returns:
+        Tuple of (strategy class, configuration class)
+
+    Raises:
+        UnsupportedStrategyException: If the strategy is not supported
+    """
+    try:
+        return STRATEGY_MAP[strategy_name]
+    except KeyError:
+        raise UnsupportedStrategyException(
+            f"Unsupported strategy: {strategy_name}"
+        ) from None
+
+
 def get_strategy_class(strategy_name: str) -> type[BaseStrategy]:
     """
     Get the strategy class for the given strategy name.
@@ -110,10 +133,7 @@ def get_strategy_class(strategy_name: str) -> type[BaseStrategy]:
     Raises:
         UnsupportedStrategyException: If the strategy is not supported
     """
-    if strategy_name not in STRATEGY_MAP:
-        raise UnsupportedStrategyException(f"Unsupported strategy: {strategy_name}")
-
-    return STRATEGY_MAP[strategy_name][0]
+    return get_strategy_entry(strategy_name)[0]
 
 
 def get_config_class(strategy_name: str) -> type[BaseConfig]:
@@ -129,7 +149,4 @@ def get_config_class(strategy_name: str) -> type[BaseConfig]:
     Raises:
         UnsupportedStrategyException: If the strategy is not supported
     """
-    if strategy_name not in STRATEGY_MAP:
-        raise UnsupportedStrategyException(f"Unsupported strategy: {strategy_name}")
-
-    return STRATEGY_MAP[strategy_name][1]
+    return get_strategy_entry(strategy_name)[1]
@@ -2,21 +2,29 @@
 Writers module for GenXData.
 
 This module provides different writer implementations for outputting generated data.
+
+Only the base classes and the factory are imported with the package; every
+other writer is imported on first attribute access, so a CSV-only run never
+loads the Excel, Parquet or streaming writers.
 """
 
-# File format writers
+import importlib
+from typing import Any
+
 from .base_file_writer import BaseFileWriter
 from .base_writer import BaseWriter
-from .batch_writer import BatchWriter
-from .csv_file_writer import CsvFileWriter
-from .excel_file_writer import ExcelFileWriter
-from .feather_file_writer import FeatherFileWriter
 from .file_writer_factory import FileWriterFactory
-from .html_file_writer import HtmlFileWriter
-from .json_file_writer import JsonFileWriter
-from .parquet_file_writer import ParquetFileWriter
-from .sqlite_file_writer import SqliteFileWriter
-from .stream_writer import StreamWriter
+
+# Lazily exported name -> module path, relative to this package
+_LAZY_EXPORTS: dict[str, str] = {
+    "BatchWriter": ".batch_writer",
+    "StreamWriter": ".stream_writer",
+    # File format writers, from the factory's registry
+    **{
+        class_name: module_path
+        for module_path, class_name in FileWriterFactory._WRITER_REGISTRY.values()
+    },
+}
 
 __all__ = [
     "BaseWriter",
@@ -32,3 +40,17 @@ __all__ = [
     "SqliteFileWriter",
     "FileWriterFactory",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a lazily exported writer class on first access."""
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
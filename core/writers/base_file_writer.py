@@ -6,6 +6,7 @@ Provides a unified interface for all file format writers.
 
 import os
 from abc import abstractmethod
+from collections.abc import Mapping
 from typing import Any
 
 import pandas as pd
@@ -23,6 +24,13 @@ class BaseFileWriter(BaseWriter):
     and a unified interface for writing DataFrames to files.
     """
 
+    logger = Logger.get_logger("basefilewriter")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # One logger per concrete writer class, looked up at definition time
+        cls.logger = Logger.get_logger(cls.__name__.lower())
+
     def __init__(self, config: dict[str, Any]):
         """
         Initialize the file writer with configuration.
@@ -38,7 +46,6 @@ class BaseFileWriter(BaseWriter):
         self.params = (
             config if "output_path" in config else config.get("params", config)
         )
-        self.logger = Logger.get_logger(self.__class__.__name__.lower())
 
         # Validate required parameters
         self.validate_params()
@@ -175,12 +182,12 @@ class BaseFileWriter(BaseWriter):
         pass
 
     @abstractmethod
-    def get_default_params(self) -> dict[str, Any]:
+    def get_default_params(self) -> Mapping[str, Any]:
         """
         Get default parameters for this writer type.
 
         Returns:
-            dict: Default parameters
+            Mapping: Default parameters (may be a shared read-only mapping)
         """
         pass
 
@@ -231,11 +238,15 @@ class BaseFileWriter(BaseWriter):
                 "writer_kind",
                 self.__class__.__name__.replace("Writer", "").lower(),
             ),
-            "exists": os.path.exists(path),
         }
 
-        if info["exists"]:
+        # A single stat answers both "exists" and the size/mtime details
+        try:
             stat = os.stat(path)
+        except OSError:
+            info["exists"] = False
+        else:
+            info["exists"] = True
             info.update({"size_bytes": stat.st_size, "modified_time": stat.st_mtime})
 
         return info
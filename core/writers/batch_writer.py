@@ -23,6 +23,8 @@ class BatchWriter(BaseWriter):
     while adding batch-aware metadata and counters.
     """
 
+    logger = Logger.get_logger("batch_writer")
+
     def __init__(
         self, config: dict[str, Any], writer_implementation: BaseWriter = None
     ):
@@ -34,7 +36,6 @@ class BatchWriter(BaseWriter):
             actual_writer: The actual writer to delegate to (FileWriter, StreamWriter, etc.)
         """
         super().__init__(config)
-        self.logger = Logger.get_logger("batch_writer")
         self.writer_implementation = writer_implementation
         self.batches_written = 0
         self.total_rows_written = 0
@@ -42,16 +43,13 @@ class BatchWriter(BaseWriter):
 
         # If no actual writer provided, default to CSV file writer
         if not self.writer_implementation:
-            from .file_writer_factory import FileWriterFactory
+            from .file_writer_factory import create_writer
 
-            factory = FileWriterFactory()
             file_writer_config = config.get("batch", {}).get("file_writer", {})
             writer_type = file_writer_config.get("type", "csv")
             writer_params = file_writer_config.get("params", {})
 
-            self.writer_implementation = factory.create_writer(
-                writer_type, writer_params
-            )
+            self.writer_implementation = create_writer(writer_type, writer_params)
 
         self.logger.debug(
             f"BatchWriter initialized with {type(self.writer_implementation).__name__}"
@@ -4,6 +4,7 @@ CSV file writer implementation for GenXData.
 Refactored to use GenericFileWriter to reduce duplication.
 """
 
+from types import MappingProxyType
 from typing import Any
 
 from .generic_file_writer import GenericFileWriter
@@ -17,16 +18,20 @@ class CsvFileWriter(GenericFileWriter):
     and parameter validation.
     """
 
+    # Shared, read-only defaults for every instance
+    _DEFAULT_PARAMS = MappingProxyType(
+        {
+            "index": False,  # Don't include DataFrame index by default
+            "encoding": "utf-8",
+        }
+    )
+
     def __init__(self, config: dict[str, Any]):
         # Configure the generic writer for CSV format
-        csv_config = {
-            **config,
-            "writer_kind": "csv",
-            "pandas_method": "to_csv",
-            "extensions": [".csv"],
-            "default_params": {
-                "index": False,  # Don't include DataFrame index by default
-                "encoding": "utf-8",
-            }
-        }
-        super().__init__(csv_config)
+        super().__init__(
+            config,
+            writer_kind="csv",
+            pandas_method="to_csv",
+            extensions=[".csv"],
+            default_params=self._DEFAULT_PARAMS,
+        )
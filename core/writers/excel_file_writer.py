@@ -4,6 +4,7 @@ Excel file writer implementation for GenXData.
 Refactored to use GenericFileWriter to reduce duplication.
 """
 
+from types import MappingProxyType
 from typing import Any
 
 from .generic_file_writer import GenericFileWriter
@@ -17,17 +18,21 @@ class ExcelFileWriter(GenericFileWriter):
     and parameter validation.
     """
 
+    # Shared, read-only defaults for every instance
+    _DEFAULT_PARAMS = MappingProxyType(
+        {
+            "index": False,  # Don't include DataFrame index by default
+            "sheet_name": "Sheet1",  # Default sheet name
+            "engine": "openpyxl",  # Default engine for xlsx files
+        }
+    )
+
     def __init__(self, config: dict[str, Any]):
         # Configure the generic writer for Excel format
-        excel_config = {
-            **config,
-            "writer_kind": "excel",
-            "pandas_method": "to_excel",
-            "extensions": [".xlsx", ".xls"],
-            "default_params": {
-                "index": False,  # Don't include DataFrame index by default
-                "sheet_name": "Sheet1",  # Default sheet name
-                "engine": "openpyxl",  # Default engine for xlsx files
-            }
-        }
-        super().__init__(excel_config)
+        super().__init__(
+            config,
+            writer_kind="excel",
+            pandas_method="to_excel",
+            extensions=[".xlsx", ".xls"],
+            default_params=self._DEFAULT_PARAMS,
+        )
@@ -4,6 +4,7 @@ Feather file writer implementation for GenXData.
 Refactored to use GenericFileWriter to reduce duplication.
 """
 
+from types import MappingProxyType
 from typing import Any
 
 from .generic_file_writer import GenericFileWriter
@@ -17,15 +18,19 @@ class FeatherFileWriter(GenericFileWriter):
     high-performance data interoperability between multiple languages.
     """
 
+    # Shared, read-only defaults for every instance
+    _DEFAULT_PARAMS = MappingProxyType(
+        {
+            "compression": "zstd",  # Default compression algorithm
+        }
+    )
+
     def __init__(self, config: dict[str, Any]):
         # Configure the generic writer for Feather format
-        feather_config = {
-            **config,
-            "writer_kind": "feather",
-            "pandas_method": "to_feather",
-            "extensions": [".feather"],
-            "default_params": {
-                "compression": "zstd"  # Default compression algorithm
-            }
-        }
-        super().__init__(feather_config)
+        super().__init__(
+            config,
+            writer_kind="feather",
+            pandas_method="to_feather",
+            extensions=[".feather"],
+            default_params=self._DEFAULT_PARAMS,
+        )
@@ -8,20 +8,20 @@ Notes:
 - Supported types: csv, json, excel/xlsx/xls, parquet, sqlite/db, html/htm, feather
 - If no parameters are provided, an `output_path` default is injected
   (e.g., "output.csv") so that writers can proceed.
+- `create_writer` / `create_multiple_writers` delegate to a shared factory
+  instance, so callers do not need to construct one.
+- Writer modules are imported lazily on first use, so a CSV-only run never
+  pays for loading the other format writers.
 """
 
+import importlib
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from utils.logging import Logger
 
 from .base_file_writer import BaseFileWriter
-from .csv_file_writer import CsvFileWriter
-from .excel_file_writer import ExcelFileWriter
-from .feather_file_writer import FeatherFileWriter
-from .html_file_writer import HtmlFileWriter
-from .json_file_writer import JsonFileWriter
-from .parquet_file_writer import ParquetFileWriter
-from .sqlite_file_writer import SqliteFileWriter
 
 
 class FileWriterFactory:
@@ -33,34 +33,44 @@ class FileWriterFactory:
     creation.
     """
 
-    # Mapping of writer type strings to writer classes
-    _WRITER_REGISTRY: dict[str, type[BaseFileWriter]] = {
-        "csv": CsvFileWriter,
-        "json": JsonFileWriter,
-        "excel": ExcelFileWriter,
-        "xlsx": ExcelFileWriter,  # Alias for Excel
-        "xls": ExcelFileWriter,  # Alias for Excel
-        "parquet": ParquetFileWriter,
-        "sqlite": SqliteFileWriter,
-        "db": SqliteFileWriter,  # Alias for SQLite
-        "html": HtmlFileWriter,
-        "htm": HtmlFileWriter,  # Alias for HTML
-        "feather": FeatherFileWriter,
+    # Mapping of writer type strings to (module path, class name); modules are
+    # resolved relative to this package unless the path is absolute. Only
+    # register_writer mutates this; readers go through _WRITER_REGISTRY.
+    _REGISTERED_WRITERS: dict[str, tuple[str, str]] = {
+        "csv": (".csv_file_writer", "CsvFileWriter"),
+        "json": (".json_file_writer", "JsonFileWriter"),
+        "excel": (".excel_file_writer", "ExcelFileWriter"),
+        "xlsx": (".excel_file_writer", "ExcelFileWriter"),  # Alias for Excel
+        "xls": (".excel_file_writer", "ExcelFileWriter"),  # Alias for Excel
+        "parquet": (".parquet_file_writer", "ParquetFileWriter"),
+        "sqlite": (".sqlite_file_writer", "SqliteFileWriter"),
+        "db": (".sqlite_file_writer", "SqliteFileWriter"),  # Alias for SQLite
+        "html": (".html_file_writer", "HtmlFileWriter"),
+        "htm": (".html_file_writer", "HtmlFileWriter"),  # Alias for HTML
+        "feather": (".feather_file_writer", "FeatherFileWriter"),
     }
 
-    def __init__(self):
-        """Initialize the factory."""
-        self.logger = Logger.get_logger("file_writer_factory")
+    # Read-only live view of the registry and its precomputed key tuple
+    _WRITER_REGISTRY: Mapping[str, tuple[str, str]] = MappingProxyType(
+        _REGISTERED_WRITERS
+    )
+    _SUPPORTED_TYPES: tuple[str, ...] = tuple(_REGISTERED_WRITERS)
+
+    # Writer classes resolved so far, keyed by normalized type
+    _WRITER_CLASS_CACHE: dict[str, type[BaseFileWriter]] = {}
+
+    # Shared by every factory instance; looked up once at import
+    logger = Logger.get_logger("file_writer_factory")
 
     @classmethod
-    def get_supported_types(cls) -> list[str]:
+    def get_supported_types(cls) -> tuple[str, ...]:
         """
-        Get list of supported writer types.
+        Get supported writer types.
 
         Returns:
-            list[str]: List of supported writer type strings
+            tuple[str, ...]: Supported writer type strings
         """
-        return list(cls._WRITER_REGISTRY.keys())
+        return cls._SUPPORTED_TYPES
 
     @classmethod
     def is_supported(cls, writer_type: str) -> bool:
@@ -98,6 +108,25 @@ class FileWriterFactory:
 
         return normalized
 
+    @classmethod
+    def _resolve_writer_class(cls, normalized_type: str) -> type[BaseFileWriter]:
+        """
+        Resolve (importing on first use) the writer class for a normalized type.
+
+        Args:
+            normalized_type: Writer type already passed through `_normalize_type`
+
+        Returns:
+            type[BaseFileWriter]: Writer class registered for the type
+        """
+        writer_class = cls._WRITER_CLASS_CACHE.get(normalized_type)
+        if writer_class is None:
+            module_path, class_name = cls._WRITER_REGISTRY[normalized_type]
+            module = importlib.import_module(module_path, __package__)
+            writer_class = getattr(module, class_name)
+            cls._WRITER_CLASS_CACHE[normalized_type] = writer_class
+        return writer_class
+
     def create_writer(self, writer_type: str, params: dict[str, Any]) -> BaseFileWriter:
         """
         Create a file writer instance.
@@ -122,7 +151,7 @@ class FileWriterFactory:
                 f"Supported types: {supported_types}"
             )
 
-        writer_class = self._WRITER_REGISTRY[normalized_type]
+        writer_class = self._resolve_writer_class(normalized_type)
 
         try:
             self.logger.debug(f"Creating {writer_class.__name__} with params: {params}")
@@ -160,7 +189,12 @@ class FileWriterFactory:
             )
 
         normalized_type = cls._normalize_type(writer_type)
-        cls._WRITER_REGISTRY[normalized_type] = writer_class
+        cls._REGISTERED_WRITERS[normalized_type] = (
+            writer_class.__module__,
+            writer_class.__qualname__,
+        )
+        cls._WRITER_CLASS_CACHE[normalized_type] = writer_class
+        cls._SUPPORTED_TYPES = tuple(cls._REGISTERED_WRITERS)
 
     def create_multiple_writers(
         self, writer_configs: list[dict[str, Any]]
@@ -200,3 +234,19 @@ class FileWriterFactory:
 
         self.logger.info(f"Successfully created {len(writers)} writers")
         return writers
+
+
+# Shared factory instance behind the module-level helpers
+_DEFAULT_FACTORY = FileWriterFactory()
+
+
+def create_writer(writer_type: str, params: dict[str, Any]) -> BaseFileWriter:
+    """Create a file writer using the shared factory instance."""
+    return _DEFAULT_FACTORY.create_writer(writer_type, params)
+
+
+def create_multiple_writers(
+    writer_configs: list[dict[str, Any]],
+) -> list[BaseFileWriter]:
+    """Create several file writers using the shared factory instance."""
+    return _DEFAULT_FACTORY.create_multiple_writers(writer_configs)
@@ -7,12 +7,26 @@ format-specific customization.
 """
 
 import os
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any, Callable
 
 import pandas as pd
 
 from .base_file_writer import BaseFileWriter
 
+_NO_DEFAULT_PARAMS: Mapping[str, Any] = MappingProxyType({})
+
+# Name of the output-path keyword for each pandas to_* method; anything not
+# listed here takes "path"
+_PATH_KWARG_BY_METHOD: dict[str, str] = {
+    "to_csv": "path_or_buf",
+    "to_json": "path_or_buf",
+    "to_excel": "excel_writer",
+    "to_parquet": "path",
+    "to_feather": "path",
+}
+
 
 class GenericFileWriter(BaseFileWriter):
     """
@@ -24,44 +38,54 @@ class GenericFileWriter(BaseFileWriter):
     
     Usage:
         # For simple formats that map directly to pandas methods
-        writer = GenericFileWriter({
-            "output_path": "output.csv",
-            "writer_kind": "csv",
-            "pandas_method": "to_csv",
-            "extensions": [".csv"],
-            "default_params": {"index": False, "encoding": "utf-8"}
-        })
+        writer = GenericFileWriter(
+            {"output_path": "output.csv"},
+            writer_kind="csv",
+            pandas_method="to_csv",
+            extensions=[".csv"],
+            default_params=MappingProxyType({"index": False, "encoding": "utf-8"}),
+        )
         
         # For formats requiring custom handling
-        writer = GenericFileWriter({
-            "output_path": "output.html", 
-            "writer_kind": "html",
-            "custom_write_func": custom_html_writer,
-            "extensions": [".html", ".htm"]
-        })
+        writer = GenericFileWriter(
+            {"output_path": "output.html"},
+            writer_kind="html",
+            custom_write_func=custom_html_writer,
+            extensions=[".html", ".htm"],
+        )
     """
 
-    def __init__(self, config: dict[str, Any]):
+    def __init__(
+        self,
+        config: dict[str, Any],
+        *,
+        writer_kind: str = "generic",
+        pandas_method: str | None = None,
+        extensions: list[str] | None = None,
+        default_params: Mapping[str, Any] = _NO_DEFAULT_PARAMS,
+        custom_write_func: Callable[..., dict[str, Any]] | None = None,
+        custom_params_extractor: Callable[[dict[str, Any]], dict[str, Any]]
+        | None = None,
+    ):
         """
         Initialize the generic file writer.
         
         Args:
-            config: Configuration dictionary containing:
-                - output_path: Output file path
-                - writer_kind: Type identifier for the writer
-                - pandas_method: Name of pandas method to use (e.g., 'to_csv')
-                - extensions: List of valid file extensions
-                - default_params: Default parameters for the pandas method
-                - custom_write_func: Optional custom write function
-                - custom_params_extractor: Optional function to extract custom params
+            config: User writer parameters (must include the output path)
+            writer_kind: Type identifier for the writer
+            pandas_method: Name of pandas method to use (e.g., 'to_csv')
+            extensions: List of valid file extensions
+            default_params: Default parameters for the pandas method;
+                stored by reference, so pass a read-only mapping
+            custom_write_func: Optional custom write function
+            custom_params_extractor: Optional function to extract custom params
         """
-        # Extract configuration first
-        self.writer_kind = config.get("writer_kind", "generic")
-        self.pandas_method = config.get("pandas_method")
-        self.extensions = config.get("extensions", [])
-        self.default_params = config.get("default_params", {})
-        self.custom_write_func = config.get("custom_write_func")
-        self.custom_params_extractor = config.get("custom_params_extractor")
+        self.writer_kind = writer_kind
+        self.pandas_method = pandas_method
+        self.extensions = extensions or []
+        self.default_params = default_params
+        self.custom_write_func = custom_write_func
+        self.custom_params_extractor = custom_params_extractor
         
         # Validate configuration
         if not self.custom_write_func and not self.pandas_method:
@@ -69,6 +93,12 @@ class GenericFileWriter(BaseFileWriter):
         
         if not self.extensions:
             raise ValueError("'extensions' must be specified")
+
+        # Keyword the pandas method expects for the output path
+        self._path_kwarg = _PATH_KWARG_BY_METHOD.get(self.pandas_method, "path")
+
+        # Output directories already created by this writer
+        self._dirs_created: set[str] = set()
         
         # Now call parent constructor
         super().__init__(config)
@@ -77,9 +107,9 @@ class GenericFileWriter(BaseFileWriter):
         """Get valid file extensions for this writer."""
         return self.extensions
 
-    def get_default_params(self) -> dict[str, Any]:
-        """Get default parameters for this writer."""
-        return self.default_params.copy()
+    def get_default_params(self) -> Mapping[str, Any]:
+        """Get default parameters for this writer (shared, do not mutate)."""
+        return self.default_params
 
     def write(self, df: pd.DataFrame, metadata: dict[str, Any] = None) -> dict[str, Any]:
         """
@@ -93,22 +123,17 @@ class GenericFileWriter(BaseFileWriter):
             dict: Result information
         """
         try:
-            # Get writer parameters, excluding path-related keys
-            writer_params = self._get_writer_params()
-            
-            # Apply defaults for missing parameters
-            defaults = self.get_default_params()
-            for key, value in defaults.items():
-                if key not in writer_params:
-                    writer_params[key] = value
+            # Writer parameters (excluding path-related keys) over the defaults
+            writer_params = {**self.get_default_params(), **self._get_writer_params()}
             
             # Resolve output path with metadata substitution
             resolved_path = self._resolve_output_path(metadata)
             
             # Ensure the directory exists for the resolved path
             output_dir = os.path.dirname(resolved_path)
-            if output_dir and not os.path.exists(output_dir):
+            if output_dir and output_dir not in self._dirs_created:
                 os.makedirs(output_dir, exist_ok=True)
+                self._dirs_created.add(output_dir)
             
             # Use custom write function if provided
             if self.custom_write_func:
@@ -117,6 +142,8 @@ class GenericFileWriter(BaseFileWriter):
                 result = self._write_with_pandas_method(df, resolved_path, writer_params, metadata)
             
             self.last_written_path = resolved_path
+            # Stat the freshly written file once, now that it is the last path
+            result["file_info"] = self.get_file_info()
             return result
             
         except Exception as e:
@@ -130,31 +157,13 @@ class GenericFileWriter(BaseFileWriter):
         # Get the pandas method
         pandas_write_method = getattr(df, self.pandas_method)
         
-        # Filter out non-pandas parameters
-        meta_keys = {
-            "writer_kind",
-            "extensions",
-            "custom_write_func",
-            "custom_params_extractor",
-            "pandas_method",
-            "default_params",
-        }
-        pandas_params = {k: v for k, v in writer_params.items() if k not in meta_keys}
-        
         # Add path parameter (different methods use different parameter names)
-        if self.pandas_method in ["to_csv", "to_json"]:
-            pandas_params["path_or_buf"] = resolved_path
-        elif self.pandas_method == "to_excel":
-            pandas_params["excel_writer"] = resolved_path
-        elif self.pandas_method in ["to_parquet", "to_feather"]:
-            pandas_params["path"] = resolved_path
-        else:
-            pandas_params["path"] = resolved_path
+        writer_params[self._path_kwarg] = resolved_path
         
         # Write the file
         self.logger.debug(f"Writing DataFrame to {self.writer_kind}: {resolved_path}")
         
-        pandas_write_method(**pandas_params)
+        pandas_write_method(**writer_params)
         
         self.logger.info(f"Successfully wrote {len(df)} rows to {self.writer_kind}: {resolved_path}")
         
@@ -162,7 +171,6 @@ class GenericFileWriter(BaseFileWriter):
             "status": "success",
             "output_path": resolved_path,
             "rows_written": len(df),
-            "file_info": self.get_file_info(),
         }
 
     def _write_with_custom_func(
@@ -177,16 +185,8 @@ class GenericFileWriter(BaseFileWriter):
         else:
             custom_params = {}
 
-        # Build pandas-compatible params by excluding meta and custom keys
-        meta_keys = {
-            "writer_kind",
-            "extensions",
-            "custom_write_func",
-            "custom_params_extractor",
-            "pandas_method",
-            "default_params",
-        }
-        pandas_params = {k: v for k, v in writer_params.items() if k not in meta_keys and k not in custom_params}
+        # Build pandas-compatible params by excluding custom keys
+        pandas_params = {k: v for k, v in writer_params.items() if k not in custom_params}
         
         # Call custom write function
         result = self.custom_write_func(df, resolved_path, pandas_params, custom_params, metadata)
@@ -197,6 +197,5 @@ class GenericFileWriter(BaseFileWriter):
             "status": "success",
             "output_path": resolved_path,
             "rows_written": len(df),
-            "file_info": self.get_file_info(),
             **result  # Include any additional result data from custom function
         }
\ No newline at end of file
@@ -5,6 +5,7 @@ Refactored to use GenericFileWriter to reduce duplication.
 """
 
 import pandas as pd
+from types import MappingProxyType
 from typing import Any
 
 from .generic_file_writer import GenericFileWriter
@@ -21,7 +22,6 @@ def _html_custom_write_func(
     # Extract custom options that aren't pandas to_html parameters
     include_bootstrap = custom_params.get("include_bootstrap", True)
     title = custom_params.get("title", "Data Generator Output")
-    render_links = custom_params.get("render_links", True)
 
     # Generate HTML content
     html_content = df.to_html(**pandas_params)
@@ -70,23 +70,14 @@ def _html_custom_write_func(
 def _html_params_extractor(writer_params: dict[str, Any]) -> dict[str, Any]:
     """Extract custom HTML parameters from writer parameters."""
     custom_params = {}
-    pandas_params = {}
     
-    # Custom HTML parameters
-    custom_keys = ["include_bootstrap", "title", "render_links"]
+    # Custom HTML parameters; everything else (including render_links) is
+    # passed through to DataFrame.to_html
+    custom_keys = ["include_bootstrap", "title"]
     for key in custom_keys:
         if key in writer_params:
             custom_params[key] = writer_params.pop(key)
     
-    # Prepare pandas-compatible parameters for to_html
-    pandas_params = {
-        "border": writer_params.get("border", 0),
-        "index": writer_params.get("index", False),
-        "escape": writer_params.get("escape", True),
-        "na_rep": writer_params.get("na_rep", "N/A"),
-        "classes": writer_params.get("classes", "table table-striped"),
-    }
-    
     return custom_params
 
 
@@ -98,23 +89,27 @@ class HtmlFileWriter(GenericFileWriter):
     and proper defaults.
     """
 
+    # Shared, read-only defaults for every instance
+    _DEFAULT_PARAMS = MappingProxyType(
+        {
+            "title": "Data Generator Output",
+            "classes": "table table-striped table-hover",
+            "index": False,
+            "border": 0,
+            "escape": True,
+            "na_rep": "N/A",
+            "include_bootstrap": True,
+            "render_links": True,
+        }
+    )
+
     def __init__(self, config: dict[str, Any]):
         # Configure the generic writer for HTML format
-        html_config = {
-            **config,
-            "writer_kind": "html",
-            "extensions": [".html", ".htm"],
-            "default_params": {
-                "title": "Data Generator Output",
-                "classes": "table table-striped table-hover",
-                "index": False,
-                "border": 0,
-                "escape": True,
-                "na_rep": "N/A",
-                "include_bootstrap": True,
-                "render_links": True,
-            },
-            "custom_write_func": _html_custom_write_func,
-            "custom_params_extractor": _html_params_extractor,
-        }
-        super().__init__(html_config)
+        super().__init__(
+            config,
+            writer_kind="html",
+            extensions=[".html", ".htm"],
+            default_params=self._DEFAULT_PARAMS,
+            custom_write_func=_html_custom_write_func,
+            custom_params_extractor=_html_params_extractor,
+        )
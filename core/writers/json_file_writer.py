@@ -2,12 +2,103 @@
 JSON file writer implementation for GenXData.
 
 Refactored to use GenericFileWriter to reduce duplication.
+
+When the optional ``orjson`` package is installed, record-oriented output
+with the default options is serialized by orjson instead of
+``DataFrame.to_json``. Values are pre-formatted to match pandas' output
+(ISO millisecond timestamps, 10 decimal places for floats, null for
+missing values); anything the fast path cannot reproduce falls back to
+pandas.
 """
 
+from types import MappingProxyType
 from typing import Any
 
+import numpy as np
+import pandas as pd
+
 from .generic_file_writer import GenericFileWriter
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+# pandas' default ``double_precision`` for to_json
+_PANDAS_DOUBLE_PRECISION = 10
+
+# Options the orjson path can reproduce; any other pandas option falls back
+_ORJSON_SUPPORTED_PARAMS = frozenset({"orient", "date_format", "indent"})
+
+
+def _orjson_records(df: pd.DataFrame) -> list[dict[str, Any]] | None:
+    """
+    Build orjson-ready records for ``df``.
+
+    Returns:
+        list[dict] | None: Records, or None if a column needs pandas' encoder
+    """
+    if not df.columns.is_unique:
+        return None
+
+    columns: dict[str, Any] = {}
+    for name, col in df.items():
+        if not isinstance(name, str) or not isinstance(col.dtype, np.dtype):
+            return None
+
+        kind = col.dtype.kind
+        if kind in "iub":
+            columns[name] = col
+        elif kind == "f":
+            # Round in float64, as pandas does: rounding float32 in place
+            # leaves values orjson would print with float64 noise digits
+            columns[name] = col.astype(np.float64).round(_PANDAS_DOUBLE_PRECISION)
+        elif kind == "M":
+            text = np.datetime_as_string(col.to_numpy(), unit="ms")
+            columns[name] = pd.Series(text, index=col.index, dtype=object).where(
+                col.notna(), None
+            )
+        elif kind == "O" and pd.api.types.infer_dtype(col, skipna=True) in (
+            "string",
+            "empty",
+        ):
+            columns[name] = col.where(col.notna(), None)
+        else:
+            return None
+
+    return pd.DataFrame(columns, index=df.index).to_dict(orient="records")
+
+
+def _json_custom_write_func(
+    df: pd.DataFrame,
+    output_path: str,
+    pandas_params: dict[str, Any],
+    custom_params: dict[str, Any],
+    metadata: dict[str, Any] = None,
+) -> dict[str, Any]:
+    """Custom write function for JSON format with an orjson fast path."""
+    indent = pandas_params.get("indent")
+    use_orjson = (
+        orjson is not None
+        and pandas_params.keys() <= _ORJSON_SUPPORTED_PARAMS
+        and pandas_params.get("orient") == "records"
+        and pandas_params.get("date_format", "iso") == "iso"
+        and indent in (None, 0, 2)
+    )
+
+    records = _orjson_records(df) if use_orjson else None
+    if records is None:
+        df.to_json(output_path, **pandas_params)
+        return {"serializer": "pandas"}
+
+    option = orjson.OPT_SERIALIZE_NUMPY
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    with open(output_path, "wb") as f:
+        f.write(orjson.dumps(records, option=option))
+
+    return {"serializer": "orjson"}
+
 
 class JsonFileWriter(GenericFileWriter):
     """
@@ -17,17 +108,21 @@ class JsonFileWriter(GenericFileWriter):
     and parameter validation.
     """
 
+    # Shared, read-only defaults for every instance
+    _DEFAULT_PARAMS = MappingProxyType(
+        {
+            "orient": "records",  # Write as array of objects
+            "date_format": "iso",  # ISO format for dates
+            "indent": 2,  # Pretty print JSON
+        }
+    )
+
     def __init__(self, config: dict[str, Any]):
         # Configure the generic writer for JSON format
-        json_config = {
-            **config,
-            "writer_kind": "json",
-            "pandas_method": "to_json",
-            "extensions": [".json"],
-            "default_params": {
-                "orient": "records",  # Write as array of objects
-                "date_format": "iso",  # ISO format for dates
-                "indent": 2,  # Pretty print JSON
-            }
-        }
-        super().__init__(json_config)
+        super().__init__(
+            config,
+            writer_kind="json",
+            extensions=[".json"],
+            default_params=self._DEFAULT_PARAMS,
+            custom_write_func=_json_custom_write_func,
+        )
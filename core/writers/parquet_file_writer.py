@@ -4,6 +4,7 @@ Parquet file writer implementation for GenXData.
 Refactored to use GenericFileWriter to reduce duplication.
 """
 
+from types import MappingProxyType
 from typing import Any
 
 from .generic_file_writer import GenericFileWriter
@@ -17,16 +18,20 @@ class ParquetFileWriter(GenericFileWriter):
     and parameter validation.
     """
 
+    # Shared, read-only defaults for every instance
+    _DEFAULT_PARAMS = MappingProxyType(
+        {
+            "compression": "snappy",  # Default compression
+            "index": False,  # Don't include DataFrame index by default
+        }
+    )
+
     def __init__(self, config: dict[str, Any]):
         # Configure the generic writer for Parquet format
-        parquet_config = {
-            **config,
-            "writer_kind": "parquet",
-            "pandas_method": "to_parquet",
-            "extensions": [".parquet"],
-            "default_params": {
-                "compression": "snappy",  # Default compression
-                "index": False,  # Don't include DataFrame index by default
-            }
-        }
-        super().__init__(parquet_config)
+        super().__init__(
+            config,
+            writer_kind="parquet",
+            pandas_method="to_parquet",
+            extensions=[".parquet"],
+            default_params=self._DEFAULT_PARAMS,
+        )
@@ -5,21 +5,153 @@ Refactored to use GenericFileWriter to reduce duplication.
 """
 
 import sqlite3
+from functools import lru_cache, partial
+from types import MappingProxyType
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from .generic_file_writer import GenericFileWriter
 
+# SQLite column types matching what DataFrame.to_sql declares, by dtype kind
+_SQLITE_TYPE_BY_KIND = MappingProxyType(
+    {"i": "INTEGER", "u": "INTEGER", "b": "INTEGER", "f": "REAL", "M": "TIMESTAMP"}
+)
+
+
+def _quote_identifier(name: str) -> str:
+    """Quote an SQLite identifier."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+@lru_cache(maxsize=64)
+def _sqlite_statements(
+    table_name: str, columns: tuple[str, ...], column_types: tuple[str, ...]
+) -> tuple[str, str]:
+    """Build (and cache per schema) the CREATE TABLE and INSERT statements."""
+    table = _quote_identifier(table_name)
+    column_defs = ", ".join(
+        f"{_quote_identifier(col)} {col_type}"
+        for col, col_type in zip(columns, column_types, strict=True)
+    )
+    column_names = ", ".join(_quote_identifier(col) for col in columns)
+    placeholders = ", ".join("?" * len(columns))
+    return (
+        f"CREATE TABLE IF NOT EXISTS {table} ({column_defs})",
+        f"INSERT INTO {table} ({column_names}) VALUES ({placeholders})",
+    )
+
+
+def _sqlite_rows_frame(df: pd.DataFrame) -> tuple[pd.DataFrame, tuple[str, ...]] | None:
+    """
+    Prepare ``df`` for a direct executemany insert.
+
+    Datetimes are rendered the way to_sql stores them (``isoformat(" ")``).
+
+    Returns:
+        tuple | None: (frame of bindable values, SQLite column types), or None
+        when a column needs pandas' type handling
+    """
+    if not df.columns.is_unique:
+        return None
+
+    columns: dict[str, Any] = {}
+    column_types = []
+    for name, col in df.items():
+        if not isinstance(name, str) or not isinstance(col.dtype, np.dtype):
+            return None
+
+        kind = col.dtype.kind
+        if kind == "M":
+            text = col.dt.strftime("%Y-%m-%d %H:%M:%S.%f")
+            text = text.where(col.dt.microsecond != 0, text.str[:-7])
+            columns[name] = text.astype(object).where(col.notna(), None)
+        elif kind in _SQLITE_TYPE_BY_KIND:
+            columns[name] = col
+        elif kind == "O" and pd.api.types.infer_dtype(col, skipna=True) in (
+            "string",
+            "empty",
+        ):
+            columns[name] = col.where(col.notna(), None)
+        else:
+            return None
+        column_types.append(_SQLITE_TYPE_BY_KIND.get(kind, "TEXT"))
+
+    return pd.DataFrame(columns, index=df.index), tuple(column_types)
+
+
+def _sqlite_executemany(
+    conn: sqlite3.Connection,
+    df: pd.DataFrame,
+    table_name: str,
+    if_exists: str,
+    schema_key: tuple[str, ...],
+    verified_tables: set[tuple[str, ...]] | None = None,
+) -> bool:
+    """
+    Insert ``df`` with a cached INSERT statement and ``executemany``.
+
+    In append mode, tables recorded in ``verified_tables`` (keyed by
+    ``schema_key`` plus the CREATE statement) are known to exist with this
+    schema, so the CREATE/lookup step is skipped and only the insert runs.
+
+    Returns:
+        bool: False if the frame needs to go through ``DataFrame.to_sql``
+    """
+    prepared = _sqlite_rows_frame(df)
+    if prepared is None:
+        return False
+    rows, column_types = prepared
+
+    create_sql, insert_sql = _sqlite_statements(
+        table_name, tuple(rows.columns), column_types
+    )
+
+    verified_key = (*schema_key, create_sql)
+    if (
+        if_exists == "append"
+        and verified_tables is not None
+        and verified_key in verified_tables
+    ):
+        with conn:
+            conn.executemany(insert_sql, rows.itertuples(index=False, name=None))
+        return True
+
+    with conn:
+        if if_exists == "replace":
+            conn.execute(f"DROP TABLE IF EXISTS {_quote_identifier(table_name)}")
+        elif if_exists == "fail":
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (table_name,),
+            ).fetchone()
+            if exists:
+                raise ValueError(f"Table '{table_name}' already exists.")
+        conn.execute(create_sql)
+        conn.executemany(insert_sql, rows.itertuples(index=False, name=None))
+
+    if if_exists == "append" and verified_tables is not None:
+        verified_tables.add(verified_key)
+    return True
+
 
 def _sqlite_custom_write_func(
     df: pd.DataFrame, 
     output_path: str, 
     pandas_params: dict[str, Any], 
     custom_params: dict[str, Any], 
-    metadata: dict[str, Any] = None
+    metadata: dict[str, Any] = None,
+    verified_tables: set[tuple[str, ...]] | None = None,
 ) -> dict[str, Any]:
-    """Custom write function for SQLite format."""
+    """
+    Custom write function for SQLite format.
+
+    Plain frames (no index, no extra to_sql options, simple dtypes) are
+    inserted with a single executemany in one transaction; everything else
+    goes through ``DataFrame.to_sql``. ``verified_tables`` lets a writer
+    remember appended tables so later batches skip the schema check.
+    """
     conn = None
     try:
         # Extract SQLite-specific parameters
@@ -27,17 +159,33 @@ def _sqlite_custom_write_func(
         if_exists = custom_params.get("if_exists", "replace")
         index = custom_params.get("index", False)
 
+        if if_exists not in ("fail", "replace", "append"):
+            raise ValueError(f"'{if_exists}' is not valid for if_exists")
+
         # Create SQLite connection
         conn = sqlite3.connect(output_path)
 
-        # Write DataFrame to SQLite
-        df.to_sql(
-            name=table_name,
-            con=conn,
-            if_exists=if_exists,
-            index=index,
-            **pandas_params,  # Any remaining parameters
+        fast = (
+            not index
+            and not pandas_params
+            and _sqlite_executemany(
+                conn,
+                df,
+                table_name,
+                if_exists,
+                (output_path, table_name),
+                verified_tables,
+            )
         )
+        if not fast:
+            # Write DataFrame to SQLite
+            df.to_sql(
+                name=table_name,
+                con=conn,
+                if_exists=if_exists,
+                index=index,
+                **pandas_params,  # Any remaining parameters
+            )
 
         return {
             "table_name": table_name,
@@ -70,18 +218,27 @@ class SqliteFileWriter(GenericFileWriter):
     and parameter validation.
     """
 
+    # Shared, read-only defaults for every instance
+    _DEFAULT_PARAMS = MappingProxyType(
+        {
+            "table": "data",  # Default table name
+            "if_exists": "replace",  # Replace table if it exists
+            "index": False,  # Don't include DataFrame index by default
+        }
+    )
+
     def __init__(self, config: dict[str, Any]):
+        # Tables this writer has created or appended to with a known schema
+        self._verified_tables: set[tuple[str, ...]] = set()
+
         # Configure the generic writer for SQLite format
-        sqlite_config = {
-            **config,
-            "writer_kind": "sqlite",
-            "extensions": [".db", ".sqlite", ".sqlite3"],
-            "default_params": {
-                "table": "data",  # Default table name
-                "if_exists": "replace",  # Replace table if it exists
-                "index": False,  # Don't include DataFrame index by default
-            },
-            "custom_write_func": _sqlite_custom_write_func,
-            "custom_params_extractor": _sqlite_params_extractor,
-        }
-        super().__init__(sqlite_config)
+        super().__init__(
+            config,
+            writer_kind="sqlite",
+            extensions=[".db", ".sqlite", ".sqlite3"],
+            default_params=self._DEFAULT_PARAMS,
+            custom_write_func=partial(
+                _sqlite_custom_write_func, verified_tables=self._verified_tables
+            ),
+            custom_params_extractor=_sqlite_params_extractor,
+        )
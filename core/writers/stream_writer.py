@@ -2,18 +2,44 @@
 Stream writer implementation for GenXData.
 
 Handles writing DataFrames to message queues (AMQP, Kafka, etc.).
+
+The messaging package (and its client libraries) is imported, and the
+producer connected, on the first write rather than at construction.
+
+With ``linger_ms`` set in the queue section, writes are buffered and sent
+back-to-back (followed by a single producer flush) once ``max_pending_bytes``
+of data is pending or the linger time has elapsed, whichever comes first.
+DataFrames a failed flush did not send stay buffered for the next flush; a
+failure on the linger timer is reported by the next ``write``, and
+``finalize`` raises if the buffer still cannot be sent.
+
+``payload_format: arrow`` sends each DataFrame as a zstd-compressed Arrow IPC
+stream (see ``messaging.serialization``) instead of a JSON document; it falls
+back to JSON when pyarrow is not installed. ``json_orient: columns`` sends
+JSON messages with column arrays instead of one object per row.
 """
 
+import logging
+import threading
+from datetime import UTC, datetime
 from typing import Any
 import time
 
 import pandas as pd
 
-from messaging.factory import QueueFactory
 from utils.logging import Logger
 
 from .base_writer import BaseWriter
 
+# Buffered bytes that trigger an immediate flush when linger_ms is enabled
+DEFAULT_MAX_PENDING_BYTES = 1024 * 1024
+
+# Supported values for the queue section's payload_format option
+PAYLOAD_FORMATS = ("json", "arrow")
+
+# Supported values for the queue section's json_orient option
+JSON_ORIENTS = ("records", "columns")
+
 
 class StreamWriter(BaseWriter):
     """
@@ -22,6 +48,8 @@ class StreamWriter(BaseWriter):
     Uses the messaging module to send data to various message queue systems.
     """
 
+    logger = Logger.get_logger("stream_writer")
+
     def __init__(self, config: dict[str, Any]):
         """
         Initialize the stream writer.
@@ -30,32 +58,57 @@ class StreamWriter(BaseWriter):
             config: Stream writer configuration containing queue settings
         """
         super().__init__(config)
-        self.logger = Logger.get_logger("stream_writer")
         self.queue_producer = None
         self.total_rows_written = 0
         self.total_batches_sent = 0
         self.queue_meta: dict[str, Any] = {}
         self.normalized_queue_config: dict[str, Any] | None = None
         self.delay_seconds: float = 0.0
-
-        # Validate configuration and normalize queue settings
+        self.payload_format = "json"
+        self.json_orient = "records"
+        self._validated_config_id: int | None = None
+        self._last_columns: pd.Index | None = None
+        self._column_names_cache: tuple[str, ...] = ()
+        # Arrow encoder specialized to the last seen (columns, dtypes)
+        self._arrow_schema_key: tuple | None = None
+        self._arrow_encoder = None
+        self._producer_ready = False
+        self._producer_lock = threading.Lock()
+        self._pool_key: str | None = None
+
+        # Send buffering (disabled unless linger_ms > 0)
+        self.linger_ms: float = 0.0
+        self.max_pending_bytes: int = DEFAULT_MAX_PENDING_BYTES
+        self._pending: list[tuple[pd.DataFrame, dict[str, Any]]] = []
+        self._pending_bytes = 0
+        self._pending_lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._linger_timer: threading.Timer | None = None
+        # Error from a linger-timer flush, reported by the next write()
+        self._flush_error: Exception | None = None
+
+        # Validate configuration and normalize queue settings; the producer is
+        # created lazily by _ensure_producer() on the first write
         self.validate_config()
-        # Initialize queue producer
-        self._initialize_producer()
 
         self.logger.debug("StreamWriter initialized with config")
 
     def _extract_queue_section(self) -> tuple[str, dict[str, Any]] | None:
         """Return (queue_type, queue_section) from config supporting nested or flat forms."""
+        config = self.config
+
         # Nested form: {"amqp": {...}} or {"kafka": {...}}
         for key in ("amqp", "kafka"):
-            if key in self.config and isinstance(self.config[key], dict):
-                return key, self.config[key]
+            section = config.get(key)
+            if isinstance(section, dict):
+                return key, section
 
         # Flat form: {"type": "amqp", "host": ..., "port": ..., "queue": ...}
-        qtype = self.config.get("type")
-        if isinstance(qtype, str) and qtype.lower() in {"amqp", "kafka"}:
-            return qtype.lower(), self.config
+        qtype = config.get("type")
+        if isinstance(qtype, str):
+            qtype = qtype.lower()
+            if qtype in ("amqp", "kafka"):
+                return qtype, config
         return None
 
     def validate_config(self) -> bool:
@@ -68,6 +121,10 @@ class StreamWriter(BaseWriter):
         Raises:
             ValueError: If configuration is invalid
         """
+        # The normalized settings are computed once per config object
+        if self._validated_config_id == id(self.config):
+            return True
+
         super().validate_config()
 
         # Accept nested or flat queue config and normalize
@@ -77,15 +134,21 @@ class StreamWriter(BaseWriter):
                 "Stream writer config must include a supported queue section (e.g., nested 'amqp'/'kafka' or flat 'type')."
             )
 
+        # One lookup per field; the checks below only branch on these locals
         queue_type, section = extracted
+        url = section.get("url")
+        host = section.get("host")
+        port = section.get("port")
+        queue = section.get("queue")
+
         # Validate minimal required fields for convenience (messaging also validates)
         # Accept either a single URL or host+port; 'queue' is always required
-        if "queue" not in section:
+        if queue is None:
             raise ValueError(
                 f"Stream writer config missing required fields for {queue_type}: queue"
             )
-        has_url = "url" in section and isinstance(section["url"], str)
-        has_host_port = "host" in section and "port" in section
+        has_url = isinstance(url, str)
+        has_host_port = host is not None and port is not None
         if not (has_url or has_host_port):
             raise ValueError(
                 f"Stream writer config missing required fields for {queue_type}: provide either 'url' or 'host' and 'port'"
@@ -99,20 +162,88 @@ class StreamWriter(BaseWriter):
         except (TypeError, ValueError):
             raise ValueError("'delay_seconds' must be a number (seconds)")
 
+        # Optional binary payload encoding
+        payload_format = str(section.get("payload_format", "json")).lower()
+        if payload_format not in PAYLOAD_FORMATS:
+            raise ValueError(
+                f"'payload_format' must be one of: {', '.join(PAYLOAD_FORMATS)}"
+            )
+        if payload_format == "arrow":
+            from messaging.serialization import arrow_available
+
+            if not arrow_available():
+                self.logger.warning(
+                    "pyarrow is not installed; falling back to JSON payloads"
+                )
+                payload_format = "json"
+        self.payload_format = payload_format
+
+        # Layout of the JSON message's data field (rows or columns)
+        json_orient = str(section.get("json_orient", "records")).lower()
+        if json_orient not in JSON_ORIENTS:
+            raise ValueError(f"'json_orient' must be one of: {', '.join(JSON_ORIENTS)}")
+        self.json_orient = json_orient
+
+        # Optional send buffering: linger time and pending-size threshold
+        raw_linger = section.get("linger_ms")
+        try:
+            if raw_linger is not None:
+                self.linger_ms = max(0.0, float(raw_linger))
+        except (TypeError, ValueError):
+            raise ValueError("'linger_ms' must be a number (milliseconds)") from None
+
+        raw_max_pending = section.get("max_pending_bytes")
+        if raw_max_pending is not None:
+            try:
+                self.max_pending_bytes = int(raw_max_pending)
+            except (TypeError, ValueError):
+                raise ValueError("'max_pending_bytes' must be an integer") from None
+            if self.max_pending_bytes <= 0:
+                raise ValueError("'max_pending_bytes' must be positive")
+
         # Store normalized meta and config
         self.queue_meta = {
             "queue_type": queue_type,
-            "host": section.get("host") or section.get("url"),
-            "port": section.get("port"),
-            "queue": section.get("queue"),
+            "host": host or url,
+            "port": port,
+            "queue": queue,
             "delay_seconds": self.delay_seconds,
+            "linger_ms": self.linger_ms,
+            "payload_format": self.payload_format,
+            "json_orient": self.json_orient,
         }
         self.normalized_queue_config = {queue_type: section}
+        self._validated_config_id = id(self.config)
 
         return True
 
+    def _ensure_producer(self) -> None:
+        """Create and connect the queue producer once, on first use."""
+        if self._producer_ready:
+            return
+        with self._producer_lock:
+            if not self._producer_ready:
+                self._initialize_producer()
+                self._producer_ready = True
+
     def _initialize_producer(self):
-        """Initialize the message queue producer."""
+        """
+        Initialize the message queue producer.
+
+        Producers are shared through `ProducerPool`, so writers with the same
+        queue config reuse one open connection.
+        """
+        from messaging.factory import QueueFactory
+        from messaging.producer_pool import ProducerPool
+
+        def connect_producer():
+            producer = QueueFactory.create_from_config(cfg)
+            producer.connect()
+            # Logged once per pooled connection, not once per writer
+            if self.logger.isEnabledFor(logging.INFO):
+                self._log_connected(producer)
+            return producer
+
         try:
             self.logger.debug("Initializing queue producer")
             cfg = (
@@ -120,21 +251,21 @@ class StreamWriter(BaseWriter):
                 if self.normalized_queue_config
                 else self.config
             )
-            self.queue_producer = QueueFactory.create_from_config(cfg)
-            self.queue_producer.connect()
-            # Attempt to log masked connection info if available
-            try:
-                amqp_conf = getattr(self.queue_producer, "config", None)
-                masked = (
-                    amqp_conf.get_connection_url_masked() if amqp_conf else "(unknown)"
-                )
-                self.logger.info(f"Successfully connected to message queue: {masked}")
-            except Exception:
-                self.logger.info("Successfully connected to message queue")
+            self._pool_key = ProducerPool.make_key(cfg)
+            self.queue_producer = ProducerPool.acquire(self._pool_key, connect_producer)
         except Exception as e:
             self.logger.error(f"Failed to initialize queue producer: {e}")
             raise
 
+    def _log_connected(self, producer) -> None:
+        """Log the (masked) connection URL of a newly connected producer."""
+        try:
+            conf = getattr(producer, "config", None)
+            masked = conf.get_connection_url_masked() if conf else "(unknown)"
+            self.logger.info(f"Successfully connected to message queue: {masked}")
+        except Exception:
+            self.logger.info("Successfully connected to message queue")
+
     def write(
         self, df: pd.DataFrame, metadata: dict[str, Any] = None
     ) -> dict[str, Any]:
@@ -152,43 +283,52 @@ class StreamWriter(BaseWriter):
             self.logger.warning("Received empty DataFrame, skipping write")
             return {"status": "skipped", "reason": "empty_dataframe"}
 
+        self._ensure_producer()
         if not self.queue_producer:
             self.logger.error("Queue producer not initialized")
             return {"status": "error", "error": "Queue producer not initialized"}
 
-        self.logger.info(f"Sending DataFrame with {len(df)} rows to message queue")
+        nrows = len(df)
+        self.logger.info(f"Sending DataFrame with {nrows} rows to message queue")
 
         try:
             # Prepare batch information
             batch_info = {
-                "rows": len(df),
-                "columns": list(df.columns),
-                "timestamp": pd.Timestamp.now().isoformat(),
+                "rows": nrows,
+                "columns": self._column_names(df),
             }
 
             # Add metadata if provided
             if metadata:
                 batch_info.update(metadata)
 
-            # Send DataFrame to queue
-            self.queue_producer.send_dataframe(df, batch_info)
+            # Stamp the batch unless the caller already did
+            if "timestamp" not in batch_info:
+                batch_info["timestamp"] = datetime.now(UTC).isoformat(
+                    timespec="milliseconds"
+                )
+
+            self._raise_flush_error()
 
-            # Update counters
-            self.total_rows_written += len(df)
-            self.total_batches_sent += 1
+            if self.linger_ms > 0 and not self._buffer(df, batch_info):
+                return {
+                    "status": "queued",
+                    "rows_queued": nrows,
+                    "batch_info": batch_info,
+                    "metadata": metadata,
+                }
 
-            self.logger.info(f"Successfully sent {len(df)} rows to message queue")
+            if self.linger_ms > 0:
+                self._flush()
+            else:
+                with self._send_lock:
+                    self._send_batches([(df, batch_info)])
 
-            # Apply optional idle delay between sends
-            if self.delay_seconds and self.delay_seconds > 0:
-                try:
-                    time.sleep(self.delay_seconds)
-                except Exception:
-                    pass
+            self.logger.info(f"Successfully sent {nrows} rows to message queue")
 
             return {
                 "status": "success",
-                "rows_written": len(df),
+                "rows_written": nrows,
                 "batch_info": batch_info,
                 "metadata": metadata,
             }
@@ -197,24 +337,204 @@ class StreamWriter(BaseWriter):
             self.logger.error(f"Error sending DataFrame to message queue: {e}")
             return {"status": "error", "error": str(e), "metadata": metadata}
 
+    def _column_names(self, df: pd.DataFrame) -> tuple[str, ...]:
+        """Return the column names as a tuple, reused while the schema is unchanged."""
+        columns = df.columns
+        if columns is not self._last_columns:
+            if self._last_columns is None or not columns.equals(self._last_columns):
+                self._column_names_cache = tuple(columns)
+            self._last_columns = columns
+        return self._column_names_cache
+
+    def _buffer(self, df: pd.DataFrame, batch_info: dict[str, Any]) -> bool:
+        """
+        Queue a DataFrame for a later flush.
+
+        Returns:
+            bool: True if the pending size reached ``max_pending_bytes`` and
+            the caller should flush now
+        """
+        with self._pending_lock:
+            self._pending.append((df, batch_info))
+            self._pending_bytes += self._frame_bytes(df)
+            if self._pending_bytes >= self.max_pending_bytes:
+                return True
+            if self._linger_timer is None:
+                self._linger_timer = threading.Timer(
+                    self.linger_ms / 1000.0, self._flush_on_linger
+                )
+                self._linger_timer.daemon = True
+                self._linger_timer.start()
+        return False
+
+    def _flush(self) -> None:
+        """Send every pending DataFrame back-to-back, then flush the producer once."""
+        with self._send_lock:
+            with self._pending_lock:
+                batches, self._pending = self._pending, []
+                self._pending_bytes = 0
+                if self._linger_timer is not None:
+                    self._linger_timer.cancel()
+                    self._linger_timer = None
+            if not batches:
+                return
+            try:
+                self._send_batches(batches)
+            except Exception:
+                # Put unsent DataFrames back ahead of anything buffered since,
+                # so the next flush retries them in order
+                with self._pending_lock:
+                    self._pending[:0] = batches
+                    self._pending_bytes += sum(
+                        self._frame_bytes(df) for df, _info in batches
+                    )
+                raise
+            flush = getattr(self.queue_producer, "flush", None)
+            if callable(flush):
+                flush()
+
+    def _flush_on_linger(self) -> None:
+        """Timer callback: flush whatever accumulated during the linger window."""
+        try:
+            self._flush()
+        except Exception as e:
+            self.logger.error(
+                f"Error flushing buffered DataFrames to message queue: {e}"
+            )
+            # The timer thread has no caller; the next write() reports it
+            self._flush_error = e
+
+    def _raise_flush_error(self) -> None:
+        """Raise (once) the error of a failed linger-timer flush, if any."""
+        error, self._flush_error = self._flush_error, None
+        if error is not None:
+            raise error
+
+    @staticmethod
+    def _frame_bytes(df: pd.DataFrame) -> int:
+        """Size of a DataFrame's column data, as counted against max_pending_bytes."""
+        return int(df.memory_usage(index=False).sum())
+
+    def _send_frame(self, df: pd.DataFrame, batch_info: dict[str, Any]) -> None:
+        """Send one DataFrame using the configured payload format."""
+        if self.payload_format != "arrow":
+            if self.json_orient == "records":
+                self.queue_producer.send_dataframe(df, batch_info)
+            else:
+                self.queue_producer.send_dataframe(
+                    df, batch_info, orient=self.json_orient
+                )
+            return
+
+        from messaging.serialization import (
+            ARROW_IPC_CODEC,
+            ARROW_IPC_CONTENT_TYPE,
+            ARROW_IPC_FORMAT,
+            dumps_json,
+        )
+
+        headers = {
+            "format": ARROW_IPC_FORMAT,
+            "codec": ARROW_IPC_CODEC,
+            "content_type": ARROW_IPC_CONTENT_TYPE,
+            "batch_info": dumps_json(batch_info).decode("utf-8"),
+        }
+        self.queue_producer.send_bytes(self._encode_arrow(df), headers)
+
+    def _encode_arrow(self, df: pd.DataFrame) -> bytes:
+        """
+        Encode a DataFrame as Arrow IPC, reusing an encoder compiled for its schema.
+
+        The encoder is rebuilt when the columns or dtypes change; frames the
+        compiled schema cannot hold are encoded generically.
+        """
+        from messaging.serialization import (
+            compile_arrow_encoder,
+            dataframe_to_arrow_ipc,
+        )
+
+        schema_key = (self._column_names(df), tuple(df.dtypes))
+        if schema_key != self._arrow_schema_key:
+            self._arrow_encoder = compile_arrow_encoder(df)
+            self._arrow_schema_key = schema_key
+
+        if self._arrow_encoder is not None:
+            try:
+                return self._arrow_encoder(df)
+            except (TypeError, ValueError):
+                self.logger.debug("Arrow schema mismatch; encoding batch generically")
+        return dataframe_to_arrow_ipc(df)
+
+    def _send_batches(self, batches: list[tuple[pd.DataFrame, dict[str, Any]]]) -> None:
+        """
+        Send DataFrames in order and update counters (caller holds _send_lock).
+
+        Sent entries are removed from ``batches``, so if a send raises the
+        list holds exactly the DataFrames that were not sent.
+        """
+        sent = 0
+        try:
+            for df, batch_info in batches:
+                # Send DataFrame to queue
+                self._send_frame(df, batch_info)
+                sent += 1
+
+                # Update counters
+                self.total_rows_written += len(df)
+                self.total_batches_sent += 1
+
+                # Apply optional idle delay between sends
+                if self.delay_seconds and self.delay_seconds > 0:
+                    try:
+                        time.sleep(self.delay_seconds)
+                    except Exception:
+                        pass
+        finally:
+            del batches[:sent]
+
     def finalize(self) -> dict[str, Any]:
         """
         Finalize stream writing operations and cleanup.
 
         Returns:
             Dictionary with summary of all write operations
+
+        Raises:
+            Exception: The send error, if buffered DataFrames could not be
+            sent (the producer is still released first)
         """
+        # Send anything still waiting in the linger buffer; a timer error is
+        # superseded by this final attempt, which retries the same DataFrames
+        self._flush_error = None
+        flush_error = None
+        if self._producer_ready and self.queue_producer:
+            try:
+                self._flush()
+            except Exception as e:
+                self.logger.error(
+                    f"Error flushing buffered DataFrames to message queue: {e}"
+                )
+                flush_error = e
+
         self.logger.info(
             f"Finalizing stream writer. Total rows sent: {self.total_rows_written}"
         )
 
-        # Disconnect from queue
-        if self.queue_producer:
+        # Hand the producer back to the pool (nothing to do if no write ever
+        # connected); the pool disconnects once no writer is using it
+        if self._producer_ready and self.queue_producer:
+            from messaging.producer_pool import ProducerPool
+
             try:
-                self.queue_producer.disconnect()
-                self.logger.info("Disconnected from message queue")
+                if ProducerPool.release(self._pool_key):
+                    self.logger.info("Disconnected from message queue")
             except Exception as e:
                 self.logger.warning(f"Error disconnecting from queue: {e}")
+            self.queue_producer = None
+            self._producer_ready = False
+
+        if flush_error is not None:
+            raise flush_error
 
         summary = {
             "total_rows_written": self.total_rows_written,
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 import mkdocs_gen_files
 
@@ -12,23 +13,30 @@ for section, rel_path in SECTIONS:
     if not src_dir.exists():
         continue
 
-    entries: list[tuple[str, str]] = []
+    # One directory read instead of a glob plus per-file stats
+    with os.scandir(src_dir) as it:
+        py_files = sorted(
+            entry.name
+            for entry in it
+            if entry.name.endswith(".py") and entry.name != "__init__.py"
+        )
 
-    for py_file in sorted(src_dir.glob("*.py")):
-        if py_file.stem == "__init__":
-            continue
-        module_name = py_file.with_suffix("").as_posix().replace("/", ".")
-        out_path = Path("reference") / section / f"{py_file.stem}.md"
+    base_out = Path("reference") / section
+    mod_prefix = rel_path.replace("/", ".")
+    entries: list[str] = []
+
+    for file_name in py_files:
+        stem = file_name[:-3]
+        out_path = base_out / f"{stem}.md"
         with mkdocs_gen_files.open(out_path, "w") as fd:
-            fd.write(f"# {py_file.stem}\n\n")
-            fd.write(f"::: {module_name}\n")
-        mkdocs_gen_files.set_edit_path(out_path, py_file)
-        entries.append((py_file.stem, out_path.as_posix()))
+            fd.write(f"# {stem}\n\n::: {mod_prefix}.{stem}\n")
+        mkdocs_gen_files.set_edit_path(out_path, src_dir / file_name)
+        entries.append(stem)
 
     if entries:
-        index_path = Path("reference") / section / "index.md"
+        index_path = base_out / "index.md"
+        lines = [f"# {section.capitalize()}\n\n"]
+        lines.extend(f"- [{stem}]({stem}.md)\n" for stem in entries)
         with mkdocs_gen_files.open(index_path, "w") as fd:
-            fd.write(f"# {section.capitalize()}\n\n")
-            for title, path in entries:
-                fd.write(f"- [{title}]({Path(path).name})\n")
+            fd.write("".join(lines))
         mkdocs_gen_files.set_edit_path(index_path, None)
@@ -8,6 +8,18 @@ This package provides a comprehensive exception hierarchy for GenXData with:
 - Consistent error formatting
 """
 
+# Specific exception implementations
+from ._concrete import (
+    BatchProcessingException,
+    ConfigException,
+    InvalidConfigFormatException,
+    InvalidConfigParamException,
+    InvalidConfigPathException,
+    InvalidRunningModeException,
+    StreamingException,
+    UnsupportedStrategyException,
+)
+
 # Base exception classes and enums
 from .base_exception import (
     ConfigurationError,
@@ -21,16 +33,6 @@ from .base_exception import (
     SystemError,
     ValidationError,
 )
-from .batch_processing_exception import BatchProcessingException
-
-# Specific exception implementations
-from .config_exception import ConfigException
-from .invalid_config_format_exception import InvalidConfigFormatException
-from .invalid_config_path_exception import InvalidConfigPathException
-from .invalid_running_mode_exception import InvalidRunningModeException
-from .param_exceptions import InvalidConfigParamException
-from .strategy_exceptions import UnsupportedStrategyException
-from .streaming_exception import StreamingException
 
 __all__ = [
     # Base classes and enums
@@ -0,0 +1,80 @@
+"""
+Concrete GenXData exceptions.
+
+All specific exception classes live in this one module so importing the
+``exceptions`` package loads a single file for them. The historical
+per-class modules re-export from here.
+"""
+
+from .base_exception import (
+    ConfigurationError,
+    ErrorSeverity,
+    NetworkError,
+    ProcessingError,
+    StrategyError,
+    ValidationError,
+)
+
+
+class ConfigException(ConfigurationError):
+    """Exception raised for configuration-related errors."""
+
+    severity = ErrorSeverity.ERROR
+    default_error_code = "CFG002"
+    _default_message = "Configuration processing error occurred"
+
+
+class InvalidConfigParamException(ValidationError):
+    """Exception raised for invalid config parameters."""
+
+    severity = ErrorSeverity.ERROR
+    default_error_code = "VAL002"
+    _default_message = "Invalid configuration parameter provided"
+
+
+class UnsupportedStrategyException(StrategyError):
+    """Raised when a requested strategy is not supported by the system."""
+
+    severity = ErrorSeverity.ERROR
+    default_error_code = "STR002"
+    _default_message = "Requested strategy is not supported by the system"
+
+
+class InvalidConfigFormatException(ConfigurationError):
+    """Exception raised when configuration file format is invalid or unsupported."""
+
+    severity = ErrorSeverity.ERROR
+    default_error_code = "CFG003"
+    _default_message = "Configuration file has an unsupported or malformed format"
+
+
+class InvalidConfigPathException(ConfigurationError):
+    """Exception raised when configuration file path is invalid or inaccessible."""
+
+    severity = ErrorSeverity.ERROR
+    default_error_code = "CFG004"
+    _default_message = "Configuration file path does not exist or is inaccessible"
+
+
+class InvalidRunningModeException(ConfigurationError):
+    """Exception raised when invalid running mode configuration is detected."""
+
+    severity = ErrorSeverity.ERROR
+    default_error_code = "CFG005"
+    _default_message = "Streaming and batch modes cannot be enabled simultaneously"
+
+
+class BatchProcessingException(ProcessingError):
+    """Exception raised during batch processing operations."""
+
+    severity = ErrorSeverity.ERROR
+    default_error_code = "PRC002"
+    _default_message = "Batch processing configuration or operation error"
+
+
+class StreamingException(NetworkError):
+    """Exception raised during streaming operations or network connectivity issues."""
+
+    severity = ErrorSeverity.ERROR
+    default_error_code = "NET002"
+    _default_message = "Streaming configuration or connection error"
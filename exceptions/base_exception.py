@@ -1,6 +1,8 @@
 from abc import ABC
 from enum import Enum
 
+from .error_messages import ERROR_MESSAGES
+
 # Avoid importing core modules here to prevent circular import during tool scripts
 try:
     from core.error.error_context import ErrorContext
@@ -43,6 +45,10 @@ class ErrorCategory(Enum):
     NETWORK = "Network"
 
 
+# Plain-string values, looked up once instead of through the Enum descriptor
+_SEVERITY_VALUES: dict[ErrorSeverity, str] = {s: s.value for s in ErrorSeverity}
+
+
 class GenXDataError(Exception, ABC):
     """
     Abstract base exception for all GenXData errors.
@@ -51,10 +57,18 @@ class GenXDataError(Exception, ABC):
     category: ErrorCategory = ErrorCategory.SYSTEM
     severity: ErrorSeverity = ErrorSeverity.ERROR
     default_error_code: str = "GEN001"
+    # Used when neither a message nor a known error code is given
+    _default_message: str = "GenXData error occurred"
+    # Derived from ``category`` for every subclass in __init_subclass__
+    category_value: str = ErrorCategory.SYSTEM.value
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.category_value = cls.category.value
 
     def __init__(
         self,
-        message: str,
+        message: str | None = None,
         error_code: str | None = None,
         context: ErrorContext | None = None,
         severity: ErrorSeverity | None = None,
@@ -63,36 +77,61 @@ class GenXDataError(Exception, ABC):
         Initialize GenXDataError.
 
         Args:
-            message: Human-readable error message
+            message: Human-readable error message (falls back to the
+                ERROR_MESSAGES entry for error_code, then the class default)
             error_code: Unique error code string (uses default if not provided)
-            context: Optional structured context dictionary
+            context: Optional structured context dictionary (kept as None if omitted)
             severity: Error severity level (uses class default if not provided)
         """
+        message = self._resolve_message(message, error_code, self._default_message)
         super().__init__(message)
 
         self.message: str = message
         self.error_code: str = error_code or self.default_error_code
-        self.context: ErrorContext = context or {}
+        self.context: ErrorContext | None = context
         self.severity: ErrorSeverity = severity or self.severity
+        self._str: str | None = None
 
-        if isinstance(self.context, dict):
-            self.context.update(
+        # Only stamp a caller-supplied context; a bare raise allocates nothing
+        if isinstance(context, dict):
+            context.update(
                 {
-                    "error_category": self.category.value,
-                    "error_severity": self.severity.value,
+                    "error_category": self.category_value,
+                    "error_severity": _SEVERITY_VALUES[self.severity],
                 }
             )
 
+    @classmethod
+    def _resolve_message(
+        cls, message: str | None, error_code: str | None, fallback: str
+    ) -> str:
+        """
+        Pick the message for a new error.
+
+        Args:
+            message: Explicit message, used when non-empty
+            error_code: Code looked up in ERROR_MESSAGES otherwise
+            fallback: Message used when neither is available
+
+        Returns:
+            str: Resolved message
+        """
+        return message or (error_code and ERROR_MESSAGES.get(error_code)) or fallback
+
     def __str__(self) -> str:
-        """Return a formatted string representation of the error."""
-        return f"[{self.severity.value}] {self.category.value} Error [{self.error_code}]: {self.message}"
+        """Return a formatted string representation of the error (cached)."""
+        if self._str is None:
+            severity = _SEVERITY_VALUES[self.severity]
+            self._str = f"[{severity}] {self.category_value} Error [{self.error_code}]: {self.message}"
+        return self._str
 
     def __repr__(self) -> str:
         """Return a detailed string representation for debugging."""
         return (
             f"{self.__class__.__name__}(message='{self.message}', "
-            f"error_code='{self.error_code}', severity='{self.severity.value}', "
-            f"category='{self.category.value}')"
+            f"error_code='{self.error_code}', "
+            f"severity='{_SEVERITY_VALUES[self.severity]}', "
+            f"category='{self.category_value}')"
         )
 
     def is_critical(self) -> bool:
@@ -25,6 +25,19 @@ class AMQPConfig(QueueConfig):
         self.heartbeat = self.config.get("heartbeat", 60)
         self.queue_durable = self.config.get("queue_durable", True)
         self.queue_auto_delete = self.config.get("queue_auto_delete", False)
+        # Messages the producer may hold while waiting for link credit
+        self.capacity = int(self.config.get("capacity", 1000))
+        if self.capacity <= 0:
+            raise ValueError("AMQP 'capacity' must be positive")
+        # Consumer credit window and how many deliveries to accept at once
+        self.prefetch = int(self.config.get("prefetch", 500))
+        self.ack_batch = int(self.config.get("ack_batch", 100))
+        if self.prefetch <= 0 or self.ack_batch <= 0:
+            raise ValueError("AMQP 'prefetch' and 'ack_batch' must be positive")
+        # Most recent messages a consumer keeps for consume_messages()
+        self.buffer_size = int(self.config.get("buffer_size", 100_000))
+        if self.buffer_size <= 0:
+            raise ValueError("AMQP 'buffer_size' must be positive")
 
         # If credentials are embedded in URL and not provided separately, extract them
         try:
@@ -87,4 +100,8 @@ class AMQPConfig(QueueConfig):
             "heartbeat": self.heartbeat,
             "queue_durable": self.queue_durable,
             "queue_auto_delete": self.queue_auto_delete,
+            "capacity": self.capacity,
+            "prefetch": self.prefetch,
+            "ack_batch": self.ack_batch,
+            "buffer_size": self.buffer_size,
         }
@@ -1,10 +1,21 @@
 """
 AMQP consumer implementation for reading messages from the queue.
+
+The receiver keeps ``prefetch`` credits outstanding and accepts deliveries
+in groups of ``ack_batch`` (or after ``ACK_INTERVAL_SECONDS``), instead of
+one settlement per message.
+
+The connection is opened on the process-wide container thread shared with
+every other AMQP endpoint (see `messaging.amqp_container`).
+
+Received messages are kept in a ring buffer of the last ``buffer_size``
+messages. Consumers that only need the handler callback can pass
+``store_messages=False`` to skip buffering entirely.
 """
 
-import json
 import threading
 import time
+from collections import deque
 from collections.abc import Callable
 from typing import Any
 
@@ -12,33 +23,64 @@ from proton import Message
 from proton.handlers import MessagingHandler
 from proton.reactor import Container
 
+from utils.logging import Logger
+
 from .amqp_config import AMQPConfig
+from .amqp_container import SharedContainer
+from .claim_check import CLAIM_CHECK_KEY, fetch_claim_check
+from .serialization import (
+    ARROW_IPC_CONTENT_TYPE,
+    ARROW_IPC_FORMAT,
+    arrow_ipc_to_dataframe,
+    dataframe_to_records,
+    dtype_str,
+    loads_json,
+)
+
+# Longest a received delivery waits before it is accepted
+ACK_INTERVAL_SECONDS = 0.1
 
 
 class AMQPConsumer(MessagingHandler):
     """AMQP queue consumer implementation."""
 
-    def __init__(self, config: AMQPConfig, message_handler: Callable | None = None):
+    logger = Logger.get_logger("amqp_consumer")
+
+    def __init__(
+        self,
+        config: AMQPConfig,
+        message_handler: Callable | None = None,
+        store_messages: bool = True,
+    ):
         """
         Initialize AMQP consumer.
 
         Args:
             config: AMQP configuration instance
             message_handler: Optional callback function to handle received messages
+            store_messages: Keep the last ``config.buffer_size`` messages for
+                `consume_messages` to return; if False only the handler sees them
         """
-        super().__init__()
+        super().__init__(prefetch=config.prefetch, auto_accept=False)
         self.config = config
         self.message_handler = message_handler or self._default_message_handler
 
         self.conn = None
         self.receiver = None
-        self.messages = []
+        self.store_messages = store_messages
+        self.messages = deque(maxlen=config.buffer_size)
         self.running = False
 
-        # Threading for container
+        # Set on the container thread once the receiver link is open
         self.connection_ready = threading.Event()
-        self.container = None
-        self.container_thread = None
+        self._closed = threading.Event()
+
+        # Set on every message and on shutdown to wake consume_messages()
+        self._progress = threading.Event()
+
+        # Deliveries received but not yet accepted
+        self._pending_acks = []
+        self._ack_timer = None
 
         # Statistics
         self.messages_received = 0
@@ -50,15 +92,15 @@ class AMQPConsumer(MessagingHandler):
             return
 
         try:
-            print(f"🔗 Connecting to AMQP broker at {self.config.url}")
-            print(f"🔗 Queue: {self.config.queue}")
-            print(f"🔗 Username: {self.config.username}")
-
-            self.container = Container(self)
-            self.container_thread = threading.Thread(
-                target=self.container.run, daemon=True
+            self.logger.info(
+                "Connecting to AMQP broker at %s (queue: %s, username: %s)",
+                self.config.get_connection_url_masked(),
+                self.config.queue,
+                self.config.username,
             )
-            self.container_thread.start()
+
+            self.connection_ready.clear()
+            SharedContainer.call(self._open)
 
             # Wait for connection to be established
             if not self.connection_ready.wait(timeout=10):
@@ -66,10 +108,10 @@ class AMQPConsumer(MessagingHandler):
 
             self.running = True
             self.start_time = time.time()
-            print("✅ Successfully connected to AMQP broker")
+            self.logger.info("Connected to AMQP broker")
 
         except Exception as e:
-            print(f"❌ Failed to connect to AMQP broker: {e}")
+            self.logger.error("Failed to connect to AMQP broker: %s", e)
             raise
 
     def disconnect(self) -> None:
@@ -77,16 +119,16 @@ class AMQPConsumer(MessagingHandler):
         if not self.running:
             return
 
-        print("🔌 Disconnecting from AMQP broker")
+        self.logger.info("Disconnecting from AMQP broker")
         self.running = False
+        self._progress.set()
 
-        if self.conn:
-            self.conn.close()
-
-        if self.container_thread and self.container_thread.is_alive():
-            self.container_thread.join(timeout=5)
+        # Settle what was received and close, on the container thread
+        self._closed.clear()
+        SharedContainer.call(self._close)
+        self._closed.wait(timeout=5)
 
-        print("✅ Successfully disconnected from AMQP broker")
+        self.logger.info("Disconnected from AMQP broker")
 
     def consume_messages(
         self, max_messages: int | None = None, timeout: float | None = None
@@ -99,104 +141,156 @@ class AMQPConsumer(MessagingHandler):
             timeout: Timeout in seconds (None for no timeout)
 
         Returns:
-            List of received messages
+            The most recent received messages (up to ``buffer_size``), or an
+            empty list when the consumer does not store messages
         """
         if not self.running:
             self.connect()
 
-        print("📥 Starting to consume messages...")
-        if max_messages:
-            print(f"📥 Will consume up to {max_messages} messages")
-        if timeout:
-            print(f"📥 Timeout: {timeout} seconds")
+        self.logger.info(
+            "Consuming messages (max: %s, timeout: %s s)", max_messages, timeout
+        )
 
-        start_time = time.time()
+        deadline = time.monotonic() + timeout if timeout else None
 
         while self.running:
-            # Check timeout
-            if timeout and (time.time() - start_time) > timeout:
-                print(f"⏰ Timeout reached after {timeout} seconds")
-                break
-
             # Check max messages
             if max_messages and self.messages_received >= max_messages:
-                print(f"✅ Received {max_messages} messages, stopping")
+                self.logger.info("Received %d messages, stopping", max_messages)
                 break
 
-            time.sleep(0.1)  # Small sleep to prevent busy waiting
+            # Check timeout
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.logger.info("Timeout reached after %s seconds", timeout)
+                    break
+
+            # Sleep until a message arrives, the consumer stops, or time runs out
+            self._progress.wait(timeout=remaining)
+            self._progress.clear()
 
-        return self.messages.copy()
+        return list(self.messages) if self.store_messages else []
 
     def _default_message_handler(
         self, message_data: dict[str, Any], raw_message: Message
     ) -> None:
-        """Default message handler that just prints and stores messages."""
-        print(f"📨 Received message #{self.messages_received + 1}")
-        print(f"   Size: {len(str(message_data))} characters")
-
-        # Show preview of data
-        if "data" in message_data and isinstance(message_data["data"], list):
-            row_count = len(message_data["data"])
-            print(f"   Data rows: {row_count}")
-
-        if "batch_info" in message_data:
-            batch_info = message_data["batch_info"]
-            print(
-                f"   Batch: {batch_info.get('batch_index', '?')} of {batch_info.get('total_batches', '?')}"
-            )
-
-        if "timestamp" in message_data:
-            timestamp = message_data["timestamp"]
-            print(f"   Timestamp: {time.ctime(timestamp)}")
-
-    # Proton event handlers
-    def on_start(self, event):
-        """Called when the container starts."""
+        """Default message handler: log a one-line summary at DEBUG level."""
+        metadata = message_data.get("metadata") or {}
+        batch_info = message_data.get("batch_info") or {}
+        self.logger.debug(
+            "Received message #%d (rows: %s, batch: %s)",
+            self.messages_received,
+            metadata.get("rows", "?"),
+            batch_info.get("batch_index", "?"),
+        )
+
+    # Container-thread callbacks (see SharedContainer.call)
+    def _open(self, container: Container) -> None:
+        """Open this consumer's connection; the receiver follows once it is up."""
         # Use config helper to support both full URL and host:port with creds
         url = self.config.get_connection_url()
-        self.conn = event.container.connect(url)
+        self.conn = container.connect(url, handler=self)
 
+    def _close(self, _container: Container) -> None:
+        """Accept pending deliveries (so they are not redelivered), then close."""
+        try:
+            self._ack_pending()
+            if self.conn:
+                self.conn.close()
+        finally:
+            self._closed.set()
+
+    # Proton event handlers
     def on_connection_opened(self, event):
         """Called when connection is established."""
-        print("🔗 Connection established")
+        self.logger.debug("Connection established")
         self.receiver = event.container.create_receiver(self.conn, self.config.queue)
 
     def on_link_opened(self, event):
         """Called when receiver link is established."""
-        print(f"📥 Receiver link established for queue: {self.config.queue}")
+        self.logger.debug("Receiver link established for queue: %s", self.config.queue)
         self.connection_ready.set()
 
     def on_message(self, event):
         """Called when a message is received."""
         try:
             message = event.message
+            properties = message.properties or {}
 
             # Parse message body
-            if hasattr(message.body, "decode"):
-                body_str = message.body.decode("utf-8")
+            if (
+                properties.get("format") == ARROW_IPC_FORMAT
+                or message.content_type == ARROW_IPC_CONTENT_TYPE
+            ):
+                message_data = self._decode_arrow_message(message.body, properties)
             else:
-                body_str = str(message.body)
-
-            message_data = json.loads(body_str)
-
-            # Store message
-            self.messages.append(message_data)
+                body = message.body
+                if not isinstance(body, (bytes, bytearray, memoryview, str)):
+                    body = str(body)
+                message_data = loads_json(body)
+
+            # Oversized messages arrive as a reference to the stored body
+            if isinstance(message_data, dict) and CLAIM_CHECK_KEY in message_data:
+                message_data = loads_json(
+                    fetch_claim_check(message_data[CLAIM_CHECK_KEY])
+                )
+
+            if self.store_messages:
+                self.messages.append(message_data)
             self.messages_received += 1
+            self._progress.set()
 
             # Call message handler
             self.message_handler(message_data, message)
 
         except Exception as e:
-            print(f"❌ Error processing message: {e}")
+            self.logger.error("Error processing message: %s", e)
+
+        # Accept in batches; a timer settles a partial batch
+        self._pending_acks.append(event.delivery)
+        if len(self._pending_acks) >= self.config.ack_batch:
+            self._ack_pending()
+        elif self._ack_timer is None:
+            self._ack_timer = event.container.schedule(ACK_INTERVAL_SECONDS, self)
+
+    def on_timer_task(self, event):
+        """Accept deliveries left over from a partial batch."""
+        self._ack_timer = None
+        self._ack_pending()
+
+    def _ack_pending(self) -> None:
+        """Accept and settle every pending delivery."""
+        pending, self._pending_acks = self._pending_acks, []
+        for delivery in pending:
+            self.accept(delivery)
+
+    @staticmethod
+    def _decode_arrow_message(
+        body: bytes, properties: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Rebuild the JSON message shape from an Arrow IPC payload."""
+        df = arrow_ipc_to_dataframe(bytes(body))
+        return {
+            "batch_info": loads_json(properties.get("batch_info") or "{}"),
+            "data": dataframe_to_records(df),
+            "metadata": {
+                "rows": len(df),
+                "columns": list(df.columns),
+                "dtypes": {col: dtype_str(dtype) for col, dtype in df.dtypes.items()},
+            },
+        }
 
     def on_connection_error(self, event):
         """Called when connection error occurs."""
-        print(f"❌ Connection error: {event.connection.remote_condition}")
+        self.logger.error("Connection error: %s", event.connection.remote_condition)
         self.running = False
+        self._progress.set()
 
     def on_link_error(self, event):
         """Called when link error occurs."""
-        print(f"❌ Link error: {event.link.remote_condition}")
+        self.logger.error("Link error: %s", event.link.remote_condition)
 
     def get_stats(self) -> dict[str, Any]:
         """Get consumer statistics."""
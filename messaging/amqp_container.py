@@ -0,0 +1,77 @@
+"""
+Process-wide proton container shared by AMQP producers and consumers.
+
+Instead of one container thread per endpoint, every AMQP connection in the
+process is opened on one `Container` running on one daemon thread. Each
+endpoint passes itself as its connection's handler, so it still receives
+its own link and delivery events. Work that must run on the container
+thread (opening, waking and closing endpoints) is submitted with
+`SharedContainer.call`, which is safe from any thread.
+"""
+
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from proton.handlers import MessagingHandler
+from proton.reactor import ApplicationEvent, Container, EventInjector
+
+from utils.logging import Logger
+
+# Application event type carrying a callable for the container thread
+_CALL_EVENT = "genxdata_call"
+
+
+class _CallDispatcher(MessagingHandler):
+    """Global handler that runs callables submitted through `SharedContainer.call`."""
+
+    logger = Logger.get_logger("amqp_container")
+
+    def __init__(self):
+        super().__init__()
+        self.container: Container | None = None
+
+    def on_genxdata_call(self, event):
+        """Run one submitted callable; failures must not stop the shared reactor."""
+        try:
+            event.subject(self.container)
+        except Exception as e:
+            self.logger.error("AMQP container callback failed: %s", e)
+
+
+class SharedContainer:
+    """Lazily started proton container shared by every AMQP endpoint."""
+
+    _lock = threading.Lock()
+    _injector: EventInjector | None = None
+    _thread: threading.Thread | None = None
+
+    @classmethod
+    def call(cls, fn: Callable[[Container], Any]) -> None:
+        """
+        Run ``fn(container)`` on the container thread, starting it if needed.
+
+        Args:
+            fn: Callable receiving the shared `Container`
+        """
+        with cls._lock:
+            if cls._thread is None or not cls._thread.is_alive():
+                cls._start()
+            injector = cls._injector
+        injector.trigger(ApplicationEvent(_CALL_EVENT, subject=fn))
+
+    @classmethod
+    def _start(cls) -> None:
+        """Create the container and its thread (caller holds ``_lock``)."""
+        dispatcher = _CallDispatcher()
+        container = Container(dispatcher)
+        dispatcher.container = container
+
+        # The open injector keeps the reactor running between connections
+        cls._injector = EventInjector()
+        container.selectable(cls._injector)
+
+        cls._thread = threading.Thread(
+            target=container.run, name="genxdata-amqp", daemon=True
+        )
+        cls._thread.start()
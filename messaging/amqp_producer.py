@@ -1,10 +1,21 @@
 """
 AMQP producer implementation.
+
+Proton's reactor is single-threaded, so callers never touch the sender
+directly: messages go into an outbox and the shared container thread (see
+`messaging.amqp_container`) is asked to drain it. The outbox is drained
+whenever the link has credit, so several messages can be in flight instead
+of one per call. Callers block once ``capacity`` messages are waiting for
+credit.
+
+The outbox holds message bodies and properties rather than `Message`
+objects. The container thread copies each into one reusable `Message`
+just before sending it, which is safe because proton encodes the message
+during ``sender.send``.
 """
 
-import json
 import threading
-import time
+from collections import deque
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -14,7 +25,9 @@ from proton.handlers import MessagingHandler
 from proton.reactor import Container
 
 from .amqp_config import AMQPConfig
+from .amqp_container import SharedContainer
 from .base import QueueProducer
+from .serialization import dumps_json
 
 
 class AMQPProducer(QueueProducer, MessagingHandler):
@@ -33,10 +46,15 @@ class AMQPProducer(QueueProducer, MessagingHandler):
         self.conn = None
         self.sender = None
 
-        # Threading for container
+        # Set on the container thread once the link is opened (or failed)
         self.connection_ready = threading.Event()
-        self.container = None
-        self.container_thread = None
+        self._closed = threading.Event()
+
+        # (body, properties, content_type) waiting for link credit, drained
+        # on the container thread through one reused Message
+        self._outbox: deque[tuple[Any, dict[str, Any] | None, str | None]] = deque()
+        self._message = Message()
+        self._outbox_cond = threading.Condition()
 
     def connect(self) -> None:
         """Establish connection to AMQP broker."""
@@ -44,11 +62,8 @@ class AMQPProducer(QueueProducer, MessagingHandler):
             return
 
         try:
-            self.container = Container(self)
-            self.container_thread = threading.Thread(
-                target=self.container.run, daemon=True
-            )
-            self.container_thread.start()
+            self.connection_ready.clear()
+            SharedContainer.call(self._open)
 
             # Wait for connection to be established
             if not self.connection_ready.wait(timeout=10):
@@ -68,22 +83,83 @@ class AMQPProducer(QueueProducer, MessagingHandler):
             return
 
         try:
-            if self.sender:
-                self.sender.close()
-            if self.conn:
-                self.conn.close()
-
+            self.flush()
             self._connected = False
 
-            # Give the container thread a moment to clean up
-            if self.container_thread and self.container_thread.is_alive():
-                time.sleep(0.1)
+            # Close the link on the container thread and wait briefly for it
+            self._closed.clear()
+            SharedContainer.call(self._close)
+            self._closed.wait(timeout=1)
 
         except Exception:
             pass
 
+    def flush(self, timeout: float = 10.0) -> bool:
+        """
+        Wait until every queued message has been handed to the sender.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            bool: True if the outbox drained within the timeout
+        """
+        with self._outbox_cond:
+            return self._outbox_cond.wait_for(lambda: not self._outbox, timeout)
+
+    def _enqueue(
+        self,
+        body: Any,
+        properties: dict[str, Any] | None = None,
+        content_type: str | None = None,
+    ) -> None:
+        """
+        Queue a message for the container thread and wake it up.
+
+        This is the only connection check on the send path: the link can drop
+        on the container thread at any time, so it is made under the outbox
+        lock rather than up front in each ``send_*`` method.
+        """
+        with self._outbox_cond:
+            has_room = self._outbox_cond.wait_for(
+                lambda: len(self._outbox) < self.config.capacity or not self._connected,
+                timeout=10,
+            )
+            if not self._connected:
+                raise ConnectionError("AMQP connection not established")
+            if not has_room:
+                raise ConnectionError("AMQP sender has no credit; outbox is full")
+            self._outbox.append((body, properties, content_type))
+        self._wake()
+
+    def _wake(self) -> None:
+        """Ask the container thread to drain the outbox."""
+        SharedContainer.call(lambda _container: self._drain())
+
+    def _drain(self) -> None:
+        """Send queued messages while the link has credit (container thread)."""
+        sender = self.sender
+        if sender is None:
+            return
+        message = self._message
+        with self._outbox_cond:
+            sent = 0
+            while self._outbox and sender.credit > 0:
+                body, properties, content_type = self._outbox.popleft()
+                message.body = body
+                message.properties = properties
+                message.content_type = content_type
+                sender.send(message)
+                sent += 1
+            # Any freed slot releases blocked senders; flush() waits for empty
+            if sent:
+                self._outbox_cond.notify_all()
+
     def send_dataframe(
-        self, df: "pd.DataFrame", batch_info: dict[str, Any] | None = None
+        self,
+        df: "pd.DataFrame",
+        batch_info: dict[str, Any] | None = None,
+        orient: str = "records",
     ) -> None:
         """
         Send a DataFrame to the AMQP queue.
@@ -91,30 +167,20 @@ class AMQPProducer(QueueProducer, MessagingHandler):
         Args:
             df: DataFrame to send
             batch_info: Optional metadata about the batch
+            orient: Layout of the message's ``data`` field ("records" or "columns")
         """
-        if not self._connected or not self.sender:
-            raise ConnectionError("AMQP connection not established")
+        self.send_encoded(self.encode_dataframe(df, batch_info, orient))
 
-        try:
-            # Convert DataFrame to JSON message format
-            data = {
-                "batch_info": batch_info or {},
-                "data": df.to_dict(orient="records"),
-                "metadata": {
-                    "rows": len(df),
-                    "columns": list(df.columns),
-                    "dtypes": {col: str(dtype) for col, dtype in df.dtypes.items()},
-                },
-            }
-
-            message_body = json.dumps(data, default=str)
-            message = Message(body=message_body)
-
-            # Send message
-            self.sender.send(message)
+    def send_encoded(self, payload: bytes) -> None:
+        """
+        Send a JSON message produced by `encode_dataframe`.
 
-        except Exception:
-            raise
+        Args:
+            payload: Encoded JSON message (sent as a text body)
+        """
+        # Hand off to the container thread
+        payload = self._claim_check(payload)
+        self._enqueue(payload.decode("utf-8"))
 
     def send_message(self, message_data: Any) -> None:
         """
@@ -123,44 +189,68 @@ class AMQPProducer(QueueProducer, MessagingHandler):
         Args:
             message_data: Message data to send
         """
-        if not self._connected or not self.sender:
-            raise ConnectionError("AMQP connection not established")
-
         try:
             if isinstance(message_data, dict):
-                message_body = json.dumps(message_data, default=str)
+                message_body = dumps_json(message_data).decode("utf-8")
             else:
                 message_body = str(message_data)
 
-            message = Message(body=message_body)
-            self.sender.send(message)
+            self._enqueue(message_body)
 
         except Exception:
             raise
 
-    # Proton MessagingHandler methods
-    def on_start(self, event):
-        """Called when the container starts."""
+    def send_bytes(self, payload: bytes, headers: dict[str, str] | None = None) -> None:
+        """
+        Send a binary payload to the AMQP queue.
+
+        Args:
+            payload: Message body
+            headers: Optional headers, sent as application properties; a
+                ``content_type`` header sets the message's content type instead
+        """
+        properties = dict(headers or {})
+        content_type = properties.pop("content_type", None)
+        self._enqueue(payload, properties, content_type)
+
+    # Container-thread callbacks (see SharedContainer.call)
+    def _open(self, container: Container) -> None:
+        """Open this producer's connection and sender link."""
         try:
             connection_url = self.config.get_connection_url()
-            self.conn = event.container.connect(connection_url)
-            self.sender = event.container.create_sender(self.conn, self.config.queue)
+            self.conn = container.connect(connection_url, handler=self)
+            self.sender = container.create_sender(self.conn, self.config.queue)
             self._connected = True
-            self.connection_ready.set()
-
-        except Exception:
+        finally:
             self.connection_ready.set()  # Unblock waiting thread even on failure
-            raise
 
+    def _close(self, _container: Container) -> None:
+        """Close the sender link and connection."""
+        try:
+            if self.sender:
+                self.sender.close()
+            if self.conn:
+                self.conn.close()
+        finally:
+            self._closed.set()
+
+    # Proton MessagingHandler methods
     def on_sendable(self, event):
-        """Called when the sender is ready to send messages."""
-        # Messages are sent immediately via send_dataframe/send_message
-        pass
+        """Called when the sender has credit; drain the outbox."""
+        self._drain()
 
     def on_connection_error(self, event):
         """Handle connection errors."""
         self._connected = False
         self.connection_ready.set()
+        self._wake_senders()
 
     def on_link_error(self, event):
         """Handle link errors."""
+        self._connected = False
+        self._wake_senders()
+
+    def _wake_senders(self) -> None:
+        """Release callers blocked on a full outbox after the link went away."""
+        with self._outbox_cond:
+            self._outbox_cond.notify_all()
@@ -4,11 +4,27 @@ Abstract base classes for queue producers and configuration.
 Defines `QueueConfig` (validates and exposes producer config) and `QueueProducer`
 interfaces. Concrete implementations (AMQP/Kafka) should subclass these and
 provide connection lifecycle and data sending behavior.
+
+To send one DataFrame to several destinations, encode it once with
+`QueueProducer.encode_dataframe` and pass the bytes to each producer's
+`send_encoded`.
+
+With ``claim_check_dir`` in the queue config, encoded messages larger than
+``claim_check_threshold`` bytes are stored there and replaced by a small
+reference (see `messaging.claim_check`).
 """
 
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
+from .claim_check import (
+    DEFAULT_CLAIM_CHECK_THRESHOLD,
+    BlobStore,
+    FileBlobStore,
+    make_claim_check,
+)
+from .serialization import dataframe_to_json_envelope
+
 if TYPE_CHECKING:
     import pandas as pd
 
@@ -56,6 +72,16 @@ class QueueProducer(ABC):
         self.config = config
         self._connected = False
 
+        # Optional claim-check storage for oversized messages
+        options = getattr(config, "config", None) or {}
+        claim_check_dir = options.get("claim_check_dir")
+        self.blob_store: BlobStore | None = (
+            FileBlobStore(claim_check_dir) if claim_check_dir else None
+        )
+        self.claim_check_threshold = int(
+            options.get("claim_check_threshold", DEFAULT_CLAIM_CHECK_THRESHOLD)
+        )
+
     @abstractmethod
     def connect(self) -> None:
         """Establish connection to the queue system."""
@@ -68,7 +94,10 @@ class QueueProducer(ABC):
 
     @abstractmethod
     def send_dataframe(
-        self, df: "pd.DataFrame", batch_info: dict[str, Any] | None = None
+        self,
+        df: "pd.DataFrame",
+        batch_info: dict[str, Any] | None = None,
+        orient: str = "records",
     ) -> None:
         """
         Send a DataFrame to the queue.
@@ -76,6 +105,7 @@ class QueueProducer(ABC):
         Args:
             df: DataFrame to send
             batch_info: Optional metadata about the batch
+            orient: Layout of the message's ``data`` field ("records" or "columns")
         """
         pass
 
@@ -89,6 +119,60 @@ class QueueProducer(ABC):
         """
         pass
 
+    @staticmethod
+    def encode_dataframe(
+        df: "pd.DataFrame",
+        batch_info: dict[str, Any] | None = None,
+        orient: str = "records",
+    ) -> bytes:
+        """
+        Encode a DataFrame as the JSON message `send_dataframe` would send.
+
+        Args:
+            df: DataFrame to encode
+            batch_info: Optional metadata about the batch
+            orient: Layout of the message's ``data`` field ("records" or "columns")
+
+        Returns:
+            bytes: Encoded message, ready for `send_encoded`
+        """
+        return dataframe_to_json_envelope(df, batch_info, orient)
+
+    def _claim_check(self, payload: bytes) -> bytes:
+        """Swap an oversized payload for a claim-check reference, if configured."""
+        if self.blob_store is None or len(payload) <= self.claim_check_threshold:
+            return payload
+        return make_claim_check(payload, self.blob_store)
+
+    def send_encoded(self, payload: bytes) -> None:
+        """
+        Send a JSON message produced by `encode_dataframe`.
+
+        Args:
+            payload: Encoded JSON message
+
+        Raises:
+            NotImplementedError: If the producer does not support pre-encoded messages
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support pre-encoded messages"
+        )
+
+    def send_bytes(self, payload: bytes, headers: dict[str, str] | None = None) -> None:
+        """
+        Send a pre-encoded binary payload to the queue.
+
+        Args:
+            payload: Message body
+            headers: Optional string headers/properties describing the payload
+
+        Raises:
+            NotImplementedError: If the producer does not support binary payloads
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support binary payloads"
+        )
+
     @property
     def is_connected(self) -> bool:
         """Check if the producer is connected."""
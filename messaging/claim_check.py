@@ -0,0 +1,109 @@
+"""
+Claim-check storage for oversized queue messages.
+
+When an encoded message is larger than the producer's threshold, the body
+is written to a blob store and only a small reference is published:
+
+    {"claim_check": {"uri": "file:///...", "size": 1234567, "sha256": "..."}}
+
+Consumers call `fetch_claim_check` to load the original body. The built-in
+`FileBlobStore` writes to a directory (local or a shared mount); other stores
+can implement `BlobStore`.
+"""
+
+import hashlib
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+
+from .serialization import dumps_json
+
+# Key marking a message as a claim-check reference
+CLAIM_CHECK_KEY = "claim_check"
+
+# Encoded size (bytes) above which a configured store is used
+DEFAULT_CLAIM_CHECK_THRESHOLD = 1_000_000
+
+
+class BlobStore(ABC):
+    """Storage backend for claim-checked message bodies."""
+
+    @abstractmethod
+    def put(self, key: str, data: bytes) -> str:
+        """
+        Store a message body.
+
+        Args:
+            key: Unique name for the body
+            data: Encoded message body
+
+        Returns:
+            str: URI consumers can fetch the body from
+        """
+        pass
+
+
+class FileBlobStore(BlobStore):
+    """Blob store that writes bodies as files in a directory."""
+
+    def __init__(self, directory: str | Path):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Directory for stored bodies (created if missing)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def put(self, key: str, data: bytes) -> str:
+        """Write the body to ``directory/key`` and return its file URI."""
+        path = self.directory / key
+        path.write_bytes(data)
+        return path.resolve().as_uri()
+
+
+def make_claim_check(payload: bytes, store: BlobStore) -> bytes:
+    """
+    Store ``payload`` and build the reference message published in its place.
+
+    Args:
+        payload: Encoded message body
+        store: Where to put the body
+
+    Returns:
+        bytes: Encoded claim-check reference message
+    """
+    digest = hashlib.sha256(payload).hexdigest()
+    uri = store.put(f"{digest}.json", payload)
+    return dumps_json(
+        {CLAIM_CHECK_KEY: {"uri": uri, "size": len(payload), "sha256": digest}}
+    )
+
+
+def fetch_claim_check(reference: dict[str, Any]) -> bytes:
+    """
+    Load the body behind a claim-check reference.
+
+    Args:
+        reference: The message's ``claim_check`` object
+
+    Returns:
+        bytes: Original encoded message body
+
+    Raises:
+        ValueError: If the URI scheme is unsupported or the digest does not match
+    """
+    # urllib.request is slow to import and only needed by consumers
+    from urllib.request import url2pathname
+
+    parsed = urlparse(reference["uri"])
+    if parsed.scheme != "file":
+        raise ValueError(f"Unsupported claim-check URI scheme: {parsed.scheme!r}")
+
+    data = Path(url2pathname(parsed.path)).read_bytes()
+    expected = reference.get("sha256")
+    if expected and hashlib.sha256(data).hexdigest() != expected:
+        raise ValueError("Claim-check body does not match its sha256 digest")
+    return data
@@ -4,30 +4,59 @@ Factory for creating queue producers based on configuration.
 Accepts a top-level streaming config (e.g., contains `amqp` or `kafka` sections),
 instantiates the correct `QueueConfig` subclass, and returns a connected
 `QueueProducer` via the registered producer class.
+
+Built-in queue types are registered as ``"module:Class"`` paths and imported
+on first use, so importing the factory does not load proton (or any other
+backend) until that queue type is actually requested.
 """
 
+from importlib import import_module
 from typing import Any
 
-from .amqp_config import AMQPConfig
-from .amqp_producer import AMQPProducer
 from .base import QueueConfig, QueueProducer
-from .kafka_config import KafkaConfig
-from .kafka_producer import KafkaProducer
+
+# A registered class, or the "module:Class" path it is imported from
+_ClassRef = type | str
 
 
 class QueueFactory:
     """Factory class for creating queue producers and configurations."""
 
-    # Registry of available queue types
-    _config_registry = {
-        "amqp": AMQPConfig,
-        "kafka": KafkaConfig,
+    # Registry of available queue types: queue_type -> (config class, producer class);
+    # string entries are resolved and replaced by the classes on first use
+    _registry: dict[str, tuple[_ClassRef, _ClassRef]] = {
+        "amqp": (
+            "messaging.amqp_config:AMQPConfig",
+            "messaging.amqp_producer:AMQPProducer",
+        ),
+        "kafka": (
+            "messaging.kafka_config:KafkaConfig",
+            "messaging.kafka_producer:KafkaProducer",
+        ),
     }
 
-    _producer_registry = {
-        "amqp": AMQPProducer,
-        "kafka": KafkaProducer,
-    }
+    @staticmethod
+    def _resolve(ref: _ClassRef) -> type:
+        """Import a ``"module:Class"`` path; classes are returned unchanged."""
+        if isinstance(ref, type):
+            return ref
+        module_name, _, class_name = ref.partition(":")
+        return getattr(import_module(module_name), class_name)
+
+    @classmethod
+    def _lookup(cls, queue_type: str) -> tuple[type[QueueConfig], type[QueueProducer]]:
+        """Return the registered classes for `queue_type` or raise ValueError."""
+        entry = cls._registry.get(queue_type)
+        if entry is None:
+            available_types = ", ".join(cls._registry)
+            raise ValueError(
+                f"Unsupported queue type '{queue_type}'. Available types: {available_types}"
+            )
+        config_ref, producer_ref = entry
+        if isinstance(config_ref, str) or isinstance(producer_ref, str):
+            entry = (cls._resolve(config_ref), cls._resolve(producer_ref))
+            cls._registry[queue_type] = entry
+        return entry
 
     @classmethod
     def create_config(cls, queue_type: str, config_data: dict[str, Any]) -> QueueConfig:
@@ -44,13 +73,7 @@ class QueueFactory:
         Raises:
             ValueError: If queue type is not supported
         """
-        if queue_type not in cls._config_registry:
-            available_types = ", ".join(cls._config_registry.keys())
-            raise ValueError(
-                f"Unsupported queue type '{queue_type}'. Available types: {available_types}"
-            )
-
-        config_class = cls._config_registry[queue_type]
+        config_class, _producer_class = cls._lookup(queue_type)
         return config_class(config_data)
 
     @classmethod
@@ -67,15 +90,7 @@ class QueueFactory:
         Raises:
             ValueError: If queue type is not supported
         """
-        queue_type = config.queue_type
-
-        if queue_type not in cls._producer_registry:
-            available_types = ", ".join(cls._producer_registry.keys())
-            raise ValueError(
-                f"Unsupported queue type '{queue_type}'. Available types: {available_types}"
-            )
-
-        producer_class = cls._producer_registry[queue_type]
+        _config_class, producer_class = cls._lookup(config.queue_type)
         return producer_class(config)
 
     @classmethod
@@ -92,26 +107,17 @@ class QueueFactory:
         Raises:
             ValueError: If configuration is invalid or queue type not supported
         """
-        # Determine queue type from config keys
-        queue_type = None
-        queue_config_data = None
-
-        if "amqp" in stream_config:
-            queue_type = "amqp"
-            queue_config_data = stream_config["amqp"]
-        elif "kafka" in stream_config:
-            queue_type = "kafka"
-            queue_config_data = stream_config["kafka"]
-        else:
-            available_types = ", ".join(cls._config_registry.keys())
-            raise ValueError(
-                f"No supported queue configuration found in stream config. "
-                f"Expected one of: {available_types}"
-            )
-
-        # Create config and producer
-        config = cls.create_config(queue_type, queue_config_data)
-        return cls.create_producer(config)
+        # Use the first registered queue type present in the config
+        for queue_type in cls._registry:
+            if queue_type in stream_config:
+                config_class, producer_class = cls._lookup(queue_type)
+                return producer_class(config_class(stream_config[queue_type]))
+
+        available_types = ", ".join(cls._registry)
+        raise ValueError(
+            f"No supported queue configuration found in stream config. "
+            f"Expected one of: {available_types}"
+        )
 
     @classmethod
     def register_queue_type(
@@ -134,10 +140,9 @@ class QueueFactory:
         if not issubclass(producer_class, QueueProducer):
             raise TypeError("Producer class must inherit from QueueProducer")
 
-        cls._config_registry[queue_type] = config_class
-        cls._producer_registry[queue_type] = producer_class
+        cls._registry[queue_type] = (config_class, producer_class)
 
     @classmethod
     def get_supported_queue_types(cls) -> list:
         """Get list of supported queue types."""
-        return list(cls._config_registry.keys())
+        return list(cls._registry)
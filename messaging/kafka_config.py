@@ -3,12 +3,36 @@ Kafka-specific configuration implementation.
 
 Validates minimal required parameters for producing messages and exposes a
 producer-friendly configuration dictionary.
+
+Defaults favour throughput: records linger up to ``DEFAULT_LINGER_MS`` to
+fill ``DEFAULT_BATCH_SIZE`` batches, which are compressed (lz4 when the
+``lz4`` package is installed, gzip otherwise). Latency-sensitive callers can
+set ``linger_ms: 0`` and ``compression_type: none``.
+
+``backend`` selects the client library: ``kafka-python`` (the default) or
+``confluent`` (confluent-kafka, which wraps librdkafka). Each backend gets
+its own spelling of the same settings from `get_producer_config` or
+`get_confluent_config`.
 """
 
+from importlib.util import find_spec
 from typing import Any
 
 from .base import QueueConfig
 
+DEFAULT_BATCH_SIZE = 128 * 1024
+DEFAULT_LINGER_MS = 20
+
+# Supported values for the ``backend`` option
+KAFKA_BACKENDS = ("kafka-python", "confluent")
+
+
+def _default_compression_type(backend: str) -> str:
+    """Prefer lz4, which kafka-python only supports with the lz4 package."""
+    if backend == "confluent" or find_spec("lz4") is not None:
+        return "lz4"
+    return "gzip"
+
 
 class KafkaConfig(QueueConfig):
     """Configuration class for Kafka queue connections."""
@@ -26,13 +50,31 @@ class KafkaConfig(QueueConfig):
         self.topic = self.config["topic"]
 
         # Optional parameters with defaults
+        self.backend = str(self.config.get("backend", "kafka-python")).lower()
+        if self.backend not in KAFKA_BACKENDS:
+            raise ValueError(
+                f"Kafka 'backend' must be one of: {', '.join(KAFKA_BACKENDS)}"
+            )
         self.client_id = self.config.get("client_id", "genxdata-producer")
         self.acks = self.config.get("acks", "all")
         self.retries = self.config.get("retries", 3)
-        self.batch_size = self.config.get("batch_size", 16384)
-        self.linger_ms = self.config.get("linger_ms", 0)
+        self.batch_size = self.config.get("batch_size", DEFAULT_BATCH_SIZE)
+        self.linger_ms = self.config.get("linger_ms", DEFAULT_LINGER_MS)
         self.buffer_memory = self.config.get("buffer_memory", 33554432)
-        self.compression_type = self.config.get("compression_type", "none")
+        self.compression_type = self.config.get("compression_type")
+        # Unacknowledged sends allowed before send_* blocks (not a client option)
+        self.max_in_flight = int(self.config.get("max_in_flight", 1000))
+        if self.max_in_flight <= 0:
+            raise ValueError("Kafka 'max_in_flight' must be positive")
+        if self.compression_type is None:
+            self.compression_type = _default_compression_type(self.backend)
+
+        # Split each DataFrame into this many keyed messages (1 = one message)
+        self.num_partitions = int(self.config.get("num_partitions", 1))
+        if self.num_partitions <= 0:
+            raise ValueError("Kafka 'num_partitions' must be positive")
+        # Column whose hashed values choose each row's message; None = by position
+        self.partition_key_column = self.config.get("partition_key_column")
 
         # Security settings
         self.security_protocol = self.config.get("security_protocol", "PLAINTEXT")
@@ -66,7 +108,10 @@ class KafkaConfig(QueueConfig):
             "batch_size": self.batch_size,
             "linger_ms": self.linger_ms,
             "buffer_memory": self.buffer_memory,
-            "compression_type": self.compression_type,
+            # kafka-python spells "no compression" as None
+            "compression_type": (
+                None if self.compression_type == "none" else self.compression_type
+            ),
             "security_protocol": self.security_protocol,
         }
 
@@ -87,3 +132,35 @@ class KafkaConfig(QueueConfig):
             config["ssl_keyfile"] = self.ssl_keyfile
 
         return config
+
+    def get_confluent_config(self) -> dict[str, Any]:
+        """Get the same producer settings as librdkafka properties for confluent-kafka."""
+        config = {
+            "bootstrap.servers": ",".join(self.bootstrap_servers),
+            "client.id": self.client_id,
+            "acks": str(self.acks),
+            "retries": self.retries,
+            "batch.size": self.batch_size,
+            "linger.ms": self.linger_ms,
+            "queue.buffering.max.kbytes": max(1, self.buffer_memory // 1024),
+            "compression.type": self.compression_type,
+            "security.protocol": self.security_protocol,
+        }
+
+        # Add SASL settings if provided
+        if self.sasl_mechanism:
+            config["sasl.mechanism"] = self.sasl_mechanism
+            if self.sasl_username:
+                config["sasl.username"] = self.sasl_username
+            if self.sasl_password:
+                config["sasl.password"] = self.sasl_password
+
+        # Add SSL settings if provided
+        if self.ssl_cafile:
+            config["ssl.ca.location"] = self.ssl_cafile
+        if self.ssl_certfile:
+            config["ssl.certificate.location"] = self.ssl_certfile
+        if self.ssl_keyfile:
+            config["ssl.key.location"] = self.ssl_keyfile
+
+        return config
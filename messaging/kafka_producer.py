@@ -1,8 +1,32 @@
 """
 Kafka producer implementation.
+
+Sends are asynchronous: each record's delivery future reports back through
+callbacks, at most ``max_in_flight`` records are unacknowledged at a time,
+and a failed delivery is raised from the next send or from `await_all`.
+
+The connection check is made once, in `connect`: it binds the client's
+send path onto the instance, and `disconnect` removes it again, so the
+per-record path has no guard of its own.
+
+With ``num_partitions`` above 1, `send_dataframe` splits each DataFrame
+into that many messages and sends part ``n`` to partition ``n`` (keyed by
+its part number), so the parts are spread over the topic's partitions
+(and leaders); the topic needs at least ``num_partitions`` partitions.
+Rows are assigned by a stable hash of ``partition_key_column``, which
+keeps every row for a given key in the same part; without a key column
+the frame is cut into contiguous chunks.
+
+With ``backend: confluent`` the librdkafka-based confluent-kafka client is
+wrapped by `_ConfluentClient`, which presents the small part of the
+kafka-python API this producer uses (``send`` returning a future,
+``flush`` and ``close``) plus ``poll``. librdkafka only runs delivery
+callbacks inside ``poll``/``flush``, so a send waiting for an in-flight
+slot keeps polling while it waits.
 """
 
-import json
+import threading
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -10,6 +34,99 @@ if TYPE_CHECKING:
 
 from .base import QueueProducer
 from .kafka_config import KafkaConfig
+from .serialization import dumps_json
+
+
+def _serialize_value(value: Any) -> bytes:
+    """Encode a record value as JSON; pre-encoded payloads pass through."""
+    return value if isinstance(value, bytes) else dumps_json(value)
+
+
+class _DeliveryFuture:
+    """Future-like delivery report for one confluent-kafka record."""
+
+    __slots__ = ("_callbacks", "_errbacks")
+
+    def __init__(self):
+        self._callbacks: list[Callable[[Any], Any]] = []
+        self._errbacks: list[Callable[[Exception], Any]] = []
+
+    def add_callback(self, fn: Callable[[Any], Any]) -> "_DeliveryFuture":
+        self._callbacks.append(fn)
+        return self
+
+    def add_errback(self, fn: Callable[[Exception], Any]) -> "_DeliveryFuture":
+        self._errbacks.append(fn)
+        return self
+
+    def on_delivery(self, err: Any, msg: Any) -> None:
+        """confluent-kafka delivery callback."""
+        if err is None:
+            for fn in self._callbacks:
+                fn(msg)
+        else:
+            exc = err if isinstance(err, Exception) else RuntimeError(str(err))
+            for fn in self._errbacks:
+                fn(exc)
+
+
+class _ConfluentClient:
+    """Adapter giving a confluent-kafka ``Producer`` the kafka-python API used here."""
+
+    def __init__(self, producer: Any):
+        """
+        Initialize the adapter.
+
+        Args:
+            producer: confluent_kafka.Producer instance
+        """
+        self._producer = producer
+
+    def send(
+        self,
+        topic: str,
+        value: Any = None,
+        key: bytes | None = None,
+        headers: list[tuple[str, bytes]] | None = None,
+        partition: int | None = None,
+    ) -> _DeliveryFuture:
+        """
+        Queue one record and return its delivery future.
+
+        Delivery reports for earlier records are served first, so callbacks
+        attached to the returned future never miss their report.
+        """
+        self._producer.poll(0)
+        future = _DeliveryFuture()
+        payload = _serialize_value(value)
+        # librdkafka's partitioner picks the partition unless one is given
+        extra = {} if partition is None else {"partition": partition}
+        while True:
+            try:
+                self._producer.produce(
+                    topic,
+                    value=payload,
+                    key=key,
+                    headers=headers,
+                    on_delivery=future.on_delivery,
+                    **extra,
+                )
+                return future
+            except BufferError:
+                # librdkafka's local queue is full; wait for deliveries
+                self._producer.poll(0.1)
+
+    def poll(self, timeout: float = 0) -> None:
+        """Serve delivery reports for records acknowledged so far."""
+        self._producer.poll(timeout)
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Wait for outstanding deliveries."""
+        self._producer.flush(-1 if timeout is None else timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Flush; confluent-kafka producers have no separate close."""
+        self.flush(timeout)
 
 
 class KafkaProducer(QueueProducer):
@@ -25,24 +142,36 @@ class KafkaProducer(QueueProducer):
         super().__init__(config)
         self.producer = None
 
+        # Delivery tracking for asynchronous sends
+        self._inflight = threading.BoundedSemaphore(config.max_in_flight)
+        self._send_error: Exception | None = None
+
     def connect(self) -> None:
         """Establish connection to Kafka cluster."""
         if self._connected:
             return
 
+        if self.config.backend == "confluent":
+            try:
+                from confluent_kafka import Producer
+            except ImportError as e:
+                raise ImportError(
+                    f"Kafka library not available. Install confluent-kafka: {e}"
+                ) from e
+
+            self._attach(_ConfluentClient(Producer(self.config.get_confluent_config())))
+            return
+
         try:
             # Import kafka-python here to make it optional
             from kafka import KafkaProducer as KafkaClient
 
             producer_config = self.config.get_producer_config()
 
-            # Add value serializer for JSON
-            producer_config["value_serializer"] = lambda v: json.dumps(
-                v, default=str
-            ).encode("utf-8")
+            # Add value serializer for JSON; pre-encoded payloads pass through
+            producer_config["value_serializer"] = _serialize_value
 
-            self.producer = KafkaClient(**producer_config)
-            self._connected = True
+            self._attach(KafkaClient(**producer_config))
 
         except ImportError as e:
             raise ImportError(
@@ -62,12 +191,16 @@ class KafkaProducer(QueueProducer):
             self.producer.close(timeout=10)
 
             self._connected = False
+            self.__dict__.pop("_send", None)
 
         except Exception:
             pass
 
     def send_dataframe(
-        self, df: "pd.DataFrame", batch_info: dict[str, Any] | None = None
+        self,
+        df: "pd.DataFrame",
+        batch_info: dict[str, Any] | None = None,
+        orient: str = "records",
     ) -> None:
         """
         Send a DataFrame to the Kafka topic.
@@ -75,27 +208,49 @@ class KafkaProducer(QueueProducer):
         Args:
             df: DataFrame to send
             batch_info: Optional metadata about the batch
+            orient: Layout of the message's ``data`` field ("records" or "columns")
         """
-        if not self._connected or not self.producer:
-            raise ConnectionError("Kafka connection not established")
+        if self.config.num_partitions == 1:
+            self.send_encoded(self.encode_dataframe(df, batch_info, orient))
+            return
 
-        try:
-            # Convert DataFrame to message format
-            message_data = {
-                "batch_info": batch_info or {},
-                "data": df.to_dict(orient="records"),
-                "metadata": {
-                    "rows": len(df),
-                    "columns": list(df.columns),
-                    "dtypes": {col: str(dtype) for col, dtype in df.dtypes.items()},
-                },
-            }
-
-            # Send message to Kafka topic
-            self.producer.send(self.config.topic, value=message_data)
+        for part, sub in self._split_dataframe(df):
+            part_info = {**(batch_info or {}), "partition_key": part}
+            payload = self._claim_check(self.encode_dataframe(sub, part_info, orient))
+            self._send(payload, key=str(part).encode("ascii"), partition=part)
 
-        except Exception:
-            raise
+    def _split_dataframe(self, df: "pd.DataFrame") -> list[tuple[int, "pd.DataFrame"]]:
+        """
+        Split ``df`` into at most ``num_partitions`` non-empty parts.
+
+        Returns:
+            list[tuple[int, DataFrame]]: (part number, rows) pairs
+        """
+        import numpy as np
+        import pandas as pd
+
+        n = self.config.num_partitions
+        column = self.config.partition_key_column
+        if column is None:
+            chunks = np.array_split(np.arange(len(df)), n)
+            return [
+                (part, df.iloc[rows[0] : rows[-1] + 1])
+                for part, rows in enumerate(chunks)
+                if len(rows)
+            ]
+
+        # hash_pandas_object uses a fixed key, so parts are stable across runs
+        parts = pd.util.hash_pandas_object(df[column], index=False).to_numpy() % n
+        return [(int(part), sub) for part, sub in df.groupby(parts, sort=True)]
+
+    def send_encoded(self, payload: bytes) -> None:
+        """
+        Send a JSON message produced by `encode_dataframe`.
+
+        Args:
+            payload: Encoded JSON message
+        """
+        self._send(self._claim_check(payload))
 
     def send_message(self, message_data: Any) -> None:
         """
@@ -104,22 +259,107 @@ class KafkaProducer(QueueProducer):
         Args:
             message_data: Message data to send
         """
-        if not self._connected or not self.producer:
-            raise ConnectionError("Kafka connection not established")
+        self._send(message_data)
 
-        try:
-            # Send message to Kafka topic
-            self.producer.send(self.config.topic, value=message_data)
+    def send_bytes(self, payload: bytes, headers: dict[str, str] | None = None) -> None:
+        """
+        Send a binary payload to the Kafka topic.
+
+        Args:
+            payload: Message value
+            headers: Optional headers, sent as Kafka record headers
+        """
+        record_headers = [(k, v.encode("utf-8")) for k, v in (headers or {}).items()]
+        self._send(payload, record_headers)
+
+    def _attach(self, client: Any) -> None:
+        """Mark the producer connected through ``client`` and enable sends."""
+        self.producer = client
+        self._connected = True
+        self._send = self._send_connected
+
+    def _send(
+        self,
+        value: Any,
+        headers: list[tuple[str, bytes]] | None = None,
+        key: bytes | None = None,
+        partition: int | None = None,
+    ) -> None:
+        """Send path before `connect` (and after `disconnect`): always fails."""
+        raise ConnectionError("Kafka connection not established")
 
+    def _send_connected(
+        self,
+        value: Any,
+        headers: list[tuple[str, bytes]] | None = None,
+        key: bytes | None = None,
+        partition: int | None = None,
+    ) -> None:
+        """Send one record without waiting for the broker's acknowledgement."""
+        self._raise_send_error()
+        self._acquire_slot()
+        try:
+            future = self.producer.send(
+                self.config.topic,
+                value=value,
+                key=key,
+                headers=headers,
+                partition=partition,
+            )
         except Exception:
+            self._inflight.release()
             raise
+        future.add_callback(self._on_send_success)
+        future.add_errback(self._on_send_error)
 
-    def flush(self, timeout: int = 10) -> None:
+    def _acquire_slot(self) -> None:
+        """
+        Wait for a free in-flight slot.
+
+        Clients with a ``poll`` method (the confluent adapter) only report
+        deliveries, and so free slots, while polled; kafka-python reports
+        them from its own I/O thread.
+        """
+        poll = getattr(self.producer, "poll", None)
+        while not self._inflight.acquire(timeout=0.1):
+            if poll is not None:
+                poll(0)
+
+    def _on_send_success(self, _record_metadata: Any) -> None:
+        """Delivery callback: free an in-flight slot."""
+        self._inflight.release()
+
+    def _on_send_error(self, exc: Exception) -> None:
+        """Delivery errback: remember the first failure and free the slot."""
+        if self._send_error is None:
+            self._send_error = exc
+        self._inflight.release()
+
+    def _raise_send_error(self) -> None:
+        """Raise (once) a delivery failure reported since the last check."""
+        error, self._send_error = self._send_error, None
+        if error is not None:
+            raise error
+
+    def await_all(self, timeout: float = 10) -> None:
         """
-        Flush any pending messages.
+        Wait for every in-flight record to be acknowledged.
 
         Args:
             timeout: Timeout in seconds
+
+        Raises:
+            Exception: The first delivery failure reported by the client
         """
         if self.producer:
             self.producer.flush(timeout=timeout)
+        self._raise_send_error()
+
+    def flush(self, timeout: int = 10) -> None:
+        """
+        Flush any pending messages (same as `await_all`).
+
+        Args:
+            timeout: Timeout in seconds
+        """
+        self.await_all(timeout)
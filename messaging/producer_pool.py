@@ -0,0 +1,96 @@
+"""
+Process-wide pool of connected queue producers.
+
+Writers that target the same queue configuration share one connected
+`QueueProducer` instead of opening a connection each. Entries are
+reference-counted: `acquire` connects on first use, `release` disconnects
+when the last user lets go, and any producers still open at interpreter
+exit are disconnected by an `atexit` hook.
+"""
+
+import atexit
+import json
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from .base import QueueProducer
+
+
+class ProducerPool:
+    """Reference-counted registry of connected producers keyed by config."""
+
+    # key -> [producer, reference count]
+    _entries: dict[str, list[Any]] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def make_key(queue_config: dict[str, Any]) -> str:
+        """
+        Build a pool key from a normalized queue configuration.
+
+        Args:
+            queue_config: Normalized config, e.g. {"amqp": {...}}
+
+        Returns:
+            str: Stable key for equal configurations
+        """
+        return json.dumps(queue_config, sort_keys=True, default=str)
+
+    @classmethod
+    def acquire(cls, key: str, factory: Callable[[], QueueProducer]) -> QueueProducer:
+        """
+        Get the pooled producer for `key`, creating it with `factory` if needed.
+
+        Args:
+            key: Pool key (see `make_key`)
+            factory: Callable returning a connected producer
+
+        Returns:
+            QueueProducer: Shared, connected producer
+        """
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                entry = [factory(), 0]
+                cls._entries[key] = entry
+            entry[1] += 1
+            return entry[0]
+
+    @classmethod
+    def release(cls, key: str) -> bool:
+        """
+        Release one reference to the producer for `key`.
+
+        Args:
+            key: Pool key passed to `acquire`
+
+        Returns:
+            bool: True if this was the last reference and the producer was
+            disconnected
+        """
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                return False
+            entry[1] -= 1
+            if entry[1] > 0:
+                return False
+            del cls._entries[key]
+        entry[0].disconnect()
+        return True
+
+    @classmethod
+    def drain(cls) -> None:
+        """Disconnect and forget every pooled producer."""
+        with cls._lock:
+            entries = list(cls._entries.values())
+            cls._entries.clear()
+        for producer, _refs in entries:
+            try:
+                producer.disconnect()
+            except Exception:
+                pass
+
+
+atexit.register(ProducerPool.drain)
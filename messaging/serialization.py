@@ -0,0 +1,293 @@
+"""
+Binary DataFrame payloads for queue producers and consumers.
+
+DataFrames are encoded as a single Arrow IPC stream whose buffers are
+zstd-compressed by Arrow itself, so no separate compression library is
+needed. pyarrow is imported on use; callers should check
+`arrow_available()` and fall back to JSON payloads when it is missing.
+
+JSON DataFrame messages share one envelope (`dataframe_to_json_envelope`):
+``batch_info``, ``data`` and ``metadata``. ``data`` is a list of row objects
+(``orient="records"``, the default) or a mapping of column name to values
+(``orient="columns"``), which skips building a dict per row.
+
+JSON envelopes and metadata headers are encoded by `dumps_json` and decoded
+by `loads_json`, which use orjson when it is installed and the standard
+library otherwise.
+"""
+
+import json
+from collections.abc import Callable
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+# Header values identifying an Arrow payload on the wire
+ARROW_IPC_FORMAT = "arrow-ipc"
+ARROW_IPC_CODEC = "zstd"
+ARROW_IPC_CONTENT_TYPE = "application/vnd.apache.arrow.stream"
+
+# Supported layouts for the ``data`` field of JSON DataFrame messages
+JSON_ORIENTS = ("records", "columns")
+
+# dtype kinds orjson can serialize straight from the numpy buffer
+_NUMPY_NATIVE_KINDS = frozenset("iufb")
+
+
+def dumps_json(obj: Any) -> bytes:
+    """
+    Encode a message envelope or header value as UTF-8 JSON.
+
+    Values JSON cannot represent natively are stringified, as with
+    ``json.dumps(default=str)``. With orjson, numpy scalars are written as
+    numbers and NaN as null.
+
+    Args:
+        obj: JSON-compatible object
+
+    Returns:
+        bytes: Encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(obj, default=str).encode("utf-8")
+
+
+def _column_values(col: "pd.Series") -> Any:
+    """
+    Return a column's values in a form `dumps_json` can encode.
+
+    Numeric numpy columns are passed to orjson as arrays. Extension dtypes
+    (``Int64``, ``boolean``, ...) report numeric kinds too, but their
+    ``to_numpy`` turns missing values into NaN and integers into floats, so
+    they are boxed like ``to_dict`` boxes them: native values, None for NA.
+    """
+    import numpy as np
+
+    if not isinstance(col.dtype, np.dtype):
+        return col.astype(object).where(col.notna(), None).tolist()
+    if orjson is not None and col.dtype.kind in _NUMPY_NATIVE_KINDS:
+        return col.to_numpy()
+    return col.tolist()
+
+
+def dataframe_to_records(df: "pd.DataFrame") -> list[dict[Any, Any]]:
+    """
+    Build ``df.to_dict(orient="records")`` from whole-column lists.
+
+    Each column is converted with one ``tolist`` call and rows are zipped
+    together, instead of boxing values row by row as ``to_dict`` does.
+    Frames with no columns, duplicate column names or extension dtypes
+    (whose missing values ``to_dict`` maps to None) use ``to_dict`` itself.
+
+    Args:
+        df: DataFrame to convert
+
+    Returns:
+        list[dict]: One dict per row, equal to ``df.to_dict(orient="records")``
+    """
+    import numpy as np
+
+    if (
+        df.columns.empty
+        or not df.columns.is_unique
+        or not all(isinstance(dtype, np.dtype) for dtype in df.dtypes)
+    ):
+        return df.to_dict(orient="records")
+
+    columns = list(df.columns)
+    values = [col.tolist() for _name, col in df.items()]
+    return [dict(zip(columns, row, strict=True)) for row in zip(*values, strict=True)]
+
+
+def dataframe_to_json_envelope(
+    df: "pd.DataFrame",
+    batch_info: dict[str, Any] | None = None,
+    orient: str = "records",
+) -> bytes:
+    """
+    Encode a DataFrame as the JSON message envelope sent by producers.
+
+    Args:
+        df: DataFrame to send
+        batch_info: Optional metadata about the batch
+        orient: Layout of ``data``; one of `JSON_ORIENTS`
+
+    Returns:
+        bytes: Encoded JSON envelope
+
+    Raises:
+        ValueError: If ``orient`` is not supported
+    """
+    if orient == "records":
+        data: Any = dataframe_to_records(df)
+    elif orient == "columns":
+        data = {str(name): _column_values(col) for name, col in df.items()}
+    else:
+        raise ValueError(f"orient must be one of: {', '.join(JSON_ORIENTS)}")
+
+    return b"".join(
+        (
+            b'{"batch_info":',
+            dumps_json(batch_info or {}),
+            b',"data":',
+            dumps_json(data),
+            b',"metadata":{"rows":',
+            str(len(df)).encode(),
+            _schema_fragment(tuple(df.columns), tuple(df.dtypes), orient),
+            b"}}",
+        )
+    )
+
+
+@lru_cache(maxsize=256)
+def dtype_str(dtype: Any) -> str:
+    """
+    Return ``str(dtype)``, cached per dtype.
+
+    ``str`` on a numpy dtype goes through its ``__repr__`` machinery; the
+    handful of dtypes a stream uses are formatted once. The cache is keyed
+    on the dtype itself (dtypes are hashable), not ``id``, so a collected
+    dtype can never alias another.
+    """
+    return str(dtype)
+
+
+@lru_cache(maxsize=128)
+def _schema_fragment(columns: tuple, dtypes: tuple, orient: str) -> bytes:
+    """
+    Encode the per-schema part of the envelope ``metadata`` object.
+
+    Streams usually send the same schema batch after batch, so the
+    ``columns``/``dtypes``/``orient`` keys are encoded once and reused.
+
+    Returns:
+        bytes: ``,"columns":...,"dtypes":...,"orient":...`` without braces
+    """
+    encoded = dumps_json(
+        {
+            "columns": list(columns),
+            "dtypes": {
+                col: dtype_str(dtype)
+                for col, dtype in zip(columns, dtypes, strict=True)
+            },
+            "orient": orient,
+        }
+    )
+    return b"," + encoded.strip()[1:-1]
+
+
+def loads_json(data: bytes | bytearray | memoryview | str) -> Any:
+    """
+    Decode a JSON message body or header value.
+
+    Bytes are parsed directly, without decoding to ``str`` first. Documents
+    orjson rejects (such as the ``NaN`` tokens the standard library emits)
+    are parsed with the standard library instead.
+
+    Args:
+        data: UTF-8 JSON bytes (or a buffer over them) or text
+
+    Returns:
+        Any: Decoded object
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def arrow_available() -> bool:
+    """Return True if pyarrow can be imported."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def dataframe_to_arrow_ipc(df: "pd.DataFrame", codec: str = ARROW_IPC_CODEC) -> bytes:
+    """
+    Encode a DataFrame as one compressed Arrow IPC stream.
+
+    Args:
+        df: DataFrame to encode (the index is not preserved)
+        codec: Arrow buffer compression codec
+
+    Returns:
+        bytes: Arrow IPC stream
+    """
+    import pyarrow as pa
+
+    batch = pa.RecordBatch.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    options = pa.ipc.IpcWriteOptions(compression=codec)
+    with pa.ipc.new_stream(sink, batch.schema, options=options) as writer:
+        writer.write_batch(batch)
+    return sink.getvalue().to_pybytes()
+
+
+def compile_arrow_encoder(
+    df: "pd.DataFrame", codec: str = ARROW_IPC_CODEC
+) -> Callable[["pd.DataFrame"], bytes] | None:
+    """
+    Build an Arrow IPC encoder specialized to the schema of `df`.
+
+    The Arrow schema and write options are resolved once, so each call only
+    converts columns instead of re-inferring types. Frames whose values do
+    not fit the captured schema raise ``ValueError``/``TypeError``.
+
+    Args:
+        df: Sample frame whose columns and dtypes fix the schema
+        codec: Arrow buffer compression codec
+
+    Returns:
+        Callable | None: Encoder with the same output as
+        `dataframe_to_arrow_ipc`, or None when a column's type cannot be
+        inferred from the sample (e.g. all values missing)
+    """
+    import pyarrow as pa
+
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    if any(pa.types.is_null(field.type) for field in schema):
+        return None
+    options = pa.ipc.IpcWriteOptions(compression=codec)
+
+    def encode(frame: "pd.DataFrame") -> bytes:
+        batch = pa.RecordBatch.from_pandas(frame, schema=schema, preserve_index=False)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, schema, options=options) as writer:
+            writer.write_batch(batch)
+        return sink.getvalue().to_pybytes()
+
+    return encode
+
+
+def arrow_ipc_to_dataframe(payload: bytes) -> "pd.DataFrame":
+    """
+    Decode an Arrow IPC stream produced by `dataframe_to_arrow_ipc`.
+
+    Args:
+        payload: Arrow IPC stream bytes
+
+    Returns:
+        pd.DataFrame: Decoded frame
+    """
+    import pyarrow as pa
+
+    return pa.ipc.open_stream(payload).read_pandas()
@@ -1,7 +1,10 @@
 from typing import Any
 
+import pytest
+
 from core.base_strategy import BaseStrategy
 from core.strategy_factory import StrategyFactory
+from exceptions.param_exceptions import InvalidConfigParamException
 from utils.logging import Logger
 
 
@@ -16,21 +19,24 @@ class MockBaseStrategy(BaseStrategy):
         return self.strategy_state
 
 
+# One factory for every test; strategies it creates are still independent
+_FACTORY = StrategyFactory(logger=Logger.get_logger("tests.strategies"))
+
+
 def create_strategy_via_factory(
     *,
-    mode: str,
     strategy_name: str,
-    df,
-    col_name: str,
     rows: int,
     params: dict,
+    mode: str = "NORMAL",
+    df=None,
+    col_name: str = "col",
     intermediate: bool = False,
     unique: bool = False,
     strategy_state: dict | None = None,
     mask: str | None = None,
 ):
-    factory = StrategyFactory(logger=Logger.get_logger("tests.strategies"))
-    return factory.create_strategy(
+    return _FACTORY.create_strategy(
         mode,
         strategy_name,
         df=df,
@@ -42,3 +48,14 @@ def create_strategy_via_factory(
         strategy_state=strategy_state or {},
         mask=mask,
     )
+
+
+def expect_invalid_config(strategy_name: str, params: dict, match: str | None = None):
+    """
+    Assert that building ``strategy_name`` with ``params`` is rejected.
+
+    Strategies are not cached between calls: a failed construction leaves
+    nothing to reuse, and each error case uses different params anyway.
+    """
+    with pytest.raises(InvalidConfigParamException, match=match):
+        create_strategy_via_factory(strategy_name=strategy_name, rows=1, params=params)
@@ -4,7 +4,8 @@ import pytest
 from tests.strategies.base import create_strategy_via_factory
 
 
-@pytest.fixture
+# Read-only inputs, built once per module
+@pytest.fixture(scope="module")
 def sample_df():
     return pd.DataFrame(
         {"first_name": ["John", "Jane", "Peter"], "last_name": ["Doe", "Doe", "Jones"]}
@@ -16,7 +17,6 @@ def test_concat_strategy_concatenates_columns(sample_df):
     Tests if the MockConcatStrategy correctly concatenates two columns.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="CONCAT_STRATEGY",
         df=sample_df,
         col_name="out",
@@ -33,7 +33,6 @@ def test_concat_strategy_with_prefix_and_suffix(sample_df):
     Tests if the MockConcatStrategy correctly adds a prefix and suffix.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="CONCAT_STRATEGY",
         df=sample_df,
         col_name="out",
@@ -56,9 +55,7 @@ def test_concat_strategy_missing_lhs_col_uses_rhs_only():
     With factory defaults, missing lhs_col is allowed if rhs_col present.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="CONCAT_STRATEGY",
-        df=None,
         col_name="out",
         rows=3,
         params={"rhs_col": "last_name"},
@@ -72,9 +69,7 @@ def test_concat_strategy_missing_rhs_col_uses_lhs_only():
     With factory defaults, missing rhs_col is allowed if lhs_col present.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="CONCAT_STRATEGY",
-        df=None,
         col_name="out",
         rows=3,
         params={"lhs_col": "first_name"},
@@ -91,7 +86,6 @@ def test_concat_strategy_with_non_string_columns(sample_df):
     """
     sample_df["number"] = [1, 2, 3]
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="CONCAT_STRATEGY",
         df=sample_df,
         col_name="out",
@@ -108,9 +102,7 @@ def test_concat_strategy_with_no_dataframe():
     Tests if the MockConcatStrategy handles the case where no dataframe is provided.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="CONCAT_STRATEGY",
-        df=None,
         col_name="out",
         rows=3,
         params={
@@ -124,3 +116,20 @@ def test_concat_strategy_with_no_dataframe():
     result = strategy.generate_data(3)
     expected = pd.Series(["Name:  .", "Name:  .", "Name:  ."])
     pd.testing.assert_series_equal(result, expected)
+
+
+def test_concat_strategy_matches_astype_str_for_missing_values():
+    """
+    Missing values are rendered exactly as ``astype(str)`` renders them.
+    """
+    df = pd.DataFrame({"a": ["x", None, "z"], "b": [1.5, float("nan"), 3.0]})
+    strategy = create_strategy_via_factory(
+        strategy_name="CONCAT_STRATEGY",
+        df=df,
+        col_name="out",
+        rows=len(df),
+        params={"lhs_col": "a", "rhs_col": "b", "prefix": "<", "suffix": ">"},
+    )
+    result = strategy.generate_data(3)
+    expected = "<" + df["a"].astype(str) + df["b"].astype(str) + ">"
+    assert result.tolist() == expected.tolist()
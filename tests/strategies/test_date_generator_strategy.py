@@ -1,10 +1,12 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from exceptions.param_exceptions import InvalidConfigParamException
 from tests.strategies.base import create_strategy_via_factory
+from utils.date_generator import format_day_offsets
 
 
 def test_date_generator_strategy_returns_correct_number_of_dates():
@@ -12,10 +14,7 @@ def test_date_generator_strategy_returns_correct_number_of_dates():
     Tests if the generate method returns a pandas Series with the correct number of dates.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="DATE_GENERATOR_STRATEGY",
-        df=None,
-        col_name="col",
         rows=10,
         params={
             "start_date": "2022-01-01",
@@ -34,10 +33,7 @@ def test_date_generator_strategy_with_seed_produces_deterministic_results():
     Tests if the generate method with a seed produces deterministic results.
     """
     strategy1 = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="DATE_GENERATOR_STRATEGY",
-        df=None,
-        col_name="col",
         rows=10,
         params={
             "start_date": "2022-01-01",
@@ -48,10 +44,7 @@ def test_date_generator_strategy_with_seed_produces_deterministic_results():
     )
     result1 = strategy1.generate_data(10)
     strategy2 = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="DATE_GENERATOR_STRATEGY",
-        df=None,
-        col_name="col",
         rows=10,
         params={
             "start_date": "2022-01-01",
@@ -69,10 +62,7 @@ def test_date_generator_strategy_missing_start_date_uses_default():
     With factory defaults, missing 'start_date' falls back to default.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="DATE_GENERATOR_STRATEGY",
-        df=None,
-        col_name="col",
         rows=5,
         params={"end_date": "2022-12-31", "format": "%Y-%m-%d"},
     )
@@ -85,10 +75,7 @@ def test_date_generator_strategy_missing_end_date_uses_default():
     With factory defaults, missing 'end_date' falls back to default.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="DATE_GENERATOR_STRATEGY",
-        df=None,
-        col_name="col",
         rows=5,
         params={
             "start_date": "2022-01-01",
@@ -106,10 +93,7 @@ def test_date_generator_strategy_invalid_date_format_raises_exception():
     """
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="DATE_GENERATOR_STRATEGY",
-            df=None,
-            col_name="col",
             rows=5,
             params={
                 "start_date": "2022-01-01",
@@ -126,10 +110,7 @@ def test_date_generator_strategy_output_format():
     """
     output_format = "%d-%m-%Y"
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="DATE_GENERATOR_STRATEGY",
-        df=None,
-        col_name="col",
         rows=5,
         params={
             "start_date": "2022-01-01",
@@ -139,8 +120,96 @@ def test_date_generator_strategy_output_format():
         },
     )
     result = strategy.generate_data(5)
-    for date_str in result:
-        try:
-            datetime.strptime(date_str, output_format)
-        except ValueError:
-            pytest.fail(f"Date {date_str} does not match format {output_format}")
+    # Raises if any value does not match the format
+    parsed = pd.to_datetime(result, format=output_format, errors="raise")
+    assert parsed.between("2022-01-01", "2022-12-31").all()
+
+
+def test_date_generator_strategy_reset_replays_sequence():
+    """
+    Tests that reset_state replays the same seeded dates.
+    """
+    strategy = create_strategy_via_factory(
+        strategy_name="DATE_GENERATOR_STRATEGY",
+        rows=50,
+        params={
+            "start_date": "2022-01-01",
+            "end_date": "2022-01-31",
+            "format": "%Y-%m-%d",
+            "seed": 7,
+        },
+    )
+    first = strategy.generate_chunk(50)
+    strategy.reset_state()
+    pd.testing.assert_series_equal(strategy.generate_chunk(50), first)
+    assert first.str.startswith("2022-01-").all()
+
+
+@pytest.mark.parametrize("output_format", ["%Y-%m-%d", "%Y-%m-%dT%H:%M:%S"])
+def test_format_day_offsets_fast_path_matches_strftime(output_format):
+    """
+    ISO formats rendered by numpy must match datetime.strftime exactly.
+    """
+    start = datetime(2023, 12, 30, 7, 5, 9)
+    offsets = np.array([0, 1, 2, 1, 62, 0])
+    expected = [
+        (start + timedelta(days=int(day))).strftime(output_format) for day in offsets
+    ]
+    assert format_day_offsets(start, offsets, output_format).tolist() == expected
+
+
+@pytest.mark.parametrize("fmt", ["kkkf", "%Y-%Q-%d", "%Y-%m-%", "%%Y-%%m", ""])
+def test_date_generator_strategy_rejects_unknown_format_directives(fmt):
+    """
+    Formats without directives, with unknown ones or with a dangling % are rejected.
+    """
+    with pytest.raises(InvalidConfigParamException, match="Invalid date format"):
+        create_strategy_via_factory(
+            strategy_name="DATE_GENERATOR_STRATEGY",
+            rows=5,
+            params={
+                "start_date": "2022-01-01",
+                "end_date": "2022-12-31",
+                "format": fmt,
+            },
+        )
+
+
+def test_date_generator_strategy_pyarrow_string_storage():
+    """
+    string_storage=pyarrow returns Arrow-backed strings that masked writes accept.
+    """
+    pytest.importorskip("pyarrow")
+    strategy = create_strategy_via_factory(
+        strategy_name="DATE_GENERATOR_STRATEGY",
+        col_name="when",
+        rows=4,
+        params={
+            "start_date": "2022-01-01",
+            "end_date": "2022-01-31",
+            "string_storage": "pyarrow",
+            "seed": 2,
+        },
+    )
+    result = strategy.generate_data(4)
+    assert result.dtype == "string[pyarrow]"
+    assert result.str.startswith("2022-01-").all()
+
+    df = pd.DataFrame({"a": [0, 1, 2, 3]})
+    out = strategy.apply_to_dataframe(df, "when", "a > 1")
+    assert out["when"].isna().tolist() == [True, True, False, False]
+
+
+def test_date_generator_strategy_rejects_unknown_string_storage():
+    strategy = create_strategy_via_factory(
+        strategy_name="DATE_GENERATOR_STRATEGY",
+        col_name="when",
+        rows=2,
+        params={
+            "start_date": "2022-01-01",
+            "end_date": "2022-01-31",
+            "string_storage": "arrow",
+        },
+    )
+    with pytest.raises(InvalidConfigParamException, match="string_storage"):
+        strategy.generate_data(2)
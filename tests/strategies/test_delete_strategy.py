@@ -10,10 +10,7 @@ def test_delete_strategy_returns_series_of_nones():
     Tests if the MockDeleteStrategy returns a pandas Series of None values.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="DELETE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=5,
         params={},
         # mask is now provided at top-level
@@ -31,10 +28,7 @@ def test_delete_strategy_missing_mask_is_allowed():
     Missing mask at top-level should default to applying to all rows without error.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="DELETE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=1,
         params={},
     )
@@ -47,13 +41,51 @@ def test_delete_strategy_ignores_non_string_mask():
     Non-string mask at top-level is ignored (treated as None) without raising.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="DELETE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=1,
         params={},
         mask=123,  # type: ignore
     )
     s = strategy.generate_data(1)
     assert isinstance(s, pd.Series)
+
+
+def test_delete_strategy_returns_read_only_shared_nans():
+    """
+    Deleted values are read-only NaN views that grow with the requested count.
+    """
+    strategy = create_strategy_via_factory(
+        strategy_name="DELETE_STRATEGY",
+        rows=3,
+        params={},
+    )
+    small = strategy.generate_data(3)
+    large = strategy.generate_data(5000)
+
+    assert len(small) == 3 and len(large) == 5000
+    assert large.isna().all()
+    assert not large.values.flags.writeable
+
+    df = pd.DataFrame({"col": ["a", "b", "c"]})
+    df.loc[[0, 2], "col"] = strategy.generate_data(2).values
+    assert df["col"].isna().tolist() == [True, False, True]
+
+
+def test_delete_strategy_skips_mask_for_missing_column():
+    """
+    A missing target column is added as all-missing without evaluating the mask;
+    an existing column is only cleared on the masked rows.
+    """
+    strategy = create_strategy_via_factory(
+        strategy_name="DELETE_STRATEGY",
+        rows=3,
+        params={},
+        mask="not_a_column > 1",
+    )
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    out = strategy.apply_to_dataframe(df, "col", strategy.mask)
+    assert out["col"].isna().all()
+
+    df = pd.DataFrame({"a": [1, 2, 3], "col": ["x", "y", "z"]})
+    out = strategy.apply_to_dataframe(df, "col", "a > 1")
+    assert out["col"].isna().tolist() == [False, True, True]
@@ -10,10 +10,7 @@ def test_distributed_choice_strategy_returns_correct_number_of_items():
     Tests if the generate method returns a pandas Series with the correct number of items.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="DISTRIBUTED_CHOICE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=10,
         params={"choices": {"A": 50, "B": 50}},
     )
@@ -28,19 +25,13 @@ def test_distributed_choice_strategy_with_seed_produces_deterministic_results():
     Tests if the generate method with a seed produces deterministic results.
     """
     strategy1 = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="DISTRIBUTED_CHOICE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=10,
         params={"choices": {"A": 50, "B": 50}, "seed": 123},
     )
     result1 = strategy1.generate_data(10)
     strategy2 = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="DISTRIBUTED_CHOICE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=10,
         params={"choices": {"A": 50, "B": 50}, "seed": 123},
     )
@@ -54,10 +45,7 @@ def test_distributed_choice_strategy_missing_choices_raises_exception():
     """
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="DISTRIBUTED_CHOICE_STRATEGY",
-            df=None,
-            col_name="col",
             rows=1,
             params={},
         )
@@ -69,10 +57,7 @@ def test_distributed_choice_strategy_invalid_choices_type_raises_exception():
     """
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="DISTRIBUTED_CHOICE_STRATEGY",
-            df=None,
-            col_name="col",
             rows=1,
             params={"choices": ["A", "B"]},
         )
@@ -84,10 +69,7 @@ def test_distributed_choice_strategy_empty_choices_raises_exception():
     """
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="DISTRIBUTED_CHOICE_STRATEGY",
-            df=None,
-            col_name="col",
             rows=1,
             params={"choices": {}},
         )
@@ -99,10 +81,7 @@ def test_distributed_choice_strategy_invalid_weight_type_raises_exception():
     """
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="DISTRIBUTED_CHOICE_STRATEGY",
-            df=None,
-            col_name="col",
             rows=1,
             params={"choices": {"A": "50", "B": 50}},
         )
@@ -114,10 +93,7 @@ def test_distributed_choice_strategy_negative_weight_raises_exception():
     """
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="DISTRIBUTED_CHOICE_STRATEGY",
-            df=None,
-            col_name="col",
             rows=1,
             params={"choices": {"A": -50, "B": 150}},
         )
@@ -129,10 +105,7 @@ def test_distributed_choice_strategy_total_weight_not_100_raises_exception():
     """
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="DISTRIBUTED_CHOICE_STRATEGY",
-            df=None,
-            col_name="col",
             rows=1,
             params={"choices": {"A": 50, "B": 60}},
         )
@@ -143,10 +116,7 @@ def test_distributed_choice_strategy_distribution():
     Tests if the distribution of choices is approximately correct.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="DISTRIBUTED_CHOICE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=1000,
         params={"choices": {"A": 25, "B": 75}},
     )
@@ -155,3 +125,36 @@ def test_distributed_choice_strategy_distribution():
     counts = result.value_counts()
     assert abs(counts.get("A", 0) - 250) < 50  # Allow for some variance
     assert abs(counts.get("B", 0) - 750) < 50
+
+
+def test_distributed_choice_strategy_remainder_follows_weights():
+    """
+    Tests that exact shares come first and the rounding remainder is drawn
+    from the weighted choices, keeping non-string keys intact.
+    """
+    strategy = create_strategy_via_factory(
+        strategy_name="DISTRIBUTED_CHOICE_STRATEGY",
+        rows=10,
+        params={"choices": {1: 33, 2: 33, 3: 34}, "seed": 7},
+    )
+    result = strategy.generate_data(10)
+    assert len(result) == 10
+    assert result.tolist()[:9] == [1, 1, 1, 2, 2, 2, 3, 3, 3]
+    assert result.iloc[9] in (1, 2, 3)
+    assert strategy.generate_data(10).tolist() == result.tolist()
+
+
+def test_distributed_choice_strategy_remainder_draws_follow_cdf():
+    """
+    Single-value chunks are all remainder draws and follow the weights.
+    """
+    strategy = create_strategy_via_factory(
+        strategy_name="DISTRIBUTED_CHOICE_STRATEGY",
+        rows=1,
+        params={"choices": {"A": 10, "B": 90}, "seed": 1},
+    )
+    draws = pd.Series([strategy.generate_chunk(1).iloc[0] for _ in range(2000)])
+    counts = draws.value_counts()
+
+    assert set(counts.index) == {"A", "B"}
+    assert abs(counts["A"] - 200) < 60
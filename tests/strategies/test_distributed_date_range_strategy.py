@@ -1,5 +1,3 @@
-from datetime import datetime
-
 import pandas as pd
 import pytest
 
@@ -35,10 +33,7 @@ def test_distributed_date_range_strategy_via_factory_returns_correct_number_of_d
     Tests if the generate method returns a pandas Series with the correct number of dates.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="DISTRIBUTED_DATE_RANGE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=10,
         params={"ranges": valid_ranges},
     )
@@ -55,19 +50,13 @@ def test_distributed_date_range_strategy_with_seed_produces_deterministic_result
     Tests if the generate method with a seed produces deterministic results.
     """
     strategy1 = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="DISTRIBUTED_DATE_RANGE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=10,
         params={"ranges": valid_ranges, "seed": 123},
     )
     result1 = strategy1.generate_data(10)
     strategy2 = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="DISTRIBUTED_DATE_RANGE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=10,
         params={"ranges": valid_ranges, "seed": 123},
     )
@@ -81,10 +70,7 @@ def test_distributed_date_range_strategy_missing_ranges_raises_exception():
     """
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="DISTRIBUTED_DATE_RANGE_STRATEGY",
-            df=None,
-            col_name="col",
             rows=1,
             params={},
         )
@@ -96,10 +82,7 @@ def test_distributed_date_range_strategy_invalid_ranges_type_raises_exception():
     """
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="DISTRIBUTED_DATE_RANGE_STRATEGY",
-            df=None,
-            col_name="col",
             rows=1,
             params={"ranges": {}},
         )
@@ -111,10 +94,7 @@ def test_distributed_date_range_strategy_empty_ranges_raises_exception():
     """
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="DISTRIBUTED_DATE_RANGE_STRATEGY",
-            df=None,
-            col_name="col",
             rows=1,
             params={"ranges": []},
         )
@@ -126,10 +106,7 @@ def test_distributed_date_range_strategy_invalid_range_item_type_raises_exceptio
     """
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="DISTRIBUTED_DATE_RANGE_STRATEGY",
-            df=None,
-            col_name="col",
             rows=1,
             params={"ranges": [{}]},
         )
@@ -141,10 +118,7 @@ def test_distributed_date_range_strategy_missing_field_in_range_item_raises_exce
     """
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="DISTRIBUTED_DATE_RANGE_STRATEGY",
-            df=None,
-            col_name="col",
             rows=1,
             params={
                 "ranges": [
@@ -168,10 +142,7 @@ def test_distributed_date_range_strategy_invalid_date_format_raises_exception(
     valid_ranges[0].format = "%d-%m-%Y"
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="DISTRIBUTED_DATE_RANGE_STRATEGY",
-            df=None,
-            col_name="col",
             rows=1,
             params={"ranges": valid_ranges},
         )
@@ -186,10 +157,7 @@ def test_distributed_date_range_strategy_invalid_distribution_type_raises_except
     valid_ranges[0].distribution = "50"
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="DISTRIBUTED_DATE_RANGE_STRATEGY",
-            df=None,
-            col_name="col",
             rows=1,
             params={"ranges": valid_ranges},
         )
@@ -205,10 +173,7 @@ def test_distributed_date_range_strategy_negative_distribution_raises_exception(
     valid_ranges[1].distribution = 150
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="DISTRIBUTED_DATE_RANGE_STRATEGY",
-            df=None,
-            col_name="col",
             rows=1,
             params={"ranges": valid_ranges},
         )
@@ -223,10 +188,7 @@ def test_distributed_date_range_strategy_distribution_not_100_raises_exception(
     valid_ranges[0].distribution = 60
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="DISTRIBUTED_DATE_RANGE_STRATEGY",
-            df=None,
-            col_name="col",
             rows=1,
             params={"ranges": valid_ranges},
         )
@@ -237,30 +199,56 @@ def test_distributed_date_range_strategy_distribution(valid_ranges):
     Tests if the distribution of dates is approximately correct.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="DISTRIBUTED_DATE_RANGE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=1000,
         params={"ranges": valid_ranges},
     )
     count = 1000
     result = strategy.generate_data(count)
 
-    range1_count = 0
-    range2_count = 0
-
-    start1 = datetime.strptime("2022-01-01", "%Y-%m-%d")
-    end1 = datetime.strptime("2022-01-31", "%Y-%m-%d")
-    start2 = datetime.strptime("2022-02-01", "%Y-%m-%d")
-    end2 = datetime.strptime("2022-02-28", "%Y-%m-%d")
-
-    for date_str in result:
-        date = datetime.strptime(date_str, "%Y-%m-%d")
-        if start1 <= date <= end1:
-            range1_count += 1
-        elif start2 <= date <= end2:
-            range2_count += 1
+    dates = pd.to_datetime(result, format="%Y-%m-%d")
+    range1_count = dates.between("2022-01-01", "2022-01-31").sum()
+    range2_count = dates.between("2022-02-01", "2022-02-28").sum()
 
     assert abs(range1_count - 500) < 100
     assert abs(range2_count - 500) < 100
+
+
+def test_distributed_date_range_strategy_keeps_time_of_day_and_replays():
+    """
+    Tests that the start time of day is kept and seeded output repeats after reset.
+    """
+    ranges = [
+        DateRangeItem(
+            start_date="2022-03-01 08:30",
+            end_date="2022-03-10 08:30",
+            format="%Y-%m-%d %H:%M",
+            output_format="%d/%m/%Y %H:%M",
+            distribution=100,
+        )
+    ]
+    strategy = create_strategy_via_factory(
+        strategy_name="DISTRIBUTED_DATE_RANGE_STRATEGY",
+        rows=50,
+        params={"ranges": ranges, "seed": 5},
+    )
+    result = strategy.generate_data(50)
+
+    parsed = pd.to_datetime(result, format="%d/%m/%Y %H:%M")
+    assert (parsed.dt.strftime("%H:%M") == "08:30").all()
+    assert parsed.between("2022-03-01", "2022-03-10 08:30").all()
+    assert strategy.generate_data(50).tolist() == result.tolist()
+
+
+def test_date_range_item_revalidates_after_mutation(valid_ranges):
+    """
+    A validated item skips re-validation only while its fields are unchanged.
+    """
+    item = valid_ranges[0]
+    item.validate()
+    item.validate()
+    assert not hasattr(item, "__dict__")
+
+    item.end_date = "2021-12-31"
+    with pytest.raises(InvalidConfigParamException):
+        item.validate()
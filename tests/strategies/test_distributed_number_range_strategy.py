@@ -21,10 +21,7 @@ def test_distributed_number_range_strategy_returns_correct_number_of_items(
     Tests if the generate method returns a pandas Series with the correct number of items.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="DISTRIBUTED_NUMBER_RANGE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=10,
         params={"ranges": valid_ranges},
     )
@@ -41,19 +38,13 @@ def test_distributed_number_range_strategy_with_seed_produces_deterministic_resu
     Tests if the generate method with a seed produces deterministic results.
     """
     strategy1 = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="DISTRIBUTED_NUMBER_RANGE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=10,
         params={"ranges": valid_ranges, "seed": 123},
     )
     result1 = strategy1.generate_data(10)
     strategy2 = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="DISTRIBUTED_NUMBER_RANGE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=10,
         params={"ranges": valid_ranges, "seed": 123},
     )
@@ -67,10 +58,7 @@ def test_distributed_number_range_strategy_missing_ranges_raises_exception():
     """
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="DISTRIBUTED_NUMBER_RANGE_STRATEGY",
-            df=None,
-            col_name="col",
             rows=1,
             params={},
         )
@@ -82,10 +70,7 @@ def test_distributed_number_range_strategy_invalid_ranges_type_raises_exception(
     """
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="DISTRIBUTED_NUMBER_RANGE_STRATEGY",
-            df=None,
-            col_name="col",
             rows=1,
             params={"ranges": {}},
         )
@@ -97,10 +82,7 @@ def test_distributed_number_range_strategy_empty_ranges_raises_exception():
     """
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="DISTRIBUTED_NUMBER_RANGE_STRATEGY",
-            df=None,
-            col_name="col",
             rows=1,
             params={"ranges": []},
         )
@@ -112,10 +94,7 @@ def test_distributed_number_range_strategy_invalid_range_item_type_raises_except
     """
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="DISTRIBUTED_NUMBER_RANGE_STRATEGY",
-            df=None,
-            col_name="col",
             rows=1,
             params={"ranges": [{}]},
         )
@@ -127,10 +106,7 @@ def test_distributed_number_range_strategy_missing_field_in_range_item_raises_ex
     """
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="DISTRIBUTED_NUMBER_RANGE_STRATEGY",
-            df=None,
-            col_name="col",
             rows=1,
             params={"ranges": [RangeItem(start=0, end=10)]},
         )
@@ -146,10 +122,7 @@ def test_distributed_number_range_strategy_invalid_bounds_raises_exception(
     valid_ranges[0].end = 10
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="DISTRIBUTED_NUMBER_RANGE_STRATEGY",
-            df=None,
-            col_name="col",
             rows=1,
             params={"ranges": valid_ranges},
         )
@@ -164,10 +137,7 @@ def test_distributed_number_range_strategy_invalid_distribution_type_raises_exce
     valid_ranges[0].distribution = "50"
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="DISTRIBUTED_NUMBER_RANGE_STRATEGY",
-            df=None,
-            col_name="col",
             rows=1,
             params={"ranges": valid_ranges},
         )
@@ -183,10 +153,7 @@ def test_distributed_number_range_strategy_negative_distribution_raises_exceptio
     valid_ranges[1].distribution = 150
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="DISTRIBUTED_NUMBER_RANGE_STRATEGY",
-            df=None,
-            col_name="col",
             rows=1,
             params={"ranges": valid_ranges},
         )
@@ -201,10 +168,7 @@ def test_distributed_number_range_strategy_distribution_not_100_raises_exception
     valid_ranges[0].distribution = 60
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="DISTRIBUTED_NUMBER_RANGE_STRATEGY",
-            df=None,
-            col_name="col",
             rows=1,
             params={"ranges": valid_ranges},
         )
@@ -215,10 +179,7 @@ def test_distributed_number_range_strategy_distribution(valid_ranges):
     Tests if the distribution of numbers is approximately correct.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="DISTRIBUTED_NUMBER_RANGE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=1000,
         params={"ranges": valid_ranges},
     )
@@ -230,3 +191,19 @@ def test_distributed_number_range_strategy_distribution(valid_ranges):
 
     assert abs(range1_count - 500) < 100
     assert abs(range2_count - 500) < 100
+
+
+def test_distributed_number_range_strategy_replays_after_reset(valid_ranges):
+    """
+    Tests that seeded output is float, stays in range and repeats after reset.
+    """
+    strategy = create_strategy_via_factory(
+        strategy_name="DISTRIBUTED_NUMBER_RANGE_STRATEGY",
+        rows=100,
+        params={"ranges": valid_ranges, "seed": 42},
+    )
+    result = strategy.generate_data(100)
+
+    assert result.dtype == float
+    assert result.between(0, 20).all()
+    pd.testing.assert_series_equal(strategy.generate_data(100), result)
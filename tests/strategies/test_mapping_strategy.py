@@ -16,19 +16,22 @@ def test_inline_mapping_overrides_only_mapped_and_preserves_existing():
         "mapping": {1: "Sales", 2: "Marketing"},
     }
     s = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="MAPPING_STRATEGY",
-        df=df.copy(),
+        df=df,
         col_name="department_name",
         rows=len(df),
         params=params,
     )
 
     out = s.generate_data(len(df))
-    expected = pd.Series(
-        ["Sales", "Marketing", "DEFAULT_DEPARTMENT", "Marketing", "Sales"], dtype=object
-    )
-    pd.testing.assert_series_equal(out.reset_index(drop=True), expected)
+    assert out.dtype == object
+    assert out.tolist() == [
+        "Sales",
+        "Marketing",
+        "DEFAULT_DEPARTMENT",
+        "Marketing",
+        "Sales",
+    ]
 
 
 def test_inline_mapping_no_existing_target_creates_series():
@@ -42,9 +45,8 @@ def test_inline_mapping_no_existing_target_creates_series():
         "mapping": {1: "Sales", 3: "Engineering"},
     }
     s = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="MAPPING_STRATEGY",
-        df=df.copy(),
+        df=df,
         col_name="department_name",
         rows=len(df),
         params=params,
@@ -85,14 +87,13 @@ def test_file_mapping_behaves_like_inline(tmp_path):
         "source_column": "employee_name",
     }
     s = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="MAPPING_STRATEGY",
-        df=df.copy(),
+        df=df,
         col_name="employee_name",
         rows=len(df),
         params=params,
     )
 
     out = s.generate_data(len(df))
-    expected = pd.Series(["Alice", "Bob", "DEFAULT", "Carol"], dtype=object)
-    pd.testing.assert_series_equal(out.reset_index(drop=True), expected)
+    assert out.dtype == object
+    assert out.tolist() == ["Alice", "Bob", "DEFAULT", "Carol"]
@@ -1,10 +1,22 @@
 import pandas as pd
+import pytest
 
 from tests.strategies.base import create_strategy_via_factory
 
+# Optional pandas I/O engine each extension needs
+_ENGINES = {".parquet": "pyarrow", ".xlsx": "openpyxl"}
 
-def _assert_mapping(tmp_path, df, mapping_df, ext, read_kwargs=None):
-    path = tmp_path / f"mapping{ext}"
+_EXPECTED = ["A", "B", "DEFAULT", "B"]
+
+
+@pytest.fixture(scope="module")
+def mapping_pair():
+    df = pd.DataFrame({"id": [1, 2, 99, 2], "name": ["DEFAULT"] * 4})
+    mapping_df = pd.DataFrame({"key": [1, 2], "val": ["A", "B"]})
+    return df, mapping_df
+
+
+def _write_mapping(mapping_df, path, ext):
     if ext == ".csv":
         mapping_df.to_csv(path, index=False)
     elif ext == ".json":
@@ -16,6 +28,18 @@ def _assert_mapping(tmp_path, df, mapping_df, ext, read_kwargs=None):
     else:
         raise AssertionError("Unsupported ext in test")
 
+
+@pytest.mark.parametrize(
+    "ext",
+    [".csv", ".json", ".parquet", pytest.param(".xlsx", marks=pytest.mark.slow)],
+)
+def test_mapping_from_file(tmp_path, mapping_pair, ext):
+    if ext in _ENGINES:
+        pytest.importorskip(_ENGINES[ext])
+    df, mapping_df = mapping_pair
+    path = tmp_path / f"mapping{ext}"
+    _write_mapping(mapping_df, path, ext)
+
     params = {
         "map_from": "id",
         "source_map_from": "key",
@@ -23,37 +47,12 @@ def _assert_mapping(tmp_path, df, mapping_df, ext, read_kwargs=None):
         "source_column": "val",
     }
     s = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="MAPPING_STRATEGY",
         df=df.copy(),
         col_name="name",
         rows=len(df),
         params=params,
     )
-    out = s.generate_data(len(df)).reset_index(drop=True)
-    expected = pd.Series(["A", "B", "DEFAULT", "B"], dtype=object)
-    pd.testing.assert_series_equal(out, expected)
-
-
-def test_mapping_from_csv(tmp_path):
-    df = pd.DataFrame({"id": [1, 2, 99, 2], "name": ["DEFAULT"] * 4})
-    mapping_df = pd.DataFrame({"key": [1, 2], "val": ["A", "B"]})
-    _assert_mapping(tmp_path, df, mapping_df, ".csv")
-
-
-def test_mapping_from_json(tmp_path):
-    df = pd.DataFrame({"id": [1, 2, 99, 2], "name": ["DEFAULT"] * 4})
-    mapping_df = pd.DataFrame({"key": [1, 2], "val": ["A", "B"]})
-    _assert_mapping(tmp_path, df, mapping_df, ".json")
-
-
-def test_mapping_from_parquet(tmp_path):
-    df = pd.DataFrame({"id": [1, 2, 99, 2], "name": ["DEFAULT"] * 4})
-    mapping_df = pd.DataFrame({"key": [1, 2], "val": ["A", "B"]})
-    _assert_mapping(tmp_path, df, mapping_df, ".parquet")
-
-
-def test_mapping_from_excel(tmp_path):
-    df = pd.DataFrame({"id": [1, 2, 99, 2], "name": ["DEFAULT"] * 4})
-    mapping_df = pd.DataFrame({"key": [1, 2], "val": ["A", "B"]})
-    _assert_mapping(tmp_path, df, mapping_df, ".xlsx")
+    out = s.generate_data(len(df))
+    assert out.dtype == object
+    assert out.tolist() == _EXPECTED
@@ -1,8 +1,7 @@
+import numpy as np
 import pandas as pd
-import pytest
 
-from exceptions.param_exceptions import InvalidConfigParamException
-from tests.strategies.base import create_strategy_via_factory
+from tests.strategies.base import create_strategy_via_factory, expect_invalid_config
 
 
 def test_number_range_strategy_returns_correct_number_of_items():
@@ -10,10 +9,7 @@ def test_number_range_strategy_returns_correct_number_of_items():
     Tests if the generate method returns a pandas Series with the correct number of items.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="RANDOM_NUMBER_RANGE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=5,
         params={"start": 0, "end": 10},
     )
@@ -27,24 +23,13 @@ def test_number_range_strategy_with_seed_produces_deterministic_results():
     """
     Tests if the generate method with a seed produces deterministic results.
     """
-    strategy1 = create_strategy_via_factory(
-        mode="NORMAL",
-        strategy_name="RANDOM_NUMBER_RANGE_STRATEGY",
-        df=None,
-        col_name="col",
-        rows=10,
-        params={"start": 0, "end": 10, "seed": 123},
-    )
-    result1 = strategy1.generate_data(10)
-    strategy2 = create_strategy_via_factory(
-        mode="NORMAL",
+    strategy = create_strategy_via_factory(
         strategy_name="RANDOM_NUMBER_RANGE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=10,
         params={"start": 0, "end": 10, "seed": 123},
     )
-    result2 = strategy2.generate_data(10)
+    result1 = strategy.generate_data(10)
+    result2 = strategy.generate_data(10)
     pd.testing.assert_series_equal(result1, result2)
 
 
@@ -53,10 +38,7 @@ def test_number_range_strategy_missing_start_raises_exception():
     When using the factory, missing 'start' falls back to config defaults.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="RANDOM_NUMBER_RANGE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=5,
         params={"end": 10},
     )
@@ -70,10 +52,7 @@ def test_number_range_strategy_missing_end_raises_exception():
     When using the factory, missing 'end' falls back to config defaults.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="RANDOM_NUMBER_RANGE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=5,
         params={"start": 0},
     )
@@ -86,15 +65,7 @@ def test_number_range_strategy_invalid_bounds_raises_exception():
     """
     Tests if start >= end in params raises an InvalidConfigParamException.
     """
-    with pytest.raises(InvalidConfigParamException):
-        create_strategy_via_factory(
-            mode="NORMAL",
-            strategy_name="RANDOM_NUMBER_RANGE_STRATEGY",
-            df=None,
-            col_name="col",
-            rows=10,
-            params={"start": 10, "end": 0},
-        )
+    expect_invalid_config("RANDOM_NUMBER_RANGE_STRATEGY", {"start": 10, "end": 0})
 
 
 def test_number_range_strategy_integer_range():
@@ -102,10 +73,7 @@ def test_number_range_strategy_integer_range():
     Tests if the strategy generates integers when start and end are integers.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="RANDOM_NUMBER_RANGE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=5,
         params={"start": 0, "end": 10},
     )
@@ -118,12 +86,66 @@ def test_number_range_strategy_float_range():
     Tests if the strategy generates floats when start or end is a float.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="RANDOM_NUMBER_RANGE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=5,
         params={"start": 0.0, "end": 10},
     )
     result = strategy.generate_data(5)
     assert all(isinstance(x, float) for x in result)
+
+
+def test_number_range_strategy_seed_leaves_global_random_state_alone():
+    """
+    Seeded strategies draw from their own generator, not the global numpy state.
+    """
+    before = np.random.get_state()[1].copy()
+    strategy = create_strategy_via_factory(
+        strategy_name="RANDOM_NUMBER_RANGE_STRATEGY",
+        rows=5,
+        params={"start": 1, "end": 10, "seed": 3},
+    )
+    strategy.generate_data(5)
+    assert (np.random.get_state()[1] == before).all()
+
+
+def test_number_range_strategy_bit_generator_param():
+    """
+    Philox is selectable and deterministic; unknown bit generators are rejected.
+    """
+    params = {"start": 1, "end": 1000, "seed": 3, "bit_generator": "Philox"}
+    results = [
+        create_strategy_via_factory(
+            strategy_name="RANDOM_NUMBER_RANGE_STRATEGY",
+            rows=20,
+            params=params,
+        ).generate_data(20)
+        for _ in range(2)
+    ]
+    pd.testing.assert_series_equal(results[0], results[1])
+
+    expect_invalid_config(
+        "RANDOM_NUMBER_RANGE_STRATEGY",
+        {"start": 1, "end": 10, "bit_generator": "MT19937"},
+        match="bit_generator",
+    )
+
+
+def test_number_range_strategy_reset_rewinds_the_same_generator():
+    """
+    Resetting a seeded strategy rewinds its generator instead of rebuilding it.
+    """
+    strategy = create_strategy_via_factory(
+        strategy_name="RANDOM_NUMBER_RANGE_STRATEGY",
+        rows=5,
+        params={"start": 1, "end": 1000, "seed": 8},
+    )
+    rng = strategy._rng
+    first = strategy.generate_data(5)
+    second = strategy.generate_data(5)
+
+    assert strategy._rng is rng
+    pd.testing.assert_series_equal(first, second)
+
+    strategy._seed = 9
+    strategy.reset_state()
+    assert strategy._rng is not rng
@@ -1,10 +1,6 @@
-import re
-
 import pandas as pd
-import pytest
 
-from exceptions.param_exceptions import InvalidConfigParamException
-from tests.strategies.base import create_strategy_via_factory
+from tests.strategies.base import create_strategy_via_factory, expect_invalid_config
 
 
 class MockPatternStrategy:
@@ -16,14 +12,11 @@ def test_pattern_strategy_returns_correct_number_of_items():
     Tests if the generate method returns a pandas Series with the correct number of items.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="PATTERN_STRATEGY",
-        df=None,
-        col_name="col",
-        rows=5,
+        rows=3,
         params={"regex": "[A-Z]{5}"},
     )
-    count = 5
+    count = 3
     result = strategy.generate_data(count)
     assert isinstance(result, pd.Series)
     assert len(result) == count
@@ -33,24 +26,13 @@ def test_pattern_strategy_with_seed_produces_deterministic_results():
     """
     Tests if the generate method with a seed produces deterministic results.
     """
-    strategy1 = create_strategy_via_factory(
-        mode="NORMAL",
-        strategy_name="PATTERN_STRATEGY",
-        df=None,
-        col_name="col",
-        rows=10,
-        params={"regex": "[A-Z]{5}", "seed": 123},
-    )
-    result1 = strategy1.generate_data(10)
-    strategy2 = create_strategy_via_factory(
-        mode="NORMAL",
+    strategy = create_strategy_via_factory(
         strategy_name="PATTERN_STRATEGY",
-        df=None,
-        col_name="col",
-        rows=10,
+        rows=5,
         params={"regex": "[A-Z]{5}", "seed": 123},
     )
-    result2 = strategy2.generate_data(10)
+    result1 = strategy.generate_data(5)
+    result2 = strategy.generate_data(5)
     pd.testing.assert_series_equal(result1, result2)
 
 
@@ -59,10 +41,7 @@ def test_pattern_strategy_missing_regex_uses_default():
     With factory defaults, missing 'regex' falls back to a default pattern.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="PATTERN_STRATEGY",
-        df=None,
-        col_name="col",
         rows=3,
         params={},
     )
@@ -74,15 +53,7 @@ def test_pattern_strategy_invalid_regex_raises_exception():
     """
     Tests if an invalid regex pattern raises an InvalidConfigParamException.
     """
-    with pytest.raises(InvalidConfigParamException):
-        create_strategy_via_factory(
-            mode="NORMAL",
-            strategy_name="PATTERN_STRATEGY",
-            df=None,
-            col_name="col",
-            rows=1,
-            params={"regex": "["},
-        )
+    expect_invalid_config("PATTERN_STRATEGY", {"regex": "["})
 
 
 def test_pattern_strategy_matches_pattern():
@@ -91,16 +62,12 @@ def test_pattern_strategy_matches_pattern():
     """
     pattern = r"\d{3}-\d{2}-\d{4}"
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="PATTERN_STRATEGY",
-        df=None,
-        col_name="col",
         rows=5,
         params={"regex": pattern},
     )
     result = strategy.generate_data(5)
-    for item in result:
-        assert re.match(pattern, item)
+    assert result.str.match(pattern).all()
 
 
 def test_pattern_strategy_unique_values():
@@ -108,10 +75,7 @@ def test_pattern_strategy_unique_values():
     Tests if the strategy generates unique values when unique=True.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="PATTERN_STRATEGY",
-        df=None,
-        col_name="col",
         rows=3,
         params={"regex": "[A-D]{1}"},
         unique=True,
@@ -1,8 +1,6 @@
 import pandas as pd
-import pytest
 
-from exceptions.param_exceptions import InvalidConfigParamException
-from tests.strategies.base import create_strategy_via_factory
+from tests.strategies.base import create_strategy_via_factory, expect_invalid_config
 
 
 def test_random_name_strategy_returns_correct_number_of_names():
@@ -10,14 +8,11 @@ def test_random_name_strategy_returns_correct_number_of_names():
     Tests if the generate method returns a pandas Series with the correct number of names.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="RANDOM_NAME_STRATEGY",
-        df=None,
-        col_name="col",
-        rows=10,
+        rows=3,
         params={"name_type": "full", "gender": "any", "case": "title"},
     )
-    count = 10
+    count = 3
     result = strategy.generate_data(count)
     assert isinstance(result, pd.Series)
     assert len(result) == count
@@ -27,24 +22,13 @@ def test_random_name_strategy_with_seed_produces_deterministic_results():
     """
     Tests if the generate method with a seed produces deterministic results.
     """
-    strategy1 = create_strategy_via_factory(
-        mode="NORMAL",
-        strategy_name="RANDOM_NAME_STRATEGY",
-        df=None,
-        col_name="col",
-        rows=10,
-        params={"name_type": "full", "gender": "any", "case": "title", "seed": 123},
-    )
-    result1 = strategy1.generate_data(10)
-    strategy2 = create_strategy_via_factory(
-        mode="NORMAL",
+    strategy = create_strategy_via_factory(
         strategy_name="RANDOM_NAME_STRATEGY",
-        df=None,
-        col_name="col",
-        rows=10,
+        rows=5,
         params={"name_type": "full", "gender": "any", "case": "title", "seed": 123},
     )
-    result2 = strategy2.generate_data(10)
+    result1 = strategy.generate_data(5)
+    result2 = strategy.generate_data(5)
     pd.testing.assert_series_equal(result1, result2)
 
 
@@ -52,45 +36,30 @@ def test_random_name_strategy_invalid_name_type_raises_exception():
     """
     Tests if an invalid name_type raises an InvalidConfigParamException.
     """
-    with pytest.raises(InvalidConfigParamException):
-        create_strategy_via_factory(
-            mode="NORMAL",
-            strategy_name="RANDOM_NAME_STRATEGY",
-            df=None,
-            col_name="col",
-            rows=1,
-            params={"name_type": "invalid", "gender": "any", "case": "title"},
-        )
+    expect_invalid_config(
+        "RANDOM_NAME_STRATEGY",
+        {"name_type": "invalid", "gender": "any", "case": "title"},
+    )
 
 
 def test_random_name_strategy_invalid_gender_raises_exception():
     """
     Tests if an invalid gender raises an InvalidConfigParamException.
     """
-    with pytest.raises(InvalidConfigParamException):
-        create_strategy_via_factory(
-            mode="NORMAL",
-            strategy_name="RANDOM_NAME_STRATEGY",
-            df=None,
-            col_name="col",
-            rows=1,
-            params={"name_type": "full", "gender": "invalid", "case": "title"},
-        )
+    expect_invalid_config(
+        "RANDOM_NAME_STRATEGY",
+        {"name_type": "full", "gender": "invalid", "case": "title"},
+    )
 
 
 def test_random_name_strategy_invalid_case_raises_exception():
     """
     Tests if an invalid case raises an InvalidConfigParamException.
     """
-    with pytest.raises(InvalidConfigParamException):
-        create_strategy_via_factory(
-            mode="NORMAL",
-            strategy_name="RANDOM_NAME_STRATEGY",
-            df=None,
-            col_name="col",
-            rows=1,
-            params={"name_type": "full", "gender": "any", "case": "invalid"},
-        )
+    expect_invalid_config(
+        "RANDOM_NAME_STRATEGY",
+        {"name_type": "full", "gender": "any", "case": "invalid"},
+    )
 
 
 def test_random_name_strategy_case_formatting():
@@ -98,34 +67,25 @@ def test_random_name_strategy_case_formatting():
     Tests the case formatting options.
     """
     strategy_upper = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="RANDOM_NAME_STRATEGY",
-        df=None,
-        col_name="col",
         rows=5,
         params={"name_type": "full", "gender": "any", "case": "upper", "seed": 42},
     )
     result_upper = strategy_upper.generate_data(5)
-    assert all(name.isupper() for name in result_upper)
+    assert result_upper.str.isupper().all()
 
     strategy_lower = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="RANDOM_NAME_STRATEGY",
-        df=None,
-        col_name="col",
         rows=5,
         params={"name_type": "full", "gender": "any", "case": "lower", "seed": 42},
     )
     result_lower = strategy_lower.generate_data(5)
-    assert all(name.islower() for name in result_lower)
+    assert result_lower.str.islower().all()
 
     strategy_title = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="RANDOM_NAME_STRATEGY",
-        df=None,
-        col_name="col",
         rows=5,
         params={"name_type": "full", "gender": "any", "case": "title", "seed": 42},
     )
     result_title = strategy_title.generate_data(5)
-    assert all(name.istitle() for name in result_title)
+    assert result_title.str.istitle().all()
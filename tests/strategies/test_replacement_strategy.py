@@ -14,7 +14,6 @@ def test_replacement_strategy_replaces_values(sample_df):
     Tests if the MockReplacementStrategy correctly replaces values in a column.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="REPLACEMENT_STRATEGY",
         df=sample_df,
         col_name="col1",
@@ -22,8 +21,8 @@ def test_replacement_strategy_replaces_values(sample_df):
         params={"from_value": "A", "to_value": "Z"},
     )
     result = strategy.generate_data(4)
-    expected = pd.Series(["Z", "B", "C", "Z"])
-    pd.testing.assert_series_equal(result, expected, check_names=False)
+    assert result.dtype == object
+    assert result.tolist() == ["Z", "B", "C", "Z"]
 
 
 def test_replacement_strategy_missing_from_value_raises_exception():
@@ -31,10 +30,7 @@ def test_replacement_strategy_missing_from_value_raises_exception():
     With factory defaults, missing 'from_value' falls back to default.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="REPLACEMENT_STRATEGY",
-        df=None,
-        col_name="col",
         rows=2,
         params={"to_value": "Z"},
     )
@@ -47,10 +43,7 @@ def test_replacement_strategy_missing_to_value_raises_exception():
     With factory defaults, missing 'to_value' falls back to default.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="REPLACEMENT_STRATEGY",
-        df=None,
-        col_name="col",
         rows=2,
         params={"from_value": "A"},
     )
@@ -63,16 +56,13 @@ def test_replacement_strategy_no_dataframe():
     Tests if the strategy returns a series of 'to_value' when no dataframe is provided.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="REPLACEMENT_STRATEGY",
-        df=None,
-        col_name="col",
         rows=3,
         params={"from_value": "A", "to_value": "Z"},
     )
     result = strategy.generate_data(3)
-    expected = pd.Series(["Z", "Z", "Z"])
-    pd.testing.assert_series_equal(result, expected)
+    assert result.dtype == object
+    assert result.tolist() == ["Z", "Z", "Z"]
 
 
 def test_replacement_strategy_no_column_in_dataframe(sample_df):
@@ -80,7 +70,6 @@ def test_replacement_strategy_no_column_in_dataframe(sample_df):
     Tests if the strategy returns a series of 'to_value' when the column is not in the dataframe.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="REPLACEMENT_STRATEGY",
         df=sample_df,
         col_name="col2",
@@ -88,5 +77,18 @@ def test_replacement_strategy_no_column_in_dataframe(sample_df):
         params={"from_value": "A", "to_value": "Z"},
     )
     result = strategy.generate_data(3)
-    expected = pd.Series(["Z", "Z", "Z"])
-    pd.testing.assert_series_equal(result, expected)
+    assert result.dtype == object
+    assert result.tolist() == ["Z", "Z", "Z"]
+
+
+def test_replacement_strategy_no_dataframe_keeps_numeric_dtype():
+    """
+    Tests that a repeated numeric 'to_value' keeps its numeric dtype.
+    """
+    strategy = create_strategy_via_factory(
+        strategy_name="REPLACEMENT_STRATEGY",
+        rows=3,
+        params={"from_value": 1, "to_value": 7},
+    )
+    result = strategy.generate_data(3)
+    pd.testing.assert_series_equal(result, pd.Series([7, 7, 7]))
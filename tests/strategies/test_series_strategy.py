@@ -10,10 +10,7 @@ def test_series_strategy_returns_correct_number_of_items():
     Tests if the generate method returns a pandas Series with the correct number of items.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="SERIES_STRATEGY",
-        df=None,
-        col_name="col",
         rows=5,
         params={"start": 0, "step": 1},
     )
@@ -28,10 +25,7 @@ def test_series_strategy_integer_series():
     Tests if the strategy generates a correct integer series.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="SERIES_STRATEGY",
-        df=None,
-        col_name="col",
         rows=5,
         params={"start": 0, "step": 2},
     )
@@ -45,10 +39,7 @@ def test_series_strategy_float_series():
     Tests if the strategy generates a correct float series.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="SERIES_STRATEGY",
-        df=None,
-        col_name="col",
         rows=5,
         params={"start": 0.5, "step": 0.5},
     )
@@ -57,15 +48,41 @@ def test_series_strategy_float_series():
     pd.testing.assert_series_equal(result, expected, check_dtype=False)
 
 
+def test_series_strategy_float_chunks_match_decimal_values():
+    """
+    Float chunks continue from the previous chunk without accumulating
+    binary rounding error (0.1 + 0.1 + 0.1 must still be 0.3).
+    """
+    strategy = create_strategy_via_factory(
+        strategy_name="SERIES_STRATEGY",
+        rows=6,
+        params={"start": 0.1, "step": 0.1},
+    )
+    first = strategy.generate_chunk(3)
+    second = strategy.generate_chunk(3)
+    assert first.tolist() == [0.1, 0.2, 0.3]
+    assert second.tolist() == [0.4, 0.5, 0.6]
+
+
+def test_series_strategy_float_steps_beyond_exact_powers_of_ten():
+    """
+    Steps with more than 22 decimal places fall back to the Decimal loop,
+    since 10**23 and up are not exact in float64.
+    """
+    strategy = create_strategy_via_factory(
+        strategy_name="SERIES_STRATEGY",
+        rows=3,
+        params={"start": 0.0, "step": 1e-25},
+    )
+    assert strategy.generate_chunk(3).tolist() == [0.0, 1e-25, 2e-25]
+
+
 def test_series_strategy_missing_start_uses_default():
     """
     With factory defaults, missing 'start' falls back to default.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="SERIES_STRATEGY",
-        df=None,
-        col_name="col",
         rows=2,
         params={"step": 1},
     )
@@ -79,10 +96,7 @@ def test_series_strategy_invalid_start_type_raises_exception():
     """
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="SERIES_STRATEGY",
-            df=None,
-            col_name="col",
             rows=1,
             params={"start": "a", "step": 1},
         )
@@ -94,10 +108,7 @@ def test_series_strategy_invalid_step_type_raises_exception():
     """
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="SERIES_STRATEGY",
-            df=None,
-            col_name="col",
             rows=1,
             params={"start": 0, "step": "a"},
         )
@@ -108,10 +119,7 @@ def test_series_strategy_stateful_generation():
     Tests the stateful generation of the series strategy.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="SERIES_STRATEGY",
-        df=None,
-        col_name="col",
         rows=5,
         params={"start": 0, "step": 1},
     )
@@ -1,6 +1,8 @@
 import pandas as pd
+import pytest
 
 from core.strategy_factory import StrategyFactory
+from exceptions import UnsupportedStrategyException
 from utils.logging import Logger
 
 
@@ -42,6 +44,7 @@ def test_mapping_strategy_reuse_with_different_params():
         rows=len(df),
         params=params2,
     )
+    assert s2 is s1
     out2 = s2.generate_data(len(df)).reset_index(drop=True)
     # Expect only 2's mapped to B, others preserve existing
     pd.testing.assert_series_equal(
@@ -81,3 +84,10 @@ def test_number_range_strategy_reuse_with_different_bounds():
     )
     out2 = s2.generate_data(len(df))
     assert (out2 >= 100).all() and (out2 < 200).all()
+
+
+def test_factory_rejects_unknown_strategy_name():
+    factory = StrategyFactory(logger=Logger.get_logger("tests.reuse"))
+
+    with pytest.raises(UnsupportedStrategyException, match="NOT_A_STRATEGY"):
+        factory.create_strategy("NORMAL", "NOT_A_STRATEGY", params={})
@@ -1,10 +1,12 @@
 from datetime import datetime, time
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from exceptions.param_exceptions import InvalidConfigParamException
 from tests.strategies.base import create_strategy_via_factory
+from utils.date_generator import format_second_offsets
 
 
 def test_time_range_strategy_returns_correct_number_of_items():
@@ -12,10 +14,7 @@ def test_time_range_strategy_returns_correct_number_of_items():
     Tests if the generate method returns a pandas Series with the correct number of items.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="TIME_RANGE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=5,
         params={"start_time": "09:00:00", "end_time": "17:00:00"},
     )
@@ -30,19 +29,13 @@ def test_time_range_strategy_with_seed_produces_deterministic_results():
     Tests if the generate method with a seed produces deterministic results.
     """
     strategy1 = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="TIME_RANGE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=10,
         params={"start_time": "09:00:00", "end_time": "17:00:00", "seed": 123},
     )
     result1 = strategy1.generate_data(10)
     strategy2 = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="TIME_RANGE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=10,
         params={"start_time": "09:00:00", "end_time": "17:00:00", "seed": 123},
     )
@@ -55,10 +48,7 @@ def test_time_range_strategy_missing_start_time_uses_default():
     With factory defaults, missing 'start_time' falls back to default.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="TIME_RANGE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=2,
         params={"end_time": "17:00:00"},
     )
@@ -71,10 +61,7 @@ def test_time_range_strategy_missing_end_time_uses_default():
     With factory defaults, missing 'end_time' falls back to default.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="TIME_RANGE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=2,
         params={"start_time": "09:00:00"},
     )
@@ -88,10 +75,7 @@ def test_time_range_strategy_invalid_time_format_raises_exception():
     """
     with pytest.raises(InvalidConfigParamException):
         create_strategy_via_factory(
-            mode="NORMAL",
             strategy_name="TIME_RANGE_STRATEGY",
-            df=None,
-            col_name="col",
             rows=1,
             params={
                 "start_time": "09-00-00",
@@ -107,10 +91,7 @@ def test_time_range_strategy_via_factory_output_format():
     """
     output_format = "%I:%M:%S %p"
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="TIME_RANGE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=5,
         params={
             "start_time": "09:00:00",
@@ -131,10 +112,7 @@ def test_time_range_strategy_via_factory_overnight_range():
     Tests the strategy with an overnight time range.
     """
     strategy = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="TIME_RANGE_STRATEGY",
-        df=None,
-        col_name="col",
         rows=10,
         params={"start_time": "22:00:00", "end_time": "06:00:00"},
     )
@@ -142,3 +120,16 @@ def test_time_range_strategy_via_factory_overnight_range():
     for time_str in result:
         t = datetime.strptime(time_str, "%H:%M:%S").time()
         assert (t >= time(22, 0, 0)) or (t <= time(6, 0, 0))
+
+
+@pytest.mark.parametrize("output_format", ["%H:%M:%S", "%I:%M %p"])
+def test_format_second_offsets_matches_strftime(output_format):
+    """
+    Formatted seconds must match time.strftime, including the numpy fast path.
+    """
+    seconds = np.array([0, 59, 3600, 45296, 86399, 59])
+    expected = [
+        time(s // 3600, s // 60 % 60, s % 60).strftime(output_format)
+        for s in seconds.tolist()
+    ]
+    assert format_second_offsets(seconds, output_format).tolist() == expected
@@ -1,13 +1,15 @@
 import re
+import uuid
 
+import pytest
+
+from core.strategies import uuid_strategy
 from tests.strategies.base import create_strategy_via_factory
 
 
 def test_uuid_basic_generation():
     s = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="UUID_STRATEGY",
-        df=None,
         col_name="id",
         rows=5,
         params={},
@@ -22,9 +24,7 @@ def test_uuid_basic_generation():
 
 def test_uuid_no_hyphens_uppercase_prefix_alnum_unique():
     s = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="UUID_STRATEGY",
-        df=None,
         col_name="id",
         rows=100,
         params={
@@ -49,9 +49,7 @@ def test_uuid_no_hyphens_uppercase_prefix_alnum_unique():
 
 def test_uuid_numbers_only():
     s = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="UUID_STRATEGY",
-        df=None,
         col_name="id",
         rows=10,
         params={"numbers_only": True, "uppercase": True, "seed": 1},
@@ -65,9 +63,7 @@ def test_uuid_numbers_only():
 
 def test_uuid_v4_generation_default_format():
     s = create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="UUID_STRATEGY",
-        df=None,
         col_name="id",
         rows=5,
         params={"version": 4},
@@ -82,7 +78,6 @@ def test_uuid_v5_deterministic_chunk_progression():
     s = create_strategy_via_factory(
         mode="STREAM&BATCH",
         strategy_name="UUID_STRATEGY",
-        df=None,
         col_name="id",
         rows=6,
         params={"version": 5, "seed": 42},
@@ -91,3 +86,28 @@ def test_uuid_v5_deterministic_chunk_progression():
     second = s.generate_data(3)
     # No overlap between sequential chunks for v5 deterministic
     assert set(first.tolist()).isdisjoint(set(second.tolist()))
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"hyphens": False, "uppercase": True, "prefix": "ID_"},
+        {"numbers_only": True},
+    ],
+)
+def test_uuid_v4_batch_matches_uuid_module_formatting(monkeypatch, params):
+    data = bytes(range(48))
+    monkeypatch.setattr(uuid_strategy.os, "urandom", lambda n: data[:n])
+    s = create_strategy_via_factory(
+        strategy_name="UUID_STRATEGY",
+        col_name="id",
+        rows=3,
+        params={"version": 4, **params},
+    )
+    out = s.generate_data(3)
+    expected = [
+        s._format_uuid(uuid.UUID(bytes=data[i : i + 16], version=4))
+        for i in range(0, 48, 16)
+    ]
+    assert out.tolist() == expected
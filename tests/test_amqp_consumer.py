@@ -0,0 +1,182 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("proton")
+
+from proton import Message  # noqa: E402
+
+from messaging.amqp_config import AMQPConfig  # noqa: E402
+from messaging.amqp_consumer import AMQPConsumer  # noqa: E402
+
+
+class FakeDelivery:
+    def __init__(self):
+        self.states = []
+        self.settled = False
+
+    def update(self, state):
+        self.states.append(state)
+
+    def settle(self):
+        self.settled = True
+
+
+class FakeContainer:
+    def __init__(self):
+        self.scheduled = []
+
+    def schedule(self, delay, handler):
+        self.scheduled.append((delay, handler))
+        return object()
+
+
+def deliver(consumer, container, body='{"data": []}'):
+    delivery = FakeDelivery()
+    event = SimpleNamespace(
+        message=Message(body=body), delivery=delivery, container=container
+    )
+    consumer.on_message(event)
+    return delivery
+
+
+def make_consumer(store_messages=True, **options):
+    config = AMQPConfig({"url": "amqp://localhost:5672", "queue": "q", **options})
+    return AMQPConsumer(
+        config, message_handler=lambda *_: None, store_messages=store_messages
+    )
+
+
+def test_deliveries_are_accepted_in_batches():
+    consumer = make_consumer(ack_batch=3, prefetch=50)
+    container = FakeContainer()
+
+    first = [deliver(consumer, container) for _ in range(2)]
+    assert not any(d.settled for d in first)
+    assert len(container.scheduled) == 1
+
+    third = deliver(consumer, container)
+    assert all(d.settled for d in first + [third])
+    assert consumer.messages_received == 3
+
+
+def test_timer_accepts_partial_batch():
+    consumer = make_consumer(ack_batch=10)
+    container = FakeContainer()
+    delivery = deliver(consumer, container)
+    assert not delivery.settled
+
+    consumer.on_timer_task(None)
+    assert delivery.settled
+    assert consumer._ack_timer is None
+
+
+def test_messages_buffer_keeps_most_recent():
+    consumer = make_consumer(buffer_size=2)
+    container = FakeContainer()
+    for i in range(3):
+        deliver(consumer, container, body=f'{{"data": [{i}]}}')
+
+    assert consumer.messages_received == 3
+    assert [m["data"] for m in consumer.messages] == [[1], [2]]
+
+
+def test_store_messages_false_only_calls_handler():
+    seen = []
+    config = AMQPConfig({"url": "amqp://localhost:5672", "queue": "q"})
+    consumer = AMQPConsumer(
+        config,
+        message_handler=lambda data, _msg: seen.append(data),
+        store_messages=False,
+    )
+    deliver(consumer, FakeContainer())
+
+    assert seen == [{"data": []}]
+    assert len(consumer.messages) == 0
+
+
+def test_prefetch_and_ack_batch_must_be_positive():
+    with pytest.raises(ValueError):
+        make_consumer(prefetch=0)
+    with pytest.raises(ValueError):
+        make_consumer(ack_batch=0)
+
+
+def test_consume_messages_wakes_on_message_without_polling():
+    consumer = make_consumer()
+    consumer.running = True
+    container = FakeContainer()
+
+    timer = threading.Timer(0.05, lambda: deliver(consumer, container))
+    timer.start()
+    started = time.monotonic()
+    messages = consumer.consume_messages(max_messages=1, timeout=5)
+    timer.join()
+
+    assert len(messages) == 1
+    assert time.monotonic() - started < 1
+
+
+def test_consume_messages_honours_timeout():
+    consumer = make_consumer()
+    consumer.running = True
+    started = time.monotonic()
+    assert consumer.consume_messages(max_messages=1, timeout=0.05) == []
+    assert time.monotonic() - started < 1
+
+
+def test_claim_checked_message_roundtrip(tmp_path):
+    import pandas as pd
+
+    from messaging.amqp_producer import AMQPProducer
+    from messaging.serialization import loads_json
+
+    options = {"claim_check_dir": str(tmp_path), "claim_check_threshold": 64}
+    producer = AMQPProducer(
+        AMQPConfig({"url": "amqp://localhost:5672", "queue": "q", **options})
+    )
+    producer._connected = True
+    sent = []
+    producer._enqueue = lambda body, properties=None: sent.append(
+        Message(body=body, properties=properties)
+    )
+    producer.sender = object()
+
+    df = pd.DataFrame({"x": range(50)})
+    producer.send_dataframe(df, {"batch_index": 3})
+    reference = loads_json(sent[0].body)
+    assert set(reference) == {"claim_check"}
+    assert reference["claim_check"]["size"] > 64
+    assert len(list(tmp_path.iterdir())) == 1
+
+    received = []
+    consumer = AMQPConsumer(
+        AMQPConfig({"url": "amqp://localhost:5672", "queue": "q"}),
+        message_handler=lambda data, _raw: received.append(data),
+    )
+    event = SimpleNamespace(
+        message=sent[0], delivery=FakeDelivery(), container=FakeContainer()
+    )
+    consumer.on_message(event)
+    assert received[0]["batch_info"]["batch_index"] == 3
+    assert len(received[0]["data"]) == 50
+
+    # Small messages are sent inline
+    producer.send_message({"ok": True})
+    assert loads_json(sent[1].body) == {"ok": True}
+
+
+def test_default_handler_logs_at_debug_without_printing(capsys, caplog):
+    config = AMQPConfig({"url": "amqp://localhost:5672", "queue": "q"})
+    consumer = AMQPConsumer(config)
+    body = '{"batch_info": {"batch_index": 4}, "data": [], "metadata": {"rows": 7}}'
+
+    with caplog.at_level("DEBUG", logger="genxdata.amqp_consumer"):
+        deliver(consumer, FakeContainer(), body=body)
+
+    assert capsys.readouterr().out == ""
+    assert any(
+        "rows: 7" in r.message and "batch: 4" in r.message for r in caplog.records
+    )
@@ -0,0 +1,40 @@
+import threading
+
+import pytest
+
+pytest.importorskip("proton")
+
+from messaging.amqp_container import SharedContainer  # noqa: E402
+
+
+def run_on_container(fn):
+    done = threading.Event()
+    result = {}
+
+    def call(container):
+        try:
+            result["value"] = fn(container)
+        finally:
+            done.set()
+
+    SharedContainer.call(call)
+    assert done.wait(timeout=5)
+    return result.get("value")
+
+
+def test_calls_run_on_one_shared_thread():
+    first = run_on_container(lambda c: (threading.current_thread(), c))
+    second = run_on_container(lambda c: (threading.current_thread(), c))
+
+    assert first[0].name == "genxdata-amqp"
+    assert first[0] is not threading.current_thread()
+    assert first == second
+
+
+def test_failing_callback_does_not_stop_container():
+    def boom(_container):
+        raise RuntimeError("boom")
+
+    SharedContainer.call(boom)
+    thread = run_on_container(lambda _c: threading.current_thread())
+    assert thread.is_alive()
@@ -0,0 +1,165 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("proton")
+
+from proton import Message  # noqa: E402
+
+from messaging.amqp_config import AMQPConfig  # noqa: E402
+from messaging.amqp_producer import AMQPProducer  # noqa: E402
+
+
+class FakeSender:
+    def __init__(self, credit):
+        self.credit = credit
+        self.sent = []
+
+    def send(self, message):
+        # proton encodes the message here, so record a snapshot
+        self.credit -= 1
+        self.sent.append(
+            SimpleNamespace(
+                body=message.body,
+                properties=message.properties,
+                content_type=message.content_type,
+            )
+        )
+
+
+def make_producer(capacity=1000):
+    producer = AMQPProducer(
+        AMQPConfig({"url": "amqp://localhost:5672", "queue": "q", "capacity": capacity})
+    )
+    # Stand in for the shared container thread: drain synchronously
+    producer._wake = producer._drain
+    producer._connected = True
+    return producer
+
+
+def test_sends_are_queued_and_drained_up_to_credit():
+    producer = make_producer()
+    producer.sender = FakeSender(credit=2)
+
+    for i in range(3):
+        producer.send_message({"i": i})
+
+    assert len(producer.sender.sent) == 2
+    assert len(producer._outbox) == 1
+    assert producer.flush(timeout=0) is False
+
+    producer.sender.credit = 5
+    producer.on_sendable(None)
+    assert len(producer.sender.sent) == 3
+    assert producer.flush(timeout=0) is True
+
+
+def test_full_outbox_unblocks_when_link_fails():
+    producer = make_producer(capacity=1)
+    producer.sender = FakeSender(credit=0)
+    producer.send_message("first")
+
+    errors = []
+
+    def blocked_send():
+        try:
+            producer.send_message("second")
+        except ConnectionError as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=blocked_send)
+    thread.start()
+    producer.on_link_error(None)
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert len(errors) == 1
+
+
+def test_full_outbox_unblocks_as_soon_as_one_slot_frees():
+    producer = make_producer(capacity=2)
+    producer.sender = FakeSender(credit=0)
+    producer.send_message("first")
+    producer.send_message("second")
+
+    thread = threading.Thread(target=producer.send_message, args=("third",))
+    thread.start()
+    producer.sender.credit = 1
+    producer.on_sendable(None)
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert [m.body for m in producer.sender.sent] == ["first"]
+    assert len(producer._outbox) == 2
+
+
+def test_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        AMQPConfig({"url": "amqp://localhost:5672", "queue": "q", "capacity": 0})
+
+
+def test_encoded_dataframe_fans_out_to_several_producers():
+    import pandas as pd
+
+    from messaging.serialization import loads_json
+
+    producers = [make_producer(), make_producer()]
+    for producer in producers:
+        producer.sender = FakeSender(credit=10)
+
+    df = pd.DataFrame({"x": [1, 2]})
+    payload = AMQPProducer.encode_dataframe(df, {"batch_index": 0})
+    for producer in producers:
+        producer.send_encoded(payload)
+
+    bodies = [p.sender.sent[0].body for p in producers]
+    assert bodies[0] == bodies[1]
+    assert loads_json(bodies[0])["data"] == [{"x": 1}, {"x": 2}]
+
+    producers[0].send_dataframe(df, {"batch_index": 0})
+    assert producers[0].sender.sent[1].body == bodies[0]
+
+
+def test_send_before_connect_raises():
+    producer = make_producer()
+    producer._connected = False
+
+    with pytest.raises(ConnectionError):
+        producer.send_encoded(b"{}")
+    assert not producer._outbox
+
+
+def test_drain_reuses_one_message_object():
+    from messaging.serialization import loads_json
+
+    producer = make_producer()
+    producer.sender = FakeSender(credit=10)
+    seen = set()
+    send = producer.sender.send
+    producer.sender.send = lambda message: (seen.add(id(message)), send(message))
+
+    producer.send_bytes(b"\x00", {"format": "arrow-ipc"})
+    producer.send_message({"i": 1})
+
+    assert len(seen) == 1
+    first, second = producer.sender.sent
+    assert first.properties == {"format": "arrow-ipc"}
+    assert second.properties is None
+    assert loads_json(second.body) == {"i": 1}
+
+
+def test_content_type_header_sets_message_content_type():
+    producer = make_producer()
+    producer.sender = FakeSender(credit=10)
+
+    producer.send_bytes(
+        b"\x00", {"format": "arrow-ipc", "content_type": "application/x-test"}
+    )
+    producer.send_message("plain")
+
+    binary, text = producer.sender.sent
+    assert binary.content_type == "application/x-test"
+    assert binary.properties == {"format": "arrow-ipc"}
+    # Unset, exactly as on a fresh proton Message
+    assert text.content_type == Message().content_type
@@ -16,3 +16,14 @@ def test_get_file_info_not_written(tmp_path):
     assert info["exists"] is False
     assert info["writer_type"]
 
+
+
+def test_write_creates_batch_directories_once(tmp_path):
+    import pandas as pd
+
+    w = CsvFileWriter({"output_path": str(tmp_path / "b{batch_index}" / "out.csv")})
+    df = pd.DataFrame({"a": [1]})
+    assert w.write(df, {"batch_index": 1})["status"] == "success"
+    assert w.write(df, {"batch_index": 1})["status"] == "success"
+    assert w.write(df, {"batch_index": 2})["status"] == "success"
+    assert w._dirs_created == {str(tmp_path / "b1"), str(tmp_path / "b2")}
@@ -1,6 +1,8 @@
 import pandas as pd
+import pytest
 
 from core.base_strategy import BaseStrategy
+from tests.strategies.base import create_strategy_via_factory
 
 
 class _StubStrategy(BaseStrategy):
@@ -25,3 +27,48 @@ def test_apply_to_dataframe_no_mask_and_with_mask():
     out2 = s.apply_to_dataframe(df2, "out", "a > 1")
     assert out2["out"].notna().sum() == 2
 
+
+def test_generate_batch_calls_chunk_per_count_for_dependent_rows():
+    s = _StubStrategy(mode="NORMAL", df=None, col_name="out", rows=0, params={})
+
+    parts = s.generate_batch([2, 3, 0])
+
+    assert [p.tolist() for p in parts] == [[0, 1], [0, 1, 2], []]
+    assert s.generate_batch([]) == []
+
+
+def test_generate_batch_splits_one_draw_for_independent_rows():
+    s = create_strategy_via_factory(
+        strategy_name="RANDOM_NUMBER_RANGE_STRATEGY",
+        col_name="n",
+        rows=10,
+        params={"start": 1, "end": 100, "seed": 11},
+    )
+
+    parts = s.generate_batch([4, 6])
+    whole = s.generate_data(10)
+
+    assert [len(p) for p in parts] == [4, 6]
+    assert pd.concat(parts).tolist() == whole.tolist()
+    assert parts[1].index.tolist() == list(range(6))
+
+
+def test_generate_batch_keeps_arrow_string_dtype():
+    pytest.importorskip("pyarrow")
+    s = create_strategy_via_factory(
+        strategy_name="TIME_RANGE_STRATEGY",
+        col_name="t",
+        rows=4,
+        params={
+            "start_time": "08:00:00",
+            "end_time": "17:00:00",
+            "string_storage": "pyarrow",
+            "seed": 3,
+        },
+    )
+
+    parts = s.generate_batch([2, 2])
+
+    assert [p.dtype for p in parts] == [s.generate_data(2).dtype] * 2
+    assert all(p.dtype == "string[pyarrow]" for p in parts)
+    assert parts[1].index.tolist() == [0, 1]
@@ -0,0 +1,105 @@
+import copy
+import pickle
+
+import pytest
+
+from exceptions import (
+    BatchProcessingException,
+    ConfigException,
+    ConfigurationError,
+    ErrorSeverity,
+    GenXDataError,
+    InvalidConfigParamException,
+    StreamingException,
+    UnsupportedStrategyException,
+)
+
+
+@pytest.mark.parametrize(
+    "round_trip",
+    [lambda e: pickle.loads(pickle.dumps(e)), copy.copy, copy.deepcopy],
+    ids=["pickle", "copy", "deepcopy"],
+)
+def test_exceptions_keep_fields_across_pickle_and_copy(round_trip):
+    err = InvalidConfigParamException(
+        "bad", error_code="VAL010", context={"column": "a"}
+    )
+    restored = round_trip(err)
+    assert type(restored) is InvalidConfigParamException
+    assert restored.message == "bad"
+    assert restored.error_code == "VAL010"
+    assert restored.context["column"] == "a"
+    assert str(restored) == str(err)
+    assert "[VAL010]" in str(restored)
+
+
+def test_instance_severity_overrides_class_default():
+    err = StreamingException("down", severity=ErrorSeverity.CRITICAL)
+    assert err.severity is ErrorSeverity.CRITICAL
+    assert err.is_critical()
+    assert StreamingException.severity is ErrorSeverity.ERROR
+
+
+@pytest.mark.parametrize(
+    "cls",
+    [
+        BatchProcessingException,
+        ConfigException,
+        InvalidConfigParamException,
+        UnsupportedStrategyException,
+    ],
+)
+def test_exceptions_raise_and_catch(cls):
+    with pytest.raises(GenXDataError) as exc_info:
+        raise cls("bad input")
+    assert exc_info.value.message == "bad input"
+    assert "bad input" in str(exc_info.value)
+
+
+def test_context_is_none_unless_provided():
+    err = ConfigException("boom")
+    assert err.context is None
+    assert err.get_context_summary() == "No context available"
+
+    context = {"strategy_name": "RANDOM_NAME"}
+    err = UnsupportedStrategyException("nope", context=context)
+    assert err.context is context
+    assert context["error_category"] == "Strategy"
+    assert err.get_context_summary() == "strategy_name=RANDOM_NAME"
+
+
+def test_str_is_formatted_once_and_reused():
+    err = InvalidConfigParamException("bad param", error_code="VAL010")
+    text = str(err)
+    assert text == "[ERROR] Validation Error [VAL010]: bad param"
+    assert str(err) is text
+
+
+def test_category_value_tracks_class_category():
+    assert ConfigurationError.category_value == "Configuration"
+    assert StreamingException.category_value == "Network"
+    assert BatchProcessingException.category_value == "Processing"
+    err = StreamingException("down", severity=ErrorSeverity.WARNING)
+    assert str(err).startswith("[WARNING] Network Error [NET002]")
+    assert "severity='WARNING'" in repr(err)
+
+
+def test_message_resolution_order():
+    assert ConfigException("explicit", error_code="GEN007").message == "explicit"
+    assert (
+        ConfigException(error_code="GEN007").message
+        == "General configuration processing error."
+    )
+    assert (
+        ConfigException(error_code="UNKNOWN").message
+        == "Configuration processing error occurred"
+    )
+
+
+def test_concrete_exceptions_fall_back_to_class_default_message():
+    assert StreamingException().message == "Streaming configuration or connection error"
+    assert (
+        BatchProcessingException(error_code="GEN008").message
+        == "Batch processing configuration error."
+    )
+    assert "__init__" not in StreamingException.__dict__
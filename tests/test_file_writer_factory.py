@@ -1,3 +1,5 @@
+from pathlib import Path
+
 import pytest
 
 from core.writers.file_writer_factory import FileWriterFactory
@@ -34,3 +36,70 @@ def test_unsupported_writer_type_message():
         fac.create_writer("not-a-writer", {"output_path": "out.xyz"})
     assert "Supported types:" in str(exc.value)
 
+
+
+def test_writer_classes_resolved_lazily_and_cached(tmp_path):
+    from core.writers.json_file_writer import JsonFileWriter
+
+    FileWriterFactory._WRITER_CLASS_CACHE.pop("json", None)
+    writer = FileWriterFactory().create_writer(
+        "json", {"output_path": str(tmp_path / "a.json")}
+    )
+    assert isinstance(writer, JsonFileWriter)
+    assert FileWriterFactory._WRITER_CLASS_CACHE["json"] is JsonFileWriter
+
+
+def test_register_writer_updates_supported_types(tmp_path):
+    from core.writers.csv_file_writer import CsvFileWriter
+
+    class TsvFileWriter(CsvFileWriter):
+        pass
+
+    try:
+        FileWriterFactory.register_writer("tsv", TsvFileWriter)
+        assert "tsv" in FileWriterFactory.get_supported_types()
+        writer = FileWriterFactory().create_writer(
+            "TSV_WRITER", {"output_path": str(tmp_path / "a.csv")}
+        )
+        assert isinstance(writer, TsvFileWriter)
+    finally:
+        FileWriterFactory._REGISTERED_WRITERS.pop("tsv", None)
+        FileWriterFactory._WRITER_CLASS_CACHE.pop("tsv", None)
+        FileWriterFactory._SUPPORTED_TYPES = tuple(
+            FileWriterFactory._REGISTERED_WRITERS
+        )
+
+    with pytest.raises(TypeError):
+        FileWriterFactory._WRITER_REGISTRY["tsv"] = ("x", "y")
+
+
+def test_module_level_helpers_use_shared_factory(tmp_path):
+    from core.writers import file_writer_factory
+
+    writer = file_writer_factory.create_writer(
+        "csv", {"output_path": str(tmp_path / "a.csv")}
+    )
+    assert writer.writer_kind == "csv"
+    writers = file_writer_factory.create_multiple_writers(
+        [{"type": "json", "params": {"output_path": str(tmp_path / "b.json")}}]
+    )
+    assert [w.writer_kind for w in writers] == ["json"]
+    assert FileWriterFactory().logger is file_writer_factory._DEFAULT_FACTORY.logger
+
+
+def test_csv_only_path_leaves_other_writers_unimported(tmp_path):
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "from core.writers import file_writer_factory\n"
+        "file_writer_factory.create_writer("
+        f"'csv', {{'output_path': {str(tmp_path / 'a.csv')!r}}})\n"
+        "for name in ('excel_file_writer', 'parquet_file_writer', 'stream_writer'):\n"
+        "    assert 'core.writers.' + name not in sys.modules, name\n"
+        "from core.writers import ExcelFileWriter, StreamWriter\n"
+        "assert StreamWriter.__module__ == 'core.writers.stream_writer'\n"
+    )
+    repo_root = Path(__file__).resolve().parents[1]
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=repo_root)
@@ -0,0 +1,257 @@
+import pytest
+
+from messaging.kafka_config import DEFAULT_BATCH_SIZE, DEFAULT_LINGER_MS, KafkaConfig
+
+
+def make_config(**options):
+    return KafkaConfig({"bootstrap_servers": "localhost:9092", "topic": "t", **options})
+
+
+def test_defaults_favour_batching_and_compression():
+    producer_config = make_config().get_producer_config()
+    assert producer_config["batch_size"] == DEFAULT_BATCH_SIZE
+    assert producer_config["linger_ms"] == DEFAULT_LINGER_MS
+    assert producer_config["compression_type"] in ("lz4", "gzip")
+
+
+def test_low_latency_overrides():
+    producer_config = make_config(
+        linger_ms=0, compression_type="none"
+    ).get_producer_config()
+    assert producer_config["linger_ms"] == 0
+    assert producer_config["compression_type"] is None
+
+
+class FakeFuture:
+    def __init__(self):
+        self.callbacks = []
+        self.errbacks = []
+
+    def add_callback(self, fn):
+        self.callbacks.append(fn)
+        return self
+
+    def add_errback(self, fn):
+        self.errbacks.append(fn)
+        return self
+
+
+class FakeClient:
+    def __init__(self):
+        self.futures = []
+        self.keys = []
+        self.partitions = []
+        self.values = []
+        self.flushed = 0
+
+    def send(self, topic, value=None, key=None, headers=None, partition=None):
+        self.keys.append(key)
+        self.partitions.append(partition)
+        self.values.append(value)
+        self.futures.append(FakeFuture())
+        return self.futures[-1]
+
+    def flush(self, timeout=None):
+        self.flushed += 1
+
+    def close(self, timeout=None):
+        pass
+
+
+def make_producer(**options):
+    from messaging.kafka_producer import KafkaProducer
+
+    producer = KafkaProducer(make_config(**options))
+    producer._attach(FakeClient())
+    return producer
+
+
+def test_sends_do_not_wait_and_failures_surface_later():
+    producer = make_producer(max_in_flight=2)
+    producer.send_message({"a": 1})
+    producer.send_encoded(b"{}")
+    client = producer.producer
+    assert len(client.futures) == 2
+
+    client.futures[0].callbacks[0](object())
+    client.futures[1].errbacks[0](RuntimeError("broker down"))
+
+    with pytest.raises(RuntimeError, match="broker down"):
+        producer.send_message({"a": 2})
+    producer.send_message({"a": 3})
+    producer.await_all()
+    assert client.flushed == 1
+
+
+def test_in_flight_limit_is_enforced():
+    producer = make_producer(max_in_flight=1)
+    producer.send_message({"a": 1})
+    assert producer._inflight.acquire(blocking=False) is False
+    producer.producer.futures[0].callbacks[0](object())
+    assert producer._inflight.acquire(blocking=False) is True
+
+
+def test_sends_require_connection_and_stop_after_disconnect():
+    import pytest
+
+    from messaging.kafka_producer import KafkaProducer
+
+    with pytest.raises(ConnectionError):
+        KafkaProducer(make_config()).send_message({"x": 1})
+
+    producer = make_producer()
+    producer.send_message({"x": 1})
+    producer.disconnect()
+    with pytest.raises(ConnectionError):
+        producer.send_encoded(b"{}")
+
+
+def test_confluent_backend_config_uses_librdkafka_names():
+    config = make_config(
+        backend="confluent",
+        bootstrap_servers=["a:9092", "b:9092"],
+        compression_type="none",
+        sasl_mechanism="PLAIN",
+        sasl_username="u",
+    )
+    rd_config = config.get_confluent_config()
+    assert rd_config["bootstrap.servers"] == "a:9092,b:9092"
+    assert rd_config["linger.ms"] == DEFAULT_LINGER_MS
+    assert rd_config["compression.type"] == "none"
+    assert rd_config["sasl.username"] == "u"
+    assert make_config(backend="confluent").compression_type == "lz4"
+
+    with pytest.raises(ValueError):
+        make_config(backend="librdkafka")
+
+
+class FakeConfluentProducer:
+    def __init__(self, full_once=False):
+        self.full_once = full_once
+        self.pending = []
+        self.produced = []
+
+    def produce(self, topic, value=None, key=None, headers=None, on_delivery=None):
+        if self.full_once:
+            self.full_once = False
+            raise BufferError("queue full")
+        self.produced.append((topic, value, headers))
+        self.pending.append((on_delivery, value))
+
+    def poll(self, timeout):
+        pending, self.pending = self.pending, []
+        for callback, value in pending:
+            callback("broker down" if b"fail" in value else None, object())
+        return len(pending)
+
+    def flush(self, timeout=-1):
+        self.poll(0)
+        return 0
+
+
+def test_confluent_client_reports_deliveries_through_producer():
+    from messaging.kafka_producer import KafkaProducer, _ConfluentClient
+    from messaging.serialization import loads_json
+
+    fake = FakeConfluentProducer(full_once=True)
+    producer = KafkaProducer(make_config(backend="confluent", max_in_flight=5))
+    producer._attach(_ConfluentClient(fake))
+
+    producer.send_message({"x": 1})
+    producer.send_encoded(b'{"fail": 2}')
+    values = [loads_json(value) for _topic, value, _headers in fake.produced]
+    assert values == [{"x": 1}, {"fail": 2}]
+
+    with pytest.raises(RuntimeError, match="broker down"):
+        producer.await_all()
+    # Both in-flight slots were released by the delivery reports
+    assert producer._inflight._value == 5
+
+
+class DeferredConfluentProducer(FakeConfluentProducer):
+    """Acknowledges each record 50 ms after produce, and only when polled."""
+
+    def produce(self, topic, value=None, key=None, headers=None, on_delivery=None):
+        import time
+
+        self.produced.append((topic, value, headers))
+        self.pending.append((time.monotonic() + 0.05, on_delivery))
+
+    def poll(self, timeout):
+        import time
+
+        now = time.monotonic()
+        due = [p for p in self.pending if p[0] <= now]
+        self.pending = [p for p in self.pending if p[0] > now]
+        for _when, callback in due:
+            callback(None, object())
+        return len(due)
+
+
+def test_confluent_send_polls_while_waiting_for_in_flight_slot():
+    import threading
+
+    from messaging.kafka_producer import KafkaProducer, _ConfluentClient
+
+    fake = DeferredConfluentProducer()
+    producer = KafkaProducer(make_config(backend="confluent", max_in_flight=1))
+    producer._attach(_ConfluentClient(fake))
+
+    sender = threading.Thread(
+        target=lambda: [producer.send_message({"i": i}) for i in range(3)],
+        daemon=True,
+    )
+    sender.start()
+    sender.join(timeout=3)
+    assert not sender.is_alive()
+    assert len(fake.produced) == 3
+
+
+def test_partition_key_column_splits_dataframe_by_stable_hash():
+    import pandas as pd
+
+    from messaging.serialization import loads_json
+
+    producer = make_producer(num_partitions=3, partition_key_column="user")
+    df = pd.DataFrame({"user": ["a", "b", "c", "a", "d", "b"], "x": range(6)})
+    client = producer.producer
+
+    def sent_owners():
+        owners = {}
+        for key, value in zip(client.keys, client.values, strict=True):
+            message = loads_json(value)
+            assert message["batch_info"]["partition_key"] == int(key)
+            for row in message["data"]:
+                owners.setdefault(row["user"], set()).add(key)
+        return owners
+
+    producer.send_dataframe(df, {"batch_index": 2})
+    assert 1 <= len(client.keys) <= 3
+    assert len(set(client.keys)) == len(client.keys)
+    assert client.partitions == [int(key) for key in client.keys]
+    rows = sorted(row["x"] for v in client.values for row in loads_json(v)["data"])
+    assert rows == list(range(6))
+
+    # Every row for a user goes to the same part, batch after batch
+    producer.send_dataframe(df.iloc[::-1])
+    assert all(len(keys) == 1 for keys in sent_owners().values())
+
+
+def test_partitions_without_key_column_are_contiguous_chunks():
+    import pandas as pd
+
+    from messaging.serialization import loads_json
+
+    producer = make_producer(num_partitions=4)
+    producer.send_dataframe(pd.DataFrame({"x": range(3)}))
+
+    client = producer.producer
+    assert client.keys == [b"0", b"1", b"2"]
+    assert client.partitions == [0, 1, 2]
+    assert [loads_json(v)["data"] for v in client.values] == [
+        [{"x": 0}],
+        [{"x": 1}],
+        [{"x": 2}],
+    ]
+    with pytest.raises(ValueError):
+        make_config(num_partitions=0)
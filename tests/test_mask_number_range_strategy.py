@@ -21,7 +21,6 @@ def _make_df():
 
 def _new_strategy(df: pd.DataFrame):
     return create_strategy_via_factory(
-        mode="NORMAL",
         strategy_name="RANDOM_NUMBER_RANGE_STRATEGY",
         df=df.copy(),
         col_name="out",
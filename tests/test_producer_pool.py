@@ -0,0 +1,77 @@
+import pandas as pd
+
+from core.writers.stream_writer import StreamWriter
+from messaging.producer_pool import ProducerPool
+
+
+class CountingProducer:
+    def __init__(self):
+        self.connects = 0
+        self.disconnects = 0
+        self.sent = 0
+
+    def connect(self):
+        self.connects += 1
+
+    def disconnect(self):
+        self.disconnects += 1
+
+    def send_dataframe(self, df, batch_info=None):
+        self.sent += 1
+
+
+def test_pool_refcounts_and_disconnects_on_last_release():
+    created = []
+
+    def factory():
+        producer = CountingProducer()
+        created.append(producer)
+        return producer
+
+    key = ProducerPool.make_key({"amqp": {"queue": "pool-test", "host": "h"}})
+    first = ProducerPool.acquire(key, factory)
+    second = ProducerPool.acquire(key, factory)
+    assert first is second
+    assert len(created) == 1
+
+    assert ProducerPool.release(key) is False
+    assert first.disconnects == 0
+    assert ProducerPool.release(key) is True
+    assert first.disconnects == 1
+    assert ProducerPool.release(key) is False
+
+
+def test_pool_key_ignores_dict_order():
+    assert ProducerPool.make_key({"a": {"x": 1, "y": 2}}) == ProducerPool.make_key(
+        {"a": {"y": 2, "x": 1}}
+    )
+
+
+def test_stream_writers_share_pooled_connection(monkeypatch, caplog):
+    producers = []
+
+    class Factory:
+        @staticmethod
+        def create_from_config(_cfg):
+            producers.append(CountingProducer())
+            return producers[-1]
+
+    monkeypatch.setattr("messaging.factory.QueueFactory", Factory, raising=True)
+
+    cfg = {"amqp": {"host": "x", "port": 5672, "queue": "shared"}}
+    writers = [StreamWriter(cfg), StreamWriter(cfg)]
+    df = pd.DataFrame({"x": [1]})
+    with caplog.at_level("INFO", logger="genxdata.stream_writer"):
+        for writer in writers:
+            assert writer.write(df)["status"] == "success"
+
+    connected = [r for r in caplog.records if "connected to message queue" in r.message]
+    assert len(connected) == 1
+    assert len(producers) == 1
+    assert producers[0].connects == 1
+    assert producers[0].sent == 2
+
+    writers[0].finalize()
+    assert producers[0].disconnects == 0
+    writers[1].finalize()
+    assert producers[0].disconnects == 1
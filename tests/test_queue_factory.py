@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import pytest
+
+from messaging.base import QueueConfig, QueueProducer
+from messaging.factory import QueueFactory
+
+
+class MemoryConfig(QueueConfig):
+    def validate_config(self):
+        pass
+
+    @property
+    def queue_type(self):
+        return "memory"
+
+    def get_producer_config(self):
+        return dict(self.config)
+
+
+class MemoryProducer(QueueProducer):
+    def connect(self):
+        pass
+
+    def disconnect(self):
+        pass
+
+    def send_message(self, message_data):
+        pass
+
+    def send_dataframe(self, df, batch_info=None, orient="records"):
+        pass
+
+
+@pytest.fixture
+def memory_queue(monkeypatch):
+    monkeypatch.setattr(QueueFactory, "_registry", dict(QueueFactory._registry))
+    QueueFactory.register_queue_type("memory", MemoryConfig, MemoryProducer)
+
+
+def test_registered_queue_type_resolves_from_stream_config(memory_queue):
+    producer = QueueFactory.create_from_config({"memory": {"queue": "q"}})
+
+    assert isinstance(producer, MemoryProducer)
+    assert producer.config.config == {"queue": "q"}
+    assert "memory" in QueueFactory.get_supported_queue_types()
+
+
+def test_unknown_queue_type_lists_available_types():
+    with pytest.raises(ValueError, match="amqp, kafka"):
+        QueueFactory.create_config("redis", {})
+    with pytest.raises(ValueError, match="Expected one of"):
+        QueueFactory.create_from_config({"redis": {}})
+
+
+def test_backends_are_imported_on_first_use():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "from messaging.factory import QueueFactory\n"
+        "assert 'messaging.amqp_producer' not in sys.modules\n"
+        "config = QueueFactory.create_config("
+        "'kafka', {'bootstrap_servers': 'b:9092', 'topic': 't'})\n"
+        "assert type(config).__name__ == 'KafkaConfig'\n"
+        "assert 'messaging.amqp_producer' not in sys.modules\n"
+    )
+    repo_root = Path(__file__).resolve().parents[1]
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=repo_root)
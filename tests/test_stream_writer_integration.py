@@ -1,6 +1,8 @@
+import json
 from types import SimpleNamespace
 
 import pandas as pd
+import pytest
 
 from core.writers.stream_writer import StreamWriter
 
@@ -30,9 +32,7 @@ class DummyFactory:
 
 def test_stream_writer_sends_batches(monkeypatch):
     # Patch the symbol used inside core.writers.stream_writer
-    monkeypatch.setattr(
-        "core.writers.stream_writer.QueueFactory", DummyFactory, raising=True
-    )
+    monkeypatch.setattr("messaging.factory.QueueFactory", DummyFactory, raising=True)
 
     # Use nested config as expected by StreamWriter (top-level 'amqp' or 'kafka')
     cfg = {"amqp": {"type": "amqp", "host": "x", "port": 5672, "queue": "q"}}
@@ -45,3 +45,396 @@ def test_stream_writer_sends_batches(monkeypatch):
     summary = writer.finalize()
     assert summary["total_rows_written"] == 3
     assert summary["total_batches_sent"] == 1
+
+
+class FlushingProducer(DummyProducer):
+    def __init__(self):
+        super().__init__()
+        self.flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+
+
+def test_stream_writer_linger_buffers_until_finalize(monkeypatch):
+    producer = FlushingProducer()
+
+    class Factory:
+        @staticmethod
+        def create_from_config(_cfg):
+            return producer
+
+    monkeypatch.setattr("messaging.factory.QueueFactory", Factory, raising=True)
+
+    cfg = {"amqp": {"host": "x", "port": 5672, "queue": "linger", "linger_ms": 60000}}
+    writer = StreamWriter(cfg)
+    df = pd.DataFrame({"x": [1, 2, 3]})
+    assert writer.write(df, {"batch_index": 1})["status"] == "queued"
+    assert writer.write(df, {"batch_index": 2})["status"] == "queued"
+    assert producer.sent_batches == []
+
+    summary = writer.finalize()
+    assert [info["batch_index"] for _df, info in producer.sent_batches] == [1, 2]
+    assert producer.flushes == 1
+    assert summary["total_batches_sent"] == 2
+
+
+def test_stream_writer_linger_keeps_batches_when_send_fails(monkeypatch):
+    class FailingProducer(FlushingProducer):
+        fail = True
+
+        def send_dataframe(self, df, batch_info=None):
+            if self.fail:
+                raise ConnectionError("broker unavailable")
+            super().send_dataframe(df, batch_info)
+
+    producer = FailingProducer()
+
+    class Factory:
+        @staticmethod
+        def create_from_config(_cfg):
+            return producer
+
+    monkeypatch.setattr("messaging.factory.QueueFactory", Factory, raising=True)
+
+    cfg = {"amqp": {"host": "x", "port": 5672, "queue": "retry", "linger_ms": 60000}}
+    writer = StreamWriter(cfg)
+    df = pd.DataFrame({"x": [1, 2, 3]})
+    assert writer.write(df, {"batch_index": 1})["status"] == "queued"
+
+    # A failed timer flush is reported by the next write, and nothing is dropped
+    writer._flush_on_linger()
+    result = writer.write(df, {"batch_index": 2})
+    assert result["status"] == "error"
+    assert "broker unavailable" in result["error"]
+    assert writer.write(df, {"batch_index": 3})["status"] == "queued"
+
+    producer.fail = False
+    summary = writer.finalize()
+    assert [info["batch_index"] for _df, info in producer.sent_batches] == [1, 3]
+    assert summary["total_batches_sent"] == 2
+
+
+def test_stream_writer_finalize_raises_when_buffer_cannot_be_sent(monkeypatch):
+    class FailingProducer(FlushingProducer):
+        def send_dataframe(self, df, batch_info=None):
+            raise ConnectionError("broker unavailable")
+
+    class Factory:
+        @staticmethod
+        def create_from_config(_cfg):
+            return FailingProducer()
+
+    monkeypatch.setattr("messaging.factory.QueueFactory", Factory, raising=True)
+
+    cfg = {"amqp": {"host": "x", "port": 5672, "queue": "lost", "linger_ms": 60000}}
+    writer = StreamWriter(cfg)
+    writer.write(pd.DataFrame({"x": [1]}), {"batch_index": 1})
+
+    with pytest.raises(ConnectionError, match="broker unavailable"):
+        writer.finalize()
+    assert writer.queue_producer is None
+
+
+def test_stream_writer_flushes_when_pending_bytes_reached(monkeypatch):
+    producer = FlushingProducer()
+
+    class Factory:
+        @staticmethod
+        def create_from_config(_cfg):
+            return producer
+
+    monkeypatch.setattr("messaging.factory.QueueFactory", Factory, raising=True)
+
+    cfg = {
+        "amqp": {
+            "host": "x",
+            "port": 5672,
+            "queue": "threshold",
+            "linger_ms": 60000,
+            "max_pending_bytes": 32,
+        }
+    }
+    writer = StreamWriter(cfg)
+    df = pd.DataFrame({"x": [1, 2, 3]})  # 24 bytes of int64
+    assert writer.write(df)["status"] == "queued"
+    assert writer.write(df)["status"] == "success"
+    assert len(producer.sent_batches) == 2
+    assert producer.flushes == 1
+    writer.finalize()
+
+
+def test_stream_writer_arrow_payload_roundtrip(monkeypatch):
+    pytest.importorskip("pyarrow")
+
+    from messaging.amqp_consumer import AMQPConsumer
+    from messaging.serialization import arrow_ipc_to_dataframe
+
+    class BytesProducer(DummyProducer):
+        def __init__(self):
+            super().__init__()
+            self.payloads = []
+
+        def send_bytes(self, payload, headers=None):
+            self.payloads.append((payload, headers))
+
+    producer = BytesProducer()
+
+    class Factory:
+        @staticmethod
+        def create_from_config(_cfg):
+            return producer
+
+    monkeypatch.setattr("messaging.factory.QueueFactory", Factory, raising=True)
+
+    cfg = {
+        "amqp": {"host": "x", "port": 5672, "queue": "arrow", "payload_format": "arrow"}
+    }
+    writer = StreamWriter(cfg)
+    df = pd.DataFrame({"x": [1, 2, 3], "s": ["a", "b", None]})
+    assert writer.write(df, {"batch_index": 7})["status"] == "success"
+    writer.finalize()
+
+    assert producer.sent_batches == []
+    payload, headers = producer.payloads[0]
+    assert headers["format"] == "arrow-ipc"
+    assert headers["codec"] == "zstd"
+    assert headers["content_type"] == "application/vnd.apache.arrow.stream"
+    assert json.loads(headers["batch_info"])["batch_index"] == 7
+    pd.testing.assert_frame_equal(arrow_ipc_to_dataframe(payload), df)
+
+    message = AMQPConsumer._decode_arrow_message(payload, headers)
+    assert message["batch_info"]["batch_index"] == 7
+    assert message["data"][0] == {"x": 1, "s": "a"}
+
+
+def test_stream_writer_arrow_encoder_reused_per_schema(monkeypatch):
+    pytest.importorskip("pyarrow")
+
+    from messaging.serialization import arrow_ipc_to_dataframe
+
+    class BytesProducer(DummyProducer):
+        def __init__(self):
+            super().__init__()
+            self.payloads = []
+
+        def send_bytes(self, payload, headers=None):
+            self.payloads.append(payload)
+
+    producer = BytesProducer()
+
+    class Factory:
+        @staticmethod
+        def create_from_config(_cfg):
+            return producer
+
+    monkeypatch.setattr("messaging.factory.QueueFactory", Factory, raising=True)
+
+    cfg = {
+        "amqp": {"host": "x", "port": 5672, "queue": "arrow", "payload_format": "arrow"}
+    }
+    writer = StreamWriter(cfg)
+    first = pd.DataFrame({"x": [1, 2], "s": ["a", "b"]})
+    writer.write(first)
+    encoder = writer._arrow_encoder
+    assert encoder is not None
+
+    # Same schema reuses the encoder; values that do not fit fall back
+    second = pd.DataFrame({"x": [3], "s": pd.Series([4], dtype=object)})
+    writer.write(second)
+    assert writer._arrow_encoder is encoder
+
+    third = pd.DataFrame({"x": [1.5], "s": ["c"]})
+    writer.write(third)
+    assert writer._arrow_encoder is not encoder
+    writer.finalize()
+
+    decoded = [arrow_ipc_to_dataframe(p) for p in producer.payloads]
+    pd.testing.assert_frame_equal(decoded[0], first)
+    assert decoded[1]["x"].tolist() == [3]
+    pd.testing.assert_frame_equal(decoded[2], third)
+
+
+def test_stream_writer_rejects_unknown_payload_format():
+    cfg = {"amqp": {"host": "x", "port": 5672, "queue": "q", "payload_format": "xml"}}
+    with pytest.raises(ValueError):
+        StreamWriter(cfg)
+
+
+def test_stream_writer_timestamp_defaults_to_utc_and_keeps_caller_value(monkeypatch):
+    producer = DummyProducer()
+
+    class Factory:
+        @staticmethod
+        def create_from_config(_cfg):
+            return producer
+
+    monkeypatch.setattr("messaging.factory.QueueFactory", Factory, raising=True)
+
+    writer = StreamWriter({"amqp": {"host": "x", "port": 5672, "queue": "ts"}})
+    df = pd.DataFrame({"x": [1]})
+    own = writer.write(df)["batch_info"]["timestamp"]
+    assert own.endswith("+00:00")
+    given = writer.write(df, {"timestamp": "2025-01-01T00:00:00"})["batch_info"]
+    assert given["timestamp"] == "2025-01-01T00:00:00"
+    writer.finalize()
+
+
+def test_stream_writer_reuses_column_tuple_for_same_schema(monkeypatch):
+    monkeypatch.setattr("messaging.factory.QueueFactory", DummyFactory, raising=True)
+
+    writer = StreamWriter({"amqp": {"host": "x", "port": 5672, "queue": "cols"}})
+    first = writer.write(pd.DataFrame({"a": [1], "b": [2]}))["batch_info"]["columns"]
+    second = writer.write(pd.DataFrame({"a": [3], "b": [4]}))["batch_info"]["columns"]
+    third = writer.write(pd.DataFrame({"c": [5]}))["batch_info"]["columns"]
+    assert first == ("a", "b")
+    assert second is first
+    assert third == ("c",)
+    writer.finalize()
+
+
+def test_dumps_json_handles_numpy_and_unknown_types():
+    import numpy as np
+
+    from messaging.serialization import dumps_json
+
+    payload = dumps_json(
+        {"rows": np.int64(3), "when": pd.Timestamp("2024-01-01 10:00"), "n": None}
+    )
+    assert isinstance(payload, bytes)
+    decoded = json.loads(payload)
+    assert int(decoded["rows"]) == 3
+    assert decoded["when"] == "2024-01-01 10:00:00"
+    assert decoded["n"] is None
+
+
+def test_loads_json_accepts_bytes_text_and_nan():
+    from messaging.serialization import dumps_json, loads_json
+
+    envelope = {"batch_info": {"rows": 2}, "data": [{"x": 1}, {"x": None}]}
+    assert loads_json(dumps_json(envelope)) == envelope
+    assert loads_json(dumps_json(envelope).decode("utf-8")) == envelope
+
+    # Bodies from producers without orjson may contain NaN tokens
+    decoded = loads_json(b'{"x": NaN}')
+    assert decoded["x"] != decoded["x"]
+
+    assert loads_json(memoryview(dumps_json(envelope))) == envelope
+    decoded = loads_json(memoryview(b'{"x": NaN}'))
+    assert decoded["x"] != decoded["x"]
+
+
+def test_json_envelope_columns_orient_matches_records():
+    from messaging.serialization import dataframe_to_json_envelope, loads_json
+
+    df = pd.DataFrame(
+        {
+            "x": [1, 2],
+            "f": [1.5, float("nan")],
+            "s": ["a", None],
+            "t": pd.to_datetime(["2024-01-01", "2024-01-02"]),
+            "n": pd.array([1, None], dtype="Int64"),
+            "b": pd.array([True, None], dtype="boolean"),
+        }
+    )
+    records = loads_json(dataframe_to_json_envelope(df, {"batch_index": 1}))
+    columns = loads_json(dataframe_to_json_envelope(df, {"batch_index": 1}, "columns"))
+
+    assert records["metadata"]["orient"] == "records"
+    assert columns["metadata"]["orient"] == "columns"
+    assert columns["batch_info"] == records["batch_info"]
+    rebuilt = [
+        dict(zip(columns["data"], row, strict=True))
+        for row in zip(*columns["data"].values(), strict=True)
+    ]
+    assert rebuilt == records["data"]
+    # Nullable columns keep their integer/bool values and send NA as null
+    assert columns["data"]["n"] == [1, None]
+    assert columns["data"]["b"] == [True, None]
+
+
+def test_dataframe_to_records_matches_to_dict():
+    from messaging.serialization import dataframe_to_records
+
+    frames = [
+        pd.DataFrame(
+            {
+                "i": [1, 2],
+                "f": [1.5, float("nan")],
+                "s": ["a", None],
+                "b": [True, False],
+                "t": pd.to_datetime(["2024-01-01", None]),
+            }
+        ),
+        pd.DataFrame({"n": pd.array([1, None], dtype="Int64")}),
+        pd.DataFrame(index=range(2)),
+    ]
+    for df in frames:
+        # repr, since NaN and NaT never compare equal
+        assert repr(dataframe_to_records(df)) == repr(df.to_dict(orient="records"))
+
+
+def test_dtype_str_matches_str_and_is_cached():
+    import numpy as np
+
+    from messaging.serialization import dtype_str
+
+    dtype_str.cache_clear()
+    for dtype in (np.dtype("int64"), np.dtype("<M8[ns]"), pd.CategoricalDtype(["a"])):
+        assert dtype_str(dtype) == str(dtype)
+    assert dtype_str(np.dtype("int64")) == "int64"
+    assert dtype_str.cache_info().hits == 1
+
+
+def test_json_envelope_reuses_schema_metadata():
+    from messaging.serialization import (
+        _schema_fragment,
+        dataframe_to_json_envelope,
+        loads_json,
+    )
+
+    _schema_fragment.cache_clear()
+    first = loads_json(
+        dataframe_to_json_envelope(pd.DataFrame({"x": [1, 2], "s": ["a", "b"]}))
+    )
+    second = loads_json(
+        dataframe_to_json_envelope(pd.DataFrame({"x": [3], "s": ["c"]}))
+    )
+
+    assert _schema_fragment.cache_info().hits == 1
+    assert first["metadata"] == {
+        "rows": 2,
+        "columns": ["x", "s"],
+        "dtypes": {"x": "int64", "s": "object"},
+        "orient": "records",
+    }
+    assert second["metadata"]["rows"] == 1
+    assert second["data"] == [{"x": 3, "s": "c"}]
+
+
+def test_stream_writer_passes_json_orient(monkeypatch):
+    sent = []
+
+    class OrientProducer(DummyProducer):
+        def send_dataframe(self, df, batch_info=None, orient="records"):
+            sent.append(orient)
+
+    class Factory:
+        @staticmethod
+        def create_from_config(_cfg):
+            return OrientProducer()
+
+    monkeypatch.setattr("messaging.factory.QueueFactory", Factory, raising=True)
+
+    cfg = {
+        "amqp": {"host": "x", "port": 5672, "queue": "cols", "json_orient": "columns"}
+    }
+    writer = StreamWriter(cfg)
+    writer.write(pd.DataFrame({"x": [1]}))
+    writer.finalize()
+    assert sent == ["columns"]
+
+    with pytest.raises(ValueError):
+        StreamWriter(
+            {"amqp": {"host": "x", "port": 5672, "queue": "q", "json_orient": "rows"}}
+        )
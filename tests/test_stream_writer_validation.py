@@ -1,3 +1,4 @@
+import pandas as pd
 import pytest
 
 from core.writers.stream_writer import StreamWriter
@@ -15,6 +16,13 @@ def test_stream_writer_missing_url_and_host_port_raises():
         StreamWriter(cfg)
 
 
+def test_stream_writer_null_host_or_queue_raises():
+    with pytest.raises(ValueError):
+        StreamWriter({"amqp": {"host": None, "port": 5672, "queue": "q"}})
+    with pytest.raises(ValueError):
+        StreamWriter({"amqp": {"host": "x", "port": 5672, "queue": None}})
+
+
 class _FailingProducer:
     def __init__(self):
         pass
@@ -38,11 +46,38 @@ class _FailingFactory:
 def test_stream_writer_producer_failures(monkeypatch):
     # Patch factory to a failing producer
     monkeypatch.setattr(
-        "core.writers.stream_writer.QueueFactory", _FailingFactory, raising=True
+        "messaging.factory.QueueFactory", _FailingFactory, raising=True
     )
 
     cfg = {"amqp": {"host": "x", "port": 5672, "queue": "q"}}
 
-    with pytest.raises(Exception):
-        StreamWriter(cfg)  # connect fails
+    # Connection is deferred until the first write
+    writer = StreamWriter(cfg)
+    with pytest.raises(RuntimeError):
+        writer.write(pd.DataFrame({"x": [1]}))  # connect fails
+
+
+def test_stream_writer_finalize_without_writes_skips_producer(monkeypatch):
+    monkeypatch.setattr(
+        "messaging.factory.QueueFactory", _FailingFactory, raising=True
+    )
+
+    writer = StreamWriter({"amqp": {"host": "x", "port": 5672, "queue": "q"}})
+    summary = writer.finalize()
+    assert summary["total_batches_sent"] == 0
+    assert writer.queue_producer is None
+
+
+
+def test_stream_writer_validation_is_computed_once_per_config():
+    writer = StreamWriter({"type": "AMQP", "url": "amqp://h:5672", "queue": "q"})
+    assert writer.queue_meta["queue_type"] == "amqp"
+    assert writer.queue_meta["host"] == "amqp://h:5672"
+
+    normalized = writer.normalized_queue_config
+    assert writer.validate_config() is True
+    assert writer.normalized_queue_config is normalized
 
+    writer.config = {"kafka": {"host": "k", "port": 9092, "queue": "t"}}
+    writer.validate_config()
+    assert writer.queue_meta["queue_type"] == "kafka"
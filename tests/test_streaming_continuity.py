@@ -39,7 +39,7 @@ class DummyProducer:
 
 def test_streaming_series_continuity(monkeypatch, tmp_path):
     # Monkeypatch QueueFactory to use DummyProducer
-    from core.writers import stream_writer as sw
+    from messaging import factory as queue_factory
 
     dummy_producer = DummyProducer()
 
@@ -48,7 +48,7 @@ def test_streaming_series_continuity(monkeypatch, tmp_path):
         def create_from_config(cls, cfg):
             return dummy_producer
 
-    monkeypatch.setattr(sw, "QueueFactory", DummyQueueFactory)
+    monkeypatch.setattr(queue_factory, "QueueFactory", DummyQueueFactory)
 
     # Main generator config (validates file_writer but it won't be used)
     main_cfg = {
@@ -52,3 +52,34 @@ def test_batch_writer_delegates_and_increments_batches(tmp_path):
     # inner files created
     assert os.path.exists(os.path.join(str(tmp_path), "out_1.csv"))
     assert os.path.exists(os.path.join(str(tmp_path), "out_2.csv"))
+
+
+def test_writer_default_params_shared_and_read_only(tmp_path):
+    a = CsvFileWriter({"output_path": str(tmp_path / "a.csv")})
+    b = CsvFileWriter({"output_path": str(tmp_path / "b.csv")})
+    assert a.get_default_params() is b.get_default_params()
+    with pytest.raises(TypeError):
+        a.get_default_params()["index"] = True
+
+
+def test_write_result_file_info_describes_written_file(tmp_path):
+    writer = CsvFileWriter({"output_path": str(tmp_path / "out_{batch_index}.csv")})
+    res = writer.write(pd.DataFrame({"a": [1, 2]}), {"batch_index": 3})
+    assert res["file_info"]["output_path"] == res["output_path"]
+    assert res["file_info"]["exists"] is True
+    assert res["file_info"]["size_bytes"] > 0
+
+
+def test_writer_params_do_not_carry_writer_settings(tmp_path):
+    writer = CsvFileWriter({"output_path": str(tmp_path / "a.csv")})
+    assert writer.params == {"output_path": str(tmp_path / "a.csv")}
+    assert writer.writer_kind == "csv"
+    assert writer.pandas_method == "to_csv"
+
+
+def test_writer_loggers_are_bound_per_class(tmp_path):
+    first = CsvFileWriter({"output_path": str(tmp_path / "a.csv")})
+    second = CsvFileWriter({"output_path": str(tmp_path / "b.csv")})
+    assert first.logger is second.logger is CsvFileWriter.logger
+    assert CsvFileWriter.logger.name == "genxdata.csvfilewriter"
+    assert BatchWriter.logger.name == "genxdata.batch_writer"
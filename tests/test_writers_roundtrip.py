@@ -1,6 +1,7 @@
 import os
 import sqlite3
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -120,3 +121,116 @@ def test_sqlite_writer_roundtrip(tmp_path, sample_df):
     finally:
         conn.close()
     _assert_equal_df(sample_df.sort_values(["id"]).reset_index(drop=True), df)
+
+
+def test_json_writer_orjson_matches_pandas_output(tmp_path):
+    pytest.importorskip("orjson")
+    import json
+
+    df = pd.DataFrame(
+        {
+            "i": [1, 2],
+            "f": [0.1234567890123, float("nan")],
+            "f32": np.array([0.1, 2.5], dtype=np.float32),
+            "s": ["x", None],
+            "d": pd.to_datetime(["2025-01-01 10:00:00.123456", None]),
+            "b": [True, False],
+        }
+    )
+    out_path = os.path.join(str(tmp_path), "fast.json")
+    res = FileWriterFactory().create_writer("json", {"output_path": out_path}).write(df)
+    assert res["serializer"] == "orjson"
+
+    expected = json.loads(df.to_json(orient="records", date_format="iso"))
+    with open(out_path, encoding="utf-8") as f:
+        assert json.load(f) == expected
+
+
+def test_json_writer_non_record_orient_uses_pandas(tmp_path, sample_df):
+    out_path = os.path.join(str(tmp_path), "cols.json")
+    writer = FileWriterFactory().create_writer(
+        "json", {"output_path": out_path, "orient": "columns"}
+    )
+    res = writer.write(sample_df)
+    assert res["serializer"] == "pandas"
+    _assert_equal_df(sample_df, pd.read_json(out_path, orient="columns"))
+
+
+def test_sqlite_writer_matches_to_sql_storage(tmp_path):
+    df = pd.DataFrame(
+        {
+            "d": pd.to_datetime(
+                ["2025-01-01 10:00:00", "2025-01-01 10:00:00.500000", None],
+                format="ISO8601",
+            ),
+            "f": [1.0, float("nan"), 2.0],
+            "b": [True, False, True],
+            "s": ["a", None, "c"],
+        }
+    )
+    out_path = os.path.join(str(tmp_path), "fast.db")
+    writer = FileWriterFactory().create_writer("sqlite", {"output_path": out_path})
+    assert writer.write(df)["status"] == "success"
+
+    ref = sqlite3.connect(":memory:")
+    conn = sqlite3.connect(out_path)
+    try:
+        df.to_sql("data", ref, index=False)
+        query = "SELECT * FROM data"
+        assert conn.execute(query).fetchall() == ref.execute(query).fetchall()
+    finally:
+        conn.close()
+        ref.close()
+
+
+def test_sqlite_writer_append_and_fail_modes(tmp_path, sample_df):
+    out_path = os.path.join(str(tmp_path), "modes.db")
+    fac = FileWriterFactory()
+    appender = fac.create_writer(
+        "sqlite", {"output_path": out_path, "if_exists": "append"}
+    )
+    appender.write(sample_df)
+    appender.write(sample_df)
+
+    conn = sqlite3.connect(out_path)
+    try:
+        count = conn.execute("SELECT COUNT(*) FROM data").fetchone()[0]
+    finally:
+        conn.close()
+    assert count == 2 * len(sample_df)
+
+    failer = fac.create_writer("sqlite", {"output_path": out_path, "if_exists": "fail"})
+    assert failer.write(sample_df)["status"] == "error"
+
+
+@pytest.mark.parametrize("render_links", [True, False])
+def test_html_writer_render_links_reaches_to_html(tmp_path, render_links):
+    out_path = os.path.join(str(tmp_path), "links.html")
+    writer = FileWriterFactory().create_writer(
+        "html", {"output_path": out_path, "render_links": render_links}
+    )
+    assert (
+        writer.write(pd.DataFrame({"url": ["https://example.org"]}))["status"]
+        == "success"
+    )
+    with open(out_path, encoding="utf-8") as f:
+        assert ('href="https://example.org"' in f.read()) is render_links
+
+
+def test_sqlite_writer_append_reuses_verified_schema(tmp_path, sample_df):
+    out_path = os.path.join(str(tmp_path), "append.db")
+    writer = FileWriterFactory().create_writer(
+        "sqlite", {"output_path": out_path, "if_exists": "append"}
+    )
+    writer.write(sample_df)
+    assert len(writer._verified_tables) == 1
+    # Columns in a different order are still inserted by name
+    writer.write(sample_df[["value", "id"]])
+    assert len(writer._verified_tables) == 2
+
+    conn = sqlite3.connect(out_path)
+    try:
+        df = pd.read_sql_query("SELECT id, value FROM data", conn)
+    finally:
+        conn.close()
+    _assert_equal_df(pd.concat([sample_df, sample_df]), df)
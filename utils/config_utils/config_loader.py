@@ -5,8 +5,7 @@ Configuration loading utilities for GenXData.
 import os
 from pathlib import Path
 
-from exceptions.invalid_config_format_exception import InvalidConfigFormatException
-from exceptions.invalid_config_path_exception import InvalidConfigPathException
+from exceptions import InvalidConfigFormatException, InvalidConfigPathException
 from utils.json_loader import read_json
 from utils.yaml_loader import read_yaml
 
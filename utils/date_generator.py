@@ -1,15 +1,82 @@
 """
 Date generation utilities.
 
-Provides helper to generate a random date between two datetime objects and
-format it as a string.
+Provides helpers to format batches of day offsets from a start date, or of
+seconds since midnight, as strings.
 """
 
-import random
-from datetime import timedelta
+from datetime import datetime, time, timedelta
 
+import numpy as np
 
-def generate_random_date(start_date, end_date, output_format):
-    delta = end_date - start_date
-    random_date = start_date + timedelta(days=random.randint(0, delta.days))
-    return random_date.strftime(output_format)
+# Output formats numpy can render directly, mapped to datetime_as_string units
+_FAST_FORMATS = {"%Y-%m-%d": "D", "%Y-%m-%dT%H:%M:%S": "s"}
+
+# Time-of-day format cut out of numpy's ISO second-resolution strings
+_FAST_TIME_FORMAT = "%H:%M:%S"
+
+
+def format_day_offsets(
+    start: datetime, offsets: np.ndarray, output_format: str
+) -> np.ndarray:
+    """
+    Format ``start + offsets`` days as strings.
+
+    Each distinct day is formatted once. ISO formats listed in
+    ``_FAST_FORMATS`` are rendered by ``np.datetime_as_string``; any other
+    format uses ``datetime.strftime``.
+
+    Args:
+        start: Date the offsets count from
+        offsets: Integer day offsets
+        output_format: strftime format for the output
+
+    Returns:
+        np.ndarray: Object array of formatted dates, aligned with ``offsets``
+    """
+    days, positions = np.unique(offsets, return_inverse=True)
+
+    unit = _FAST_FORMATS.get(output_format)
+    # numpy pads years below 1000 and cannot represent aware datetimes
+    if unit is not None and start.tzinfo is None and start.year >= 1000:
+        stamps = np.datetime64(start, "s") + days.astype("timedelta64[D]")
+        labels = np.datetime_as_string(stamps, unit=unit).astype(object)
+    else:
+        labels = np.array(
+            [
+                (start + timedelta(days=int(day))).strftime(output_format)
+                for day in days
+            ],
+            dtype=object,
+        )
+    return labels[positions]
+
+
+def format_second_offsets(seconds: np.ndarray, output_format: str) -> np.ndarray:
+    """
+    Format seconds since midnight as time-of-day strings.
+
+    Each distinct second is formatted once. ``_FAST_TIME_FORMAT`` is cut from
+    ``np.datetime_as_string`` output; any other format uses ``time.strftime``.
+
+    Args:
+        seconds: Integer seconds since midnight (0 to 86399)
+        output_format: strftime format for the output
+
+    Returns:
+        np.ndarray: Object array of formatted times, aligned with ``seconds``
+    """
+    secs, positions = np.unique(seconds, return_inverse=True)
+
+    if output_format == _FAST_TIME_FORMAT:
+        stamps = np.datetime_as_string(secs.astype("datetime64[s]"), unit="s")
+        labels = np.strings.slice(stamps, 11, 19).astype(object)
+    else:
+        labels = np.array(
+            [
+                time(sec // 3600, sec // 60 % 60, sec % 60).strftime(output_format)
+                for sec in secs.tolist()
+            ],
+            dtype=object,
+        )
+    return labels[positions]
@@ -16,7 +16,7 @@ from typing import Any
 
 import yaml
 
-from exceptions.param_exceptions import InvalidConfigParamException
+from exceptions import InvalidConfigParamException
 
 
 def load_all_generators() -> dict[str, dict[str, Any]]: